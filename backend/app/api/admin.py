@@ -0,0 +1,120 @@
+"""Admin endpoints for working with every user's CV at once."""
+import tempfile
+from typing import IO, Iterator, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from ..services.cv_bulk import BULK_FORMATS, stream_cv_archive
+from ..services.cv_dump import iter_cv_data, ndjson_lines
+from ..services.cv_import import iter_import_cvs, progress_lines
+from ..services.exporters import encode_chunks
+from .dependencies import Principal, get_current_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/cv/export.zip")
+def export_cv_archive(
+    format: str = "pdf",
+    user_id: Optional[List[int]] = Query(None),
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """
+    Export the CVs of many users as one ZIP archive.
+
+    Covers every active user with a profile, or only those given as
+    repeated ``user_id`` parameters. The archive is streamed while the
+    CVs are rendered, one file per user in the requested format.
+
+    Args:
+        format: pdf, or any format of GET /cv/export/{format}
+        user_id: Users to export; all active users when omitted
+        current_admin: Authenticated admin
+    """
+    if format not in BULK_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown export format. Available: {', '.join(BULK_FORMATS)}",
+        )
+
+    return StreamingResponse(
+        stream_cv_archive(iter_cv_data(user_id, active_only=True), format),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="cvs_{format}.zip"'},
+    )
+
+
+@router.get("/cv/export.ndjson")
+def export_cv_ndjson(
+    user_id: Optional[List[int]] = Query(None),
+    active_only: bool = False,
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """
+    Dump CV data as newline-delimited JSON, one line per profile.
+
+    Each line holds the user id and the CV data as served by /cv/data.
+    Lines are streamed as profiles are read, in profile id order.
+
+    Args:
+        user_id: Users to dump; every user when omitted
+        active_only: Skip deactivated users
+        current_admin: Authenticated admin
+    """
+    return StreamingResponse(
+        encode_chunks(ndjson_lines(iter_cv_data(user_id, active_only=active_only))),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="cvs.ndjson"'},
+    )
+
+
+def _import_progress(upload: IO[bytes], start: int) -> Iterator[bytes]:
+    with upload:
+        yield from progress_lines(iter_import_cvs(upload, start), start)
+
+
+@router.post("/cv/import.ndjson")
+async def import_cv_ndjson(
+    request: Request,
+    start: int = Query(0, ge=0),
+    current_admin: Principal = Depends(get_current_admin),
+):
+    """
+    Create users with their CVs from newline-delimited JSON.
+
+    The body holds one CV per line, in the format of GET
+    /admin/cv/export.ndjson, optionally with ``account_email`` and a
+    bcrypt ``hashed_password``. Accounts without a password must reset it
+    before signing in. Lines are committed in batches; existing accounts
+    are skipped and invalid lines are reported without stopping the
+    import.
+
+    The response is NDJSON streamed as the import runs: a line per
+    committed batch with the running counts, its ``checkpoint`` and that
+    batch's errors, then the final result marked ``"done": true``. If the
+    stream ends without it, post the same file again with the last
+    checkpoint received as ``start``.
+
+    Args:
+        request: Request whose body is the NDJSON file
+        start: Lines to skip, the checkpoint of an interrupted import
+        current_admin: Authenticated admin
+    """
+    # Spooled to disk first: the body can be far larger than memory. File
+    # writes block, so they run on the threadpool. The stream owns the file
+    # from here and closes it once the import ends.
+    upload = tempfile.TemporaryFile()
+    try:
+        async for chunk in request.stream():
+            await run_in_threadpool(upload.write, chunk)
+        upload.seek(0)
+    except BaseException:
+        upload.close()
+        raise
+    # A sync iterator, so each batch is imported on the threadpool.
+    return StreamingResponse(
+        _import_progress(upload, start),
+        media_type="application/x-ndjson",
+    )
@@ -0,0 +1,637 @@
+"""Async versions of the auth, profile and CV data endpoints.
+
+Served when DB_ASYNC is enabled. main.py registers this router ahead of
+the sync routers, so these routes shadow their sync counterparts while
+endpoints without an async version keep using the sync routers.
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional, Type
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..core.cache import cv_cache
+from ..core.database import Base, get_async_db
+from ..core.security import (
+    verify_password_async,
+    get_password_hash_async,
+    create_access_token,
+    generate_reset_token,
+)
+from ..models import User, Profile, Education, Experience, Certification, Project, Skills
+from ..schemas import (
+    UserCreate,
+    UserLogin,
+    Token,
+    PasswordResetRequest,
+    PasswordReset,
+    Message,
+    ProfileCreate,
+    ProfileUpdate,
+    ProfilePatch,
+    ProfileResponse,
+    EducationCreate,
+    EducationResponse,
+    ExperienceCreate,
+    ExperienceResponse,
+    CertificationCreate,
+    CertificationResponse,
+    ProjectCreate,
+    ProjectResponse,
+    SkillsCreate,
+    SkillsResponse,
+    EducationPatch,
+    ExperiencePatch,
+    CertificationPatch,
+    ProjectPatch,
+    SkillsPatch,
+    CVData,
+    BatchRequest,
+    BatchResponse,
+)
+from .auth import send_password_reset
+from .batch import apply_batch_async
+from .cv_export import CV_LOAD_OPTIONS, apply_cv_data, serialize_cv
+from .dependencies import (
+    Principal,
+    get_current_user_async,
+    invalidate_principal,
+    require_profile_id,
+)
+from .etags import (
+    etag_matches,
+    etag_matches_strong,
+    has_pending_changes,
+    make_etag,
+    not_modified,
+    profile_version_bump,
+    set_etag,
+    touch_profile,
+)
+
+router = APIRouter()
+
+
+async def get_profile_version(user_id: int, db: AsyncSession) -> Optional[tuple]:
+    """Return (profile id, version) without loading the profile or its sections."""
+    row = (
+        await db.execute(
+            select(Profile.id, Profile.version).where(Profile.user_id == user_id)
+        )
+    ).first()
+    return tuple(row) if row else None
+
+
+async def load_profile(user_id: int, db: AsyncSession) -> Optional[Profile]:
+    """Load a profile with every section eagerly loaded."""
+    return await db.scalar(
+        select(Profile).options(*CV_LOAD_OPTIONS).where(Profile.user_id == user_id)
+    )
+
+
+async def commit_cv_change(user_id: int, profile_id: int, db: AsyncSession) -> None:
+    """Bump the profile version, commit and drop the cached CV snapshot."""
+    if (await db.execute(profile_version_bump(profile_id))).rowcount == 0:
+        # The cached principal outlived its profile (deleted elsewhere).
+        await db.rollback()
+        invalidate_principal(user_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found. Please create a profile first.",
+        )
+    await db.commit()
+    cv_cache.invalidate(user_id)
+
+
+# ===== AUTH ENDPOINTS =====
+@router.post(
+    "/auth/signup",
+    response_model=Token,
+    status_code=status.HTTP_201_CREATED,
+    tags=["authentication"],
+)
+async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    """Register a new user."""
+    existing_user = await db.scalar(select(User.id).where(User.email == user_data.email))
+    if existing_user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered",
+        )
+
+    # Release the connection while the password is hashed
+    await db.close()
+    hashed_password = await get_password_hash_async(user_data.password)
+    new_user = User(email=user_data.email, hashed_password=hashed_password)
+    db.add(new_user)
+    await db.commit()
+
+    access_token = create_access_token(data={"sub": str(new_user.id)})
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@router.post("/auth/login", response_model=Token, tags=["authentication"])
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    """Authenticate user and return token."""
+    user = await db.scalar(select(User).where(User.email == user_data.email))
+    # Release the connection while the password is checked
+    await db.close()
+    if not user or not await verify_password_async(
+        user_data.password, user.hashed_password
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+        )
+
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user",
+        )
+
+    access_token = create_access_token(data={"sub": str(user.id)})
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@router.post("/auth/password-reset-request", response_model=Message, tags=["authentication"])
+async def request_password_reset(
+    request: PasswordResetRequest, db: AsyncSession = Depends(get_async_db)
+):
+    """Request a password reset token."""
+    user = await db.scalar(select(User).where(User.email == request.email))
+    if user:
+        user.reset_token = generate_reset_token()
+        user.reset_token_expires = datetime.utcnow() + timedelta(hours=1)
+        await db.commit()
+        send_password_reset(user)
+
+    return {"message": "If your email is registered, you will receive a password reset link."}
+
+
+@router.post("/auth/password-reset", response_model=Message, tags=["authentication"])
+async def reset_password(reset_data: PasswordReset, db: AsyncSession = Depends(get_async_db)):
+    """Reset password using the provided token."""
+    user = await db.scalar(select(User).where(User.reset_token == reset_data.token))
+    if (
+        not user
+        or not user.reset_token_expires
+        or user.reset_token_expires < datetime.utcnow()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired reset token",
+        )
+
+    # Release the connection while the password is hashed
+    await db.close()
+    user.hashed_password = await get_password_hash_async(reset_data.new_password)
+    user.reset_token = None
+    user.reset_token_expires = None
+    db.add(user)
+    await db.commit()
+
+    return {"message": "Password successfully reset. You can now login with your new password."}
+
+
+# ===== PROFILE ENDPOINTS =====
+@router.get("/profile", response_model=ProfileResponse, tags=["profile"])
+async def get_profile(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get current user's profile."""
+    current = await get_profile_version(current_user.id, db)
+    if current and etag_matches(if_none_match, make_etag(*current)):
+        return not_modified(make_etag(*current))
+
+    profile = await load_profile(current_user.id, db)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found",
+        )
+    set_etag(response, make_etag(profile.id, profile.version))
+    return profile
+
+
+@router.post(
+    "/profile",
+    response_model=ProfileResponse,
+    status_code=status.HTTP_201_CREATED,
+    tags=["profile"],
+)
+async def create_profile(
+    profile_data: ProfileCreate,
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Create user profile."""
+    if await get_profile_version(current_user.id, db):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Profile already exists",
+        )
+
+    new_profile = Profile(
+        **profile_data.model_dump(),
+        user_id=current_user.id,
+        education=[],
+        experience=[],
+        certifications=[],
+        projects=[],
+        skills=None,
+    )
+    db.add(new_profile)
+    await db.flush()
+    result = ProfileResponse.model_validate(new_profile)
+    await db.commit()
+    cv_cache.invalidate(current_user.id)
+    invalidate_principal(current_user.id)
+    return result
+
+
+@router.put("/profile", response_model=ProfileResponse, tags=["profile"])
+async def update_profile(
+    profile_data: ProfileUpdate,
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Update user profile."""
+    profile = await load_profile(current_user.id, db)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found",
+        )
+
+    for field, value in profile_data.model_dump().items():
+        setattr(profile, field, value)
+
+    result = ProfileResponse.model_validate(profile)
+    await commit_cv_change(current_user.id, profile.id, db)
+    return result
+
+
+@router.patch("/profile", response_model=ProfileResponse, tags=["profile"])
+async def patch_profile(
+    profile_data: ProfilePatch,
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Update only the given profile fields."""
+    profile = await load_profile(current_user.id, db)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found",
+        )
+
+    for field, value in profile_data.model_dump(exclude_unset=True).items():
+        setattr(profile, field, value)
+
+    result = ProfileResponse.model_validate(profile)
+    if has_pending_changes(db.sync_session):
+        await commit_cv_change(current_user.id, profile.id, db)
+    return result
+
+
+@router.delete("/profile", status_code=status.HTTP_204_NO_CONTENT, tags=["profile"])
+async def delete_profile(
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Delete user profile and all associated data."""
+    profile = await load_profile(current_user.id, db)
+    if profile:
+        await db.delete(profile)
+        await db.commit()
+        cv_cache.invalidate(current_user.id)
+        invalidate_principal(current_user.id)
+    return None
+
+
+# ===== SECTION ENDPOINTS =====
+def add_section_routes(
+    path: str,
+    model: Type[Base],
+    create_schema: Type[BaseModel],
+    patch_schema: Type[BaseModel],
+    response_schema: Type[BaseModel],
+    not_found_detail: str,
+) -> None:
+    """Register list/create/update/patch/delete/batch routes for a profile section."""
+
+    async def get_item(item_id: int, profile_id: int, db: AsyncSession):
+        return await db.scalar(
+            select(model).where(model.id == item_id, model.profile_id == profile_id)
+        )
+
+    async def list_items(
+        current_user: Principal = Depends(get_current_user_async),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        profile_id = require_profile_id(current_user)
+        items = await db.scalars(
+            select(model).where(model.profile_id == profile_id).order_by(model.id)
+        )
+        return items.all()
+
+    async def create_item(
+        item_data: create_schema,
+        current_user: Principal = Depends(get_current_user_async),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        profile_id = require_profile_id(current_user)
+        item = model(**item_data.model_dump(), profile_id=profile_id)
+        db.add(item)
+        await db.flush()
+        result = response_schema.model_validate(item)
+        await commit_cv_change(current_user.id, profile_id, db)
+        return result
+
+    async def update_item(
+        item_id: int,
+        item_data: create_schema,
+        current_user: Principal = Depends(get_current_user_async),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        profile_id = require_profile_id(current_user)
+        item = await get_item(item_id, profile_id, db)
+        if not item:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=not_found_detail,
+            )
+
+        for field, value in item_data.model_dump().items():
+            setattr(item, field, value)
+
+        result = response_schema.model_validate(item)
+        await commit_cv_change(current_user.id, profile_id, db)
+        return result
+
+    async def patch_item(
+        item_id: int,
+        item_data: patch_schema,
+        current_user: Principal = Depends(get_current_user_async),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        profile_id = require_profile_id(current_user)
+        item = await get_item(item_id, profile_id, db)
+        if not item:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=not_found_detail,
+            )
+
+        for field, value in item_data.model_dump(exclude_unset=True).items():
+            setattr(item, field, value)
+
+        result = response_schema.model_validate(item)
+        if has_pending_changes(db.sync_session):
+            await commit_cv_change(current_user.id, profile_id, db)
+        return result
+
+    async def delete_item(
+        item_id: int,
+        current_user: Principal = Depends(get_current_user_async),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        profile_id = require_profile_id(current_user)
+        item = await get_item(item_id, profile_id, db)
+        if item:
+            await db.delete(item)
+            await commit_cv_change(current_user.id, profile_id, db)
+        return None
+
+    async def batch_items(
+        batch: BatchRequest[create_schema],
+        current_user: Principal = Depends(get_current_user_async),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        profile_id = require_profile_id(current_user)
+        plan = await apply_batch_async(model, batch.operations, profile_id, db)
+        if plan.changed:
+            await commit_cv_change(current_user.id, profile_id, db)
+        return {"results": plan.results(response_schema)}
+
+    tags = ["cv-data"]
+    router.add_api_route(
+        f"/{path}", list_items, methods=["GET"],
+        response_model=List[response_schema], tags=tags, name=f"list_{path}",
+    )
+    router.add_api_route(
+        f"/{path}", create_item, methods=["POST"], response_model=response_schema,
+        status_code=status.HTTP_201_CREATED, tags=tags, name=f"create_{path}",
+    )
+    router.add_api_route(
+        f"/{path}/{{item_id}}", update_item, methods=["PUT"],
+        response_model=response_schema, tags=tags, name=f"update_{path}",
+    )
+    router.add_api_route(
+        f"/{path}/{{item_id}}", patch_item, methods=["PATCH"],
+        response_model=response_schema, tags=tags, name=f"patch_{path}",
+    )
+    router.add_api_route(
+        f"/{path}/{{item_id}}", delete_item, methods=["DELETE"],
+        status_code=status.HTTP_204_NO_CONTENT, tags=tags, name=f"delete_{path}",
+    )
+    router.add_api_route(
+        f"/{path}:batch", batch_items, methods=["POST"],
+        response_model=BatchResponse[response_schema], tags=tags, name=f"batch_{path}",
+    )
+
+
+add_section_routes(
+    "education", Education, EducationCreate, EducationPatch, EducationResponse,
+    "Education entry not found",
+)
+add_section_routes(
+    "experience", Experience, ExperienceCreate, ExperiencePatch, ExperienceResponse,
+    "Experience entry not found",
+)
+add_section_routes(
+    "certifications", Certification, CertificationCreate, CertificationPatch,
+    CertificationResponse,
+    "Certification not found",
+)
+add_section_routes(
+    "projects", Project, ProjectCreate, ProjectPatch, ProjectResponse,
+    "Project not found",
+)
+
+
+# ===== SKILLS ENDPOINTS =====
+async def get_skills_row(profile_id: int, db: AsyncSession) -> Optional[Skills]:
+    """Helper to get the skills row of a profile."""
+    return await db.scalar(select(Skills).where(Skills.profile_id == profile_id))
+
+
+@router.get("/skills", response_model=SkillsResponse, tags=["cv-data"])
+async def get_skills(
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get skills."""
+    profile_id = require_profile_id(current_user)
+    skills = await get_skills_row(profile_id, db)
+    if not skills:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Skills not found",
+        )
+    return skills
+
+
+@router.post(
+    "/skills",
+    response_model=SkillsResponse,
+    status_code=status.HTTP_201_CREATED,
+    tags=["cv-data"],
+)
+async def create_skills(
+    skills_data: SkillsCreate,
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Create skills."""
+    profile_id = require_profile_id(current_user)
+    if await get_skills_row(profile_id, db):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Skills already exist. Use PUT to update.",
+        )
+
+    skills = Skills(**skills_data.model_dump(), profile_id=profile_id)
+    db.add(skills)
+    await db.flush()
+    result = SkillsResponse.model_validate(skills)
+    await commit_cv_change(current_user.id, profile_id, db)
+    return result
+
+
+@router.put("/skills", response_model=SkillsResponse, tags=["cv-data"])
+async def update_skills(
+    skills_data: SkillsCreate,
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Update skills, creating them if they don't exist."""
+    profile_id = require_profile_id(current_user)
+    skills = await get_skills_row(profile_id, db)
+    if not skills:
+        skills = Skills(profile_id=profile_id)
+        db.add(skills)
+
+    for field, value in skills_data.model_dump().items():
+        setattr(skills, field, value)
+
+    await db.flush()
+    result = SkillsResponse.model_validate(skills)
+    await commit_cv_change(current_user.id, profile_id, db)
+    return result
+
+
+@router.patch("/skills", response_model=SkillsResponse, tags=["cv-data"])
+async def patch_skills(
+    skills_data: SkillsPatch,
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Update only the given skill categories."""
+    profile_id = require_profile_id(current_user)
+    skills = await get_skills_row(profile_id, db)
+    if not skills:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Skills not found",
+        )
+
+    for field, value in skills_data.model_dump(exclude_unset=True).items():
+        setattr(skills, field, value)
+
+    result = SkillsResponse.model_validate(skills)
+    if has_pending_changes(db.sync_session):
+        await commit_cv_change(current_user.id, profile_id, db)
+    return result
+
+
+@router.delete("/skills", status_code=status.HTTP_204_NO_CONTENT, tags=["cv-data"])
+async def delete_skills(
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Delete skills."""
+    profile_id = require_profile_id(current_user)
+    skills = await get_skills_row(profile_id, db)
+    if skills:
+        await db.delete(skills)
+        await commit_cv_change(current_user.id, profile_id, db)
+    return None
+
+
+# ===== CV DATA ENDPOINTS =====
+@router.get("/cv/data", tags=["cv-data"])
+async def get_cv_data(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get complete CV data in JSON format for frontend rendering and export."""
+    current = await get_profile_version(current_user.id, db)
+    if current and etag_matches(if_none_match, make_etag(*current)):
+        return not_modified(make_etag(*current))
+
+    cached = cv_cache.get(current_user.id)
+    if cached is None or current is None or cached[1] != current[1]:
+        profile = await load_profile(current_user.id, db)
+        if not profile:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Profile not found. Please create a profile first.",
+            )
+        cached = (profile.id, profile.version, serialize_cv(profile))
+        cv_cache.set(current_user.id, cached)
+
+    profile_id, version, cv_data = cached
+    set_etag(response, make_etag(profile_id, version))
+    return cv_data
+
+
+@router.put("/cv/data", tags=["cv-data"])
+async def replace_cv_data(
+    cv_data: CVData,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Replace the whole CV in one transaction, writing only what changed."""
+    profile = await load_profile(current_user.id, db)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found. Please create a profile first.",
+        )
+    if if_match and not etag_matches_strong(if_match, make_etag(profile.id, profile.version)):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="CV was modified since it was loaded",
+        )
+
+    apply_cv_data(profile, cv_data)
+    if has_pending_changes(db.sync_session):
+        touch_profile(profile)
+        await db.flush()
+        await db.refresh(profile, ["version"])
+
+    snapshot = (profile.id, profile.version, serialize_cv(profile))
+    await db.commit()
+    cv_cache.set(current_user.id, snapshot)
+
+    set_etag(response, make_etag(snapshot[0], snapshot[1]))
+    return snapshot[2]
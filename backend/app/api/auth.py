@@ -1,33 +1,67 @@
 """Authentication endpoints."""
+import logging
 from datetime import datetime, timedelta
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from ..core.database import get_db
-from ..core.security import verify_password, get_password_hash, create_access_token, generate_reset_token
+from ..core.security import (
+    create_access_token,
+    generate_reset_token,
+    get_password_hash_async,
+    verify_password_async,
+)
 from ..models import User, Profile
 from ..schemas import UserCreate, UserLogin, Token, PasswordResetRequest, PasswordReset, Message
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
+logger = logging.getLogger(__name__)
+
+# Signup, login and reset await the bcrypt pool instead of blocking a
+# threadpool thread on it; their short database calls still run on the
+# threadpool, and the session is closed while the hash is computed.
+
+
+def _find_user(db: Session, *criteria) -> Optional[User]:
+    return db.query(User).filter(*criteria).first()
+
+
+def _save_user(db: Session, user: User) -> User:
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def send_password_reset(user: User) -> None:
+    """Deliver the user's reset token.
+
+    No mail backend is configured yet, so the request is only logged;
+    the token itself is a credential and never appears in logs.
+    """
+    logger.info("Password reset requested for user %s; email delivery is not configured", user.id)
+
 
 @router.post("/signup", response_model=Token, status_code=status.HTTP_201_CREATED)
-def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user."""
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await run_in_threadpool(_find_user, db, User.email == user_data.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
 
+    # Release the connection while the password is hashed
+    await run_in_threadpool(db.close)
+
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     new_user = User(email=user_data.email, hashed_password=hashed_password)
-
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    new_user = await run_in_threadpool(_save_user, db, new_user)
 
     # Create access token
     access_token = create_access_token(data={"sub": str(new_user.id)})
@@ -36,18 +70,21 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, db: Session = Depends(get_db)):
     """Authenticate user and return token."""
     # Find user
-    user = db.query(User).filter(User.email == user_data.email).first()
+    user = await run_in_threadpool(_find_user, db, User.email == user_data.email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
         )
 
+    # Release the connection while the password is checked
+    await run_in_threadpool(db.close)
+
     # Verify password
-    if not verify_password(user_data.password, user.hashed_password):
+    if not await verify_password_async(user_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -91,19 +128,16 @@ def request_password_reset(request: PasswordResetRequest, db: Session = Depends(
     user.reset_token_expires = reset_token_expires
     db.commit()
 
-    # In a production environment, you would send an email here
-    # For now, we'll just return the token in the response (ONLY FOR DEVELOPMENT)
-    # TODO: Implement email sending in production
-    print(f"Password reset token for {user.email}: {reset_token}")
+    send_password_reset(user)
 
     return {"message": "If your email is registered, you will receive a password reset link."}
 
 
 @router.post("/password-reset", response_model=Message)
-def reset_password(reset_data: PasswordReset, db: Session = Depends(get_db)):
+async def reset_password(reset_data: PasswordReset, db: Session = Depends(get_db)):
     """Reset password using the provided token."""
     # Find user with matching token
-    user = db.query(User).filter(User.reset_token == reset_data.token).first()
+    user = await run_in_threadpool(_find_user, db, User.reset_token == reset_data.token)
 
     if not user:
         raise HTTPException(
@@ -118,10 +152,13 @@ def reset_password(reset_data: PasswordReset, db: Session = Depends(get_db)):
             detail="Invalid or expired reset token",
         )
 
+    # Release the connection while the password is hashed
+    await run_in_threadpool(db.close)
+
     # Update password
-    user.hashed_password = get_password_hash(reset_data.new_password)
+    user.hashed_password = await get_password_hash_async(reset_data.new_password)
     user.reset_token = None
     user.reset_token_expires = None
-    db.commit()
+    await run_in_threadpool(_save_user, db, user)
 
     return {"message": "Password successfully reset. You can now login with your new password."}
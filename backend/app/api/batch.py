@@ -0,0 +1,177 @@
+"""Batched create/update/delete for profile sections.
+
+A batch is applied with at most one statement per kind of write: an
+ownership SELECT for the referenced ids, one multi-row INSERT, one
+executemany UPDATE by primary key and one DELETE ... WHERE id IN (...).
+Callers commit, so the whole batch lands in a single transaction.
+"""
+from typing import Dict, Iterable, List, Sequence, Type
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from ..core.database import Base
+from ..schemas import BatchOperation
+
+# Dialects that cannot tie RETURNING rows to their parameters in one
+# statement; asked to, SQLAlchemy sends an INSERT per row. SQLite gives
+# the rows of one INSERT ascending rowids in VALUES order, so there the
+# ids are returned unordered and sorted instead.
+ROWID_ORDER_DIALECTS = ("sqlite",)
+
+
+class BatchPlan:
+    """Split a batch into per-statement parameters and build its results."""
+
+    def __init__(
+        self, model: Type[Base], operations: Sequence[BatchOperation], profile_id: int
+    ):
+        self.model = model
+        self.operations = operations
+        self.profile_id = profile_id
+
+        seen = set()
+        for operation in operations:
+            if operation.id is None:
+                continue
+            if operation.id in seen:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Entry {operation.id} appears more than once in the batch",
+                )
+            seen.add(operation.id)
+        self.target_ids = list(seen)
+        self.creates = [
+            dict(operation.data.model_dump(), profile_id=profile_id)
+            for operation in operations
+            if operation.op == "create"
+        ]
+
+        # Filled in while the batch is executed.
+        self.existing: Dict[int, dict] = {}
+        self.created_ids: List[int] = []
+
+    def ownership_query(self):
+        """Select the referenced rows that belong to the profile."""
+        table = self.model.__table__
+        return select(table).where(
+            table.c.id.in_(self.target_ids), table.c.profile_id == self.profile_id
+        )
+
+    def insert_statement(self, dialect_name: str):
+        """Multi-row INSERT returning the new ids; see set_created_ids."""
+        if dialect_name in ROWID_ORDER_DIALECTS:
+            return insert(self.model).returning(self.model.id)
+        return insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+
+    def set_created_ids(self, ids: Iterable[int], dialect_name: str) -> None:
+        """Record the ids returned by insert_statement, in parameter order."""
+        ids = list(ids)
+        self.created_ids = sorted(ids) if dialect_name in ROWID_ORDER_DIALECTS else ids
+
+    def update_params(self) -> List[dict]:
+        """Parameters for a bulk UPDATE by primary key of the owned rows."""
+        return [
+            dict(operation.data.model_dump(), id=operation.id)
+            for operation in self.operations
+            if operation.op == "update" and operation.id in self.existing
+        ]
+
+    def delete_ids(self) -> List[int]:
+        """Owned ids to delete."""
+        return [
+            operation.id
+            for operation in self.operations
+            if operation.op == "delete" and operation.id in self.existing
+        ]
+
+    def delete_statement(self, ids: List[int]):
+        """Single DELETE for every id in the batch."""
+        return (
+            delete(self.model)
+            .where(self.model.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+
+    def results(self, response_schema: Type[BaseModel]) -> List[dict]:
+        """Per-operation outcomes, in request order."""
+        created_ids = iter(self.created_ids)
+        results = []
+        for operation in self.operations:
+            result = {"op": operation.op, "id": operation.id}
+            if operation.op == "create":
+                result["id"] = next(created_ids)
+                result["status"] = "created"
+                result["item"] = response_schema.model_validate(
+                    dict(operation.data.model_dump(), id=result["id"])
+                )
+            elif operation.id not in self.existing:
+                result["status"] = "not_found"
+            elif operation.op == "update":
+                result["status"] = "updated"
+                result["item"] = response_schema.model_validate(
+                    dict(self.existing[operation.id], **operation.data.model_dump())
+                )
+            else:
+                result["status"] = "deleted"
+            results.append(result)
+        return results
+
+    @property
+    def changed(self) -> bool:
+        """Whether any operation touched a row."""
+        return bool(self.creates or self.existing)
+
+
+def apply_batch(
+    model: Type[Base],
+    operations: Sequence[BatchOperation],
+    profile_id: int,
+    db: Session,
+) -> BatchPlan:
+    """Apply a batch of section operations without committing."""
+    plan = BatchPlan(model, operations, profile_id)
+    if plan.target_ids:
+        plan.existing = {
+            row.id: dict(row._mapping) for row in db.execute(plan.ownership_query())
+        }
+    if plan.creates:
+        dialect_name = db.get_bind().dialect.name
+        plan.set_created_ids(
+            db.scalars(plan.insert_statement(dialect_name), plan.creates), dialect_name
+        )
+    updates = plan.update_params()
+    if updates:
+        db.execute(update(model), updates)
+    deletes = plan.delete_ids()
+    if deletes:
+        db.execute(plan.delete_statement(deletes))
+    return plan
+
+
+async def apply_batch_async(
+    model: Type[Base],
+    operations: Sequence[BatchOperation],
+    profile_id: int,
+    db: AsyncSession,
+) -> BatchPlan:
+    """Async version of apply_batch."""
+    plan = BatchPlan(model, operations, profile_id)
+    if plan.target_ids:
+        plan.existing = {
+            row.id: dict(row._mapping)
+            for row in await db.execute(plan.ownership_query())
+        }
+    if plan.creates:
+        dialect_name = db.get_bind().dialect.name
+        plan.set_created_ids(
+            await db.scalars(plan.insert_statement(dialect_name), plan.creates), dialect_name
+        )
+    updates = plan.update_params()
+    if updates:
+        await db.execute(update(model), updates)
+    deletes = plan.delete_ids()
+    if deletes:
+        await db.execute(plan.delete_statement(deletes))
+    return plan
@@ -1,9 +1,11 @@
 """CV data management endpoints (experience, education, etc.)."""
-from typing import List
+from typing import List, Optional, Type
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from ..core.database import get_db
-from ..models import User, Profile, Education, Experience, Certification, Project, Skills
+from ..core.cache import cv_cache
+from ..core.database import Base, get_db
+from ..models import Education, Experience, Certification, Project, Skills
 from ..schemas import (
     EducationCreate,
     EducationResponse,
@@ -15,32 +17,114 @@ from ..schemas import (
     ProjectResponse,
     SkillsCreate,
     SkillsResponse,
+    EducationPatch,
+    ExperiencePatch,
+    CertificationPatch,
+    ProjectPatch,
+    SkillsPatch,
+    PatchBase,
+    BatchRequest,
+    BatchResponse,
 )
-from .dependencies import get_current_user
+from .batch import apply_batch
+from .dependencies import (
+    Principal,
+    get_current_user,
+    invalidate_principal,
+    require_profile_id,
+)
+from .etags import has_pending_changes, profile_version_bump
 
 router = APIRouter(tags=["cv-data"])
 
 
-def get_user_profile(user_id: int, db: Session) -> Profile:
-    """Helper to get user profile or raise 404."""
-    profile = db.query(Profile).filter(Profile.user_id == user_id).first()
-    if not profile:
+def list_section(model: Type[Base], profile_id: int, db: Session) -> list:
+    """Helper to list a profile section without loading the profile."""
+    return db.query(model).filter(model.profile_id == profile_id).order_by(model.id).all()
+
+
+def get_skills_row(profile_id: int, db: Session) -> Optional[Skills]:
+    """Helper to get the skills row of a profile."""
+    return db.query(Skills).filter(Skills.profile_id == profile_id).first()
+
+
+def commit_cv_change(user_id: int, profile_id: int, db: Session) -> None:
+    """Bump the profile version, commit and drop the cached CV snapshot."""
+    if db.execute(profile_version_bump(profile_id)).rowcount == 0:
+        # The cached principal outlived its profile (deleted elsewhere).
+        db.rollback()
+        invalidate_principal(user_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found. Please create a profile first.",
         )
-    return profile
+    db.commit()
+    cv_cache.invalidate(user_id)
+
+
+def get_section_item(
+    model: Type[Base], item_id: int, profile_id: int, db: Session, not_found_detail: str
+):
+    """Helper to get a section entry of the profile or raise 404."""
+    item = (
+        db.query(model)
+        .filter(model.id == item_id, model.profile_id == profile_id)
+        .first()
+    )
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=not_found_detail,
+        )
+    return item
+
+
+def commit_patch(
+    item: Base,
+    patch_data: PatchBase,
+    response_schema: Type[BaseModel],
+    user_id: int,
+    profile_id: int,
+    db: Session,
+):
+    """Set only the fields sent and commit if any value actually changed.
+
+    The session then writes just the changed columns, and the response is
+    built from the row in memory instead of refreshing it.
+    """
+    for field, value in patch_data.model_dump(exclude_unset=True).items():
+        setattr(item, field, value)
+
+    result = response_schema.model_validate(item)
+    if has_pending_changes(db):
+        commit_cv_change(user_id, profile_id, db)
+    return result
+
+
+def commit_batch(
+    model: Type[Base],
+    response_schema: Type[BaseModel],
+    batch: BatchRequest,
+    current_user: Principal,
+    db: Session,
+) -> dict:
+    """Apply a section batch in one transaction and report per-item results."""
+    profile_id = require_profile_id(current_user)
+    plan = apply_batch(model, batch.operations, profile_id, db)
+    if plan.changed:
+        commit_cv_change(current_user.id, profile_id, db)
+    return {"results": plan.results(response_schema)}
 
 
 # ===== EDUCATION ENDPOINTS =====
 @router.get("/education", response_model=List[EducationResponse])
 def get_education(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get all education entries."""
-    profile = get_user_profile(current_user.id, db)
-    return profile.education
+    profile_id = require_profile_id(current_user)
+    return list_section(Education, profile_id, db)
 
 
 @router.post(
@@ -48,14 +132,14 @@ def get_education(
 )
 def create_education(
     education_data: EducationCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create education entry."""
-    profile = get_user_profile(current_user.id, db)
-    new_education = Education(**education_data.model_dump(), profile_id=profile.id)
+    profile_id = require_profile_id(current_user)
+    new_education = Education(**education_data.model_dump(), profile_id=profile_id)
     db.add(new_education)
-    db.commit()
+    commit_cv_change(current_user.id, profile_id, db)
     db.refresh(new_education)
     return new_education
 
@@ -64,14 +148,14 @@ def create_education(
 def update_education(
     education_id: int,
     education_data: EducationCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update education entry."""
-    profile = get_user_profile(current_user.id, db)
+    profile_id = require_profile_id(current_user)
     education = (
         db.query(Education)
-        .filter(Education.id == education_id, Education.profile_id == profile.id)
+        .filter(Education.id == education_id, Education.profile_id == profile_id)
         .first()
     )
     if not education:
@@ -83,39 +167,66 @@ def update_education(
     for field, value in education_data.model_dump().items():
         setattr(education, field, value)
 
-    db.commit()
+    commit_cv_change(current_user.id, profile_id, db)
     db.refresh(education)
     return education
 
 
+@router.patch("/education/{education_id}", response_model=EducationResponse)
+def patch_education(
+    education_id: int,
+    education_data: EducationPatch,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Update only the given fields of an education entry."""
+    profile_id = require_profile_id(current_user)
+    education = get_section_item(
+        Education, education_id, profile_id, db, "Education entry not found"
+    )
+    return commit_patch(
+        education, education_data, EducationResponse, current_user.id, profile_id, db
+    )
+
+
 @router.delete("/education/{education_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_education(
     education_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete education entry."""
-    profile = get_user_profile(current_user.id, db)
+    profile_id = require_profile_id(current_user)
     education = (
         db.query(Education)
-        .filter(Education.id == education_id, Education.profile_id == profile.id)
+        .filter(Education.id == education_id, Education.profile_id == profile_id)
         .first()
     )
     if education:
         db.delete(education)
-        db.commit()
+        commit_cv_change(current_user.id, profile_id, db)
     return None
 
 
+@router.post("/education:batch", response_model=BatchResponse[EducationResponse])
+def batch_education(
+    batch: BatchRequest[EducationCreate],
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Create, update and delete several education entries in one transaction."""
+    return commit_batch(Education, EducationResponse, batch, current_user, db)
+
+
 # ===== EXPERIENCE ENDPOINTS =====
 @router.get("/experience", response_model=List[ExperienceResponse])
 def get_experience(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get all experience entries."""
-    profile = get_user_profile(current_user.id, db)
-    return profile.experience
+    profile_id = require_profile_id(current_user)
+    return list_section(Experience, profile_id, db)
 
 
 @router.post(
@@ -123,14 +234,14 @@ def get_experience(
 )
 def create_experience(
     experience_data: ExperienceCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create experience entry."""
-    profile = get_user_profile(current_user.id, db)
-    new_experience = Experience(**experience_data.model_dump(), profile_id=profile.id)
+    profile_id = require_profile_id(current_user)
+    new_experience = Experience(**experience_data.model_dump(), profile_id=profile_id)
     db.add(new_experience)
-    db.commit()
+    commit_cv_change(current_user.id, profile_id, db)
     db.refresh(new_experience)
     return new_experience
 
@@ -139,14 +250,14 @@ def create_experience(
 def update_experience(
     experience_id: int,
     experience_data: ExperienceCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update experience entry."""
-    profile = get_user_profile(current_user.id, db)
+    profile_id = require_profile_id(current_user)
     experience = (
         db.query(Experience)
-        .filter(Experience.id == experience_id, Experience.profile_id == profile.id)
+        .filter(Experience.id == experience_id, Experience.profile_id == profile_id)
         .first()
     )
     if not experience:
@@ -158,39 +269,66 @@ def update_experience(
     for field, value in experience_data.model_dump().items():
         setattr(experience, field, value)
 
-    db.commit()
+    commit_cv_change(current_user.id, profile_id, db)
     db.refresh(experience)
     return experience
 
 
+@router.patch("/experience/{experience_id}", response_model=ExperienceResponse)
+def patch_experience(
+    experience_id: int,
+    experience_data: ExperiencePatch,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Update only the given fields of an experience entry."""
+    profile_id = require_profile_id(current_user)
+    experience = get_section_item(
+        Experience, experience_id, profile_id, db, "Experience entry not found"
+    )
+    return commit_patch(
+        experience, experience_data, ExperienceResponse, current_user.id, profile_id, db
+    )
+
+
 @router.delete("/experience/{experience_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_experience(
     experience_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete experience entry."""
-    profile = get_user_profile(current_user.id, db)
+    profile_id = require_profile_id(current_user)
     experience = (
         db.query(Experience)
-        .filter(Experience.id == experience_id, Experience.profile_id == profile.id)
+        .filter(Experience.id == experience_id, Experience.profile_id == profile_id)
         .first()
     )
     if experience:
         db.delete(experience)
-        db.commit()
+        commit_cv_change(current_user.id, profile_id, db)
     return None
 
 
+@router.post("/experience:batch", response_model=BatchResponse[ExperienceResponse])
+def batch_experience(
+    batch: BatchRequest[ExperienceCreate],
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Create, update and delete several experience entries in one transaction."""
+    return commit_batch(Experience, ExperienceResponse, batch, current_user, db)
+
+
 # ===== CERTIFICATION ENDPOINTS =====
 @router.get("/certifications", response_model=List[CertificationResponse])
 def get_certifications(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get all certifications."""
-    profile = get_user_profile(current_user.id, db)
-    return profile.certifications
+    profile_id = require_profile_id(current_user)
+    return list_section(Certification, profile_id, db)
 
 
 @router.post(
@@ -200,16 +338,16 @@ def get_certifications(
 )
 def create_certification(
     certification_data: CertificationCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create certification."""
-    profile = get_user_profile(current_user.id, db)
+    profile_id = require_profile_id(current_user)
     new_certification = Certification(
-        **certification_data.model_dump(), profile_id=profile.id
+        **certification_data.model_dump(), profile_id=profile_id
     )
     db.add(new_certification)
-    db.commit()
+    commit_cv_change(current_user.id, profile_id, db)
     db.refresh(new_certification)
     return new_certification
 
@@ -218,16 +356,16 @@ def create_certification(
 def update_certification(
     certification_id: int,
     certification_data: CertificationCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update certification."""
-    profile = get_user_profile(current_user.id, db)
+    profile_id = require_profile_id(current_user)
     certification = (
         db.query(Certification)
         .filter(
             Certification.id == certification_id,
-            Certification.profile_id == profile.id,
+            Certification.profile_id == profile_id,
         )
         .first()
     )
@@ -240,44 +378,71 @@ def update_certification(
     for field, value in certification_data.model_dump().items():
         setattr(certification, field, value)
 
-    db.commit()
+    commit_cv_change(current_user.id, profile_id, db)
     db.refresh(certification)
     return certification
 
 
+@router.patch("/certifications/{certification_id}", response_model=CertificationResponse)
+def patch_certification(
+    certification_id: int,
+    certification_data: CertificationPatch,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Update only the given fields of a certification."""
+    profile_id = require_profile_id(current_user)
+    certification = get_section_item(
+        Certification, certification_id, profile_id, db, "Certification not found"
+    )
+    return commit_patch(
+        certification, certification_data, CertificationResponse, current_user.id, profile_id, db
+    )
+
+
 @router.delete(
     "/certifications/{certification_id}", status_code=status.HTTP_204_NO_CONTENT
 )
 def delete_certification(
     certification_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete certification."""
-    profile = get_user_profile(current_user.id, db)
+    profile_id = require_profile_id(current_user)
     certification = (
         db.query(Certification)
         .filter(
             Certification.id == certification_id,
-            Certification.profile_id == profile.id,
+            Certification.profile_id == profile_id,
         )
         .first()
     )
     if certification:
         db.delete(certification)
-        db.commit()
+        commit_cv_change(current_user.id, profile_id, db)
     return None
 
 
+@router.post("/certifications:batch", response_model=BatchResponse[CertificationResponse])
+def batch_certifications(
+    batch: BatchRequest[CertificationCreate],
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Create, update and delete several certifications in one transaction."""
+    return commit_batch(Certification, CertificationResponse, batch, current_user, db)
+
+
 # ===== PROJECT ENDPOINTS =====
 @router.get("/projects", response_model=List[ProjectResponse])
 def get_projects(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get all projects."""
-    profile = get_user_profile(current_user.id, db)
-    return profile.projects
+    profile_id = require_profile_id(current_user)
+    return list_section(Project, profile_id, db)
 
 
 @router.post(
@@ -285,14 +450,14 @@ def get_projects(
 )
 def create_project(
     project_data: ProjectCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create project."""
-    profile = get_user_profile(current_user.id, db)
-    new_project = Project(**project_data.model_dump(), profile_id=profile.id)
+    profile_id = require_profile_id(current_user)
+    new_project = Project(**project_data.model_dump(), profile_id=profile_id)
     db.add(new_project)
-    db.commit()
+    commit_cv_change(current_user.id, profile_id, db)
     db.refresh(new_project)
     return new_project
 
@@ -301,14 +466,14 @@ def create_project(
 def update_project(
     project_id: int,
     project_data: ProjectCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update project."""
-    profile = get_user_profile(current_user.id, db)
+    profile_id = require_profile_id(current_user)
     project = (
         db.query(Project)
-        .filter(Project.id == project_id, Project.profile_id == profile.id)
+        .filter(Project.id == project_id, Project.profile_id == profile_id)
         .first()
     )
     if not project:
@@ -320,44 +485,72 @@ def update_project(
     for field, value in project_data.model_dump().items():
         setattr(project, field, value)
 
-    db.commit()
+    commit_cv_change(current_user.id, profile_id, db)
     db.refresh(project)
     return project
 
 
+@router.patch("/projects/{project_id}", response_model=ProjectResponse)
+def patch_project(
+    project_id: int,
+    project_data: ProjectPatch,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Update only the given fields of a project."""
+    profile_id = require_profile_id(current_user)
+    project = get_section_item(
+        Project, project_id, profile_id, db, "Project not found"
+    )
+    return commit_patch(
+        project, project_data, ProjectResponse, current_user.id, profile_id, db
+    )
+
+
 @router.delete("/projects/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_project(
     project_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete project."""
-    profile = get_user_profile(current_user.id, db)
+    profile_id = require_profile_id(current_user)
     project = (
         db.query(Project)
-        .filter(Project.id == project_id, Project.profile_id == profile.id)
+        .filter(Project.id == project_id, Project.profile_id == profile_id)
         .first()
     )
     if project:
         db.delete(project)
-        db.commit()
+        commit_cv_change(current_user.id, profile_id, db)
     return None
 
 
+@router.post("/projects:batch", response_model=BatchResponse[ProjectResponse])
+def batch_projects(
+    batch: BatchRequest[ProjectCreate],
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Create, update and delete several projects in one transaction."""
+    return commit_batch(Project, ProjectResponse, batch, current_user, db)
+
+
 # ===== SKILLS ENDPOINTS =====
 @router.get("/skills", response_model=SkillsResponse)
 def get_skills(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get skills."""
-    profile = get_user_profile(current_user.id, db)
-    if not profile.skills:
+    profile_id = require_profile_id(current_user)
+    skills = get_skills_row(profile_id, db)
+    if not skills:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Skills not found",
         )
-    return profile.skills
+    return skills
 
 
 @router.post(
@@ -365,22 +558,22 @@ def get_skills(
 )
 def create_skills(
     skills_data: SkillsCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create skills."""
-    profile = get_user_profile(current_user.id, db)
+    profile_id = require_profile_id(current_user)
 
     # Check if skills already exist
-    if profile.skills:
+    if get_skills_row(profile_id, db):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Skills already exist. Use PUT to update.",
         )
 
-    new_skills = Skills(**skills_data.model_dump(), profile_id=profile.id)
+    new_skills = Skills(**skills_data.model_dump(), profile_id=profile_id)
     db.add(new_skills)
-    db.commit()
+    commit_cv_change(current_user.id, profile_id, db)
     db.refresh(new_skills)
     return new_skills
 
@@ -388,37 +581,56 @@ def create_skills(
 @router.put("/skills", response_model=SkillsResponse)
 def update_skills(
     skills_data: SkillsCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update skills."""
-    profile = get_user_profile(current_user.id, db)
+    profile_id = require_profile_id(current_user)
+    skills = get_skills_row(profile_id, db)
 
-    if not profile.skills:
+    if not skills:
         # Create if doesn't exist
-        new_skills = Skills(**skills_data.model_dump(), profile_id=profile.id)
+        new_skills = Skills(**skills_data.model_dump(), profile_id=profile_id)
         db.add(new_skills)
-        db.commit()
+        commit_cv_change(current_user.id, profile_id, db)
         db.refresh(new_skills)
         return new_skills
 
     # Update existing
     for field, value in skills_data.model_dump().items():
-        setattr(profile.skills, field, value)
+        setattr(skills, field, value)
 
-    db.commit()
-    db.refresh(profile.skills)
-    return profile.skills
+    commit_cv_change(current_user.id, profile_id, db)
+    db.refresh(skills)
+    return skills
+
+
+@router.patch("/skills", response_model=SkillsResponse)
+def patch_skills(
+    skills_data: SkillsPatch,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Update only the given skill categories."""
+    profile_id = require_profile_id(current_user)
+    skills = get_skills_row(profile_id, db)
+    if not skills:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Skills not found",
+        )
+    return commit_patch(skills, skills_data, SkillsResponse, current_user.id, profile_id, db)
 
 
 @router.delete("/skills", status_code=status.HTTP_204_NO_CONTENT)
 def delete_skills(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete skills."""
-    profile = get_user_profile(current_user.id, db)
-    if profile.skills:
-        db.delete(profile.skills)
-        db.commit()
+    profile_id = require_profile_id(current_user)
+    skills = get_skills_row(profile_id, db)
+    if skills:
+        db.delete(skills)
+        commit_cv_change(current_user.id, profile_id, db)
     return None
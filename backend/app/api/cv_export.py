@@ -1,37 +1,109 @@
 """CV data endpoints for frontend rendering."""
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import quote
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.orm import Session, joinedload, selectinload
+from ..core.cache import cv_cache
 from ..core.database import get_db
-from ..models import User, Profile
-from .dependencies import get_current_user
+from ..core.workers import PoolSaturated
+from ..models import Profile, Education, Experience, Certification, Project, Skills
+from ..schemas import CVData, JSONResume
+from ..services.cv_layout import get_layout
+from ..services.exporters import EXPORTERS, export_cache
+from ..services.json_resume import RESUME_ADAPTER, from_json_resume, to_json_resume
+from ..services.pdf_renderer import pdf_renderer
+from ..services.render_cache import cv_content_hash
+from .dependencies import Principal, get_current_user
+from .etags import (
+    etag_matches,
+    etag_matches_strong,
+    get_profile_version,
+    has_pending_changes,
+    make_etag,
+    not_modified,
+    set_etag,
+    touch_profile,
+)
 
 router = APIRouter(prefix="/cv", tags=["cv-data"])
 
+# Collections are loaded with one SELECT ... WHERE profile_id IN (...) each,
+# so rows fetched grow with the sum of section sizes rather than their
+# product. Skills is one-to-one and safe to join.
+CV_LOAD_OPTIONS = (
+    selectinload(Profile.education),
+    selectinload(Profile.experience),
+    selectinload(Profile.certifications),
+    selectinload(Profile.projects),
+    joinedload(Profile.skills),
+)
 
-def get_user_cv_data(user: User, db: Session) -> dict:
-    """Get complete CV data for user."""
-    # Eager load all relationships to avoid lazy loading issues
-    profile = (
+# Section collections of Profile and the models they hold, in CV order.
+CV_SECTIONS = (
+    ("education", Education),
+    ("experience", Experience),
+    ("certifications", Certification),
+    ("projects", Project),
+)
+
+
+def load_profile(user_id: int, db: Session) -> Optional[Profile]:
+    """Load a profile with every section ProfileResponse serializes.
+
+    Uses a fixed number of queries regardless of section sizes, so
+    serialization never triggers per-relationship lazy loads.
+    """
+    return (
         db.query(Profile)
-        .options(
-            joinedload(Profile.education),
-            joinedload(Profile.experience),
-            joinedload(Profile.certifications),
-            joinedload(Profile.projects),
-            joinedload(Profile.skills),
-        )
-        .filter(Profile.user_id == user.id)
+        .options(*CV_LOAD_OPTIONS)
+        .filter(Profile.user_id == user_id)
         .first()
     )
 
+
+def get_user_cv_data(user: Principal, db: Session) -> dict:
+    """Get complete CV data for user, served from the snapshot cache while current."""
+    return get_user_cv_snapshot(user, db)[2]
+
+
+def get_user_cv_snapshot(
+    user: Principal, db: Session, version: Optional[int] = None
+) -> Tuple[int, int, dict]:
+    """Get (profile id, version, CV data) for user.
+
+    A cached snapshot is only served while it matches the profile's
+    current version, so edits made through another process show at once.
+    Callers that already read the version pass it as ``version``;
+    otherwise it is looked up with a single-row query.
+    """
+    if version is None:
+        current = get_profile_version(user.id, db)
+        version = current[1] if current else None
+    cached = cv_cache.get(user.id)
+    if cached is not None and version is not None and cached[1] == version:
+        return cached
+
+    # Eager load all relationships to avoid lazy loading issues
+    profile = load_profile(user.id, db)
+
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found. Please create a profile first.",
         )
 
-    # Convert SQLAlchemy models to dictionaries
-    cv_data = {
+    snapshot = (profile.id, profile.version, serialize_cv(profile))
+    cv_cache.set(user.id, snapshot)
+    return snapshot
+
+
+def serialize_cv(profile: Profile) -> dict:
+    """Convert a profile loaded with CV_LOAD_OPTIONS to the CV data dict."""
+    return {
         "profile": {
             "first_name": profile.first_name,
             "last_name": profile.last_name,
@@ -93,14 +165,275 @@ def get_user_cv_data(user: User, db: Session) -> dict:
         ),
     }
 
-    return cv_data
+
+def _unchanged(row, values: dict) -> bool:
+    """Whether a section row already holds ``values`` (a null list reads as [])."""
+    return all(
+        (getattr(row, field) or []) == value if isinstance(value, list) else getattr(row, field) == value
+        for field, value in values.items()
+    )
+
+
+def match_entries(rows: list, entries: List[dict]) -> List[Optional[object]]:
+    """Pair section entries with existing rows so that saving them writes least.
+
+    Sections are read back in id order and new rows get the highest ids,
+    so pairs must keep both orders and inserted entries can only follow
+    the last kept row. Within that, unchanged entries keep their rows and
+    the rest fall back to position: an UPDATE per edited pair, a DELETE
+    per dropped row and an INSERT per extra entry.
+
+    Returns the row kept for each entry, or None where one is inserted.
+    """
+    n, m = len(rows), len(entries)
+    same = [[_unchanged(row, entry) for entry in entries] for row in rows]
+    # writes[i][j]: fewest statements turning rows[i:] into entries[j:]
+    writes = [[0] * (m + 1) for _ in range(n + 1)]
+    for j in range(m + 1):
+        writes[n][j] = m - j
+    for i in range(n - 1, -1, -1):
+        writes[i][m] = n - i
+        for j in range(m - 1, -1, -1):
+            writes[i][j] = min(
+                (not same[i][j]) + writes[i + 1][j + 1],  # keep row i for entry j
+                1 + writes[i + 1][j],  # delete row i
+            )
+
+    matched, i = [], 0
+    for j in range(m):
+        # Skip the rows that are cheaper to delete; ties keep the row.
+        while i < n and writes[i][j] != (not same[i][j]) + writes[i + 1][j + 1]:
+            i += 1
+        matched.append(rows[i] if i < n else None)
+        i += i < n
+    return matched
+
+
+def apply_cv_data(profile: Profile, cv_data: CVData) -> None:
+    """Bring a profile loaded with CV_LOAD_OPTIONS in line with ``cv_data``.
+
+    Section entries are paired with existing rows by match_entries, so
+    unchanged entries produce no writes, even when others around them
+    were added or removed, and edited ones an UPDATE of just the changed
+    columns. The session works out the statements at flush time.
+    """
+    for field, value in cv_data.profile.model_dump().items():
+        setattr(profile, field, value)
+
+    for name, model in CV_SECTIONS:
+        items = [item.model_dump() for item in getattr(cv_data, name)]
+        entries = []
+        for values, entry in zip(items, match_entries(list(getattr(profile, name)), items)):
+            if entry is None:
+                entry = model(**values)
+            elif not _unchanged(entry, values):
+                for field, value in values.items():
+                    setattr(entry, field, value)
+            entries.append(entry)
+        # Rows left out become orphans and are deleted on flush.
+        setattr(profile, name, entries)
+
+    if cv_data.skills is None:
+        profile.skills = None
+    elif profile.skills is None:
+        profile.skills = Skills(**cv_data.skills.model_dump())
+    else:
+        for field, value in cv_data.skills.model_dump().items():
+            setattr(profile.skills, field, value)
 
 
 @router.get("/data")
 def get_cv_data(
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get complete CV data in JSON format for frontend rendering and export."""
-    cv_data = get_user_cv_data(current_user, db)
+    current = get_profile_version(current_user.id, db)
+    if current and etag_matches(if_none_match, make_etag(*current)):
+        return not_modified(make_etag(*current))
+
+    profile_id, version, cv_data = get_user_cv_snapshot(
+        current_user, db, version=current[1] if current else None
+    )
+    set_etag(response, make_etag(profile_id, version))
     return cv_data
+
+
+def save_cv_data(
+    current_user: Principal,
+    db: Session,
+    response: Response,
+    if_match: Optional[str],
+    cv_data: Callable[[Profile], CVData],
+) -> dict:
+    """Replace the user's CV with ``cv_data(profile)`` and return the new CV data.
+
+    Takes a function of the loaded profile so callers can build the new
+    data from the current one. Sets the new ETag on ``response``.
+    """
+    profile = load_profile(current_user.id, db)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found. Please create a profile first.",
+        )
+    if if_match and not etag_matches_strong(if_match, make_etag(profile.id, profile.version)):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="CV was modified since it was loaded",
+        )
+
+    apply_cv_data(profile, cv_data(profile))
+    if has_pending_changes(db):
+        touch_profile(profile)
+        db.flush()
+        db.refresh(profile, ["version"])
+
+    # Serialize before commit expires the loaded sections.
+    snapshot = (profile.id, profile.version, serialize_cv(profile))
+    db.commit()
+    cv_cache.set(current_user.id, snapshot)
+
+    set_etag(response, make_etag(snapshot[0], snapshot[1]))
+    return snapshot[2]
+
+
+@router.put("/data")
+def replace_cv_data(
+    cv_data: CVData,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Replace the whole CV in one transaction, writing only what changed.
+
+    Send If-Match with the ETag of the CV being edited to have the save
+    rejected with 412 if someone else changed it in the meantime.
+    """
+    return save_cv_data(current_user, db, response, if_match, lambda profile: cv_data)
+
+
+async def read_json_resume(request: Request) -> JSONResume:
+    """Validate the raw request body as a JSON Resume document.
+
+    The bytes go straight to the precompiled adapter, skipping the
+    intermediate Python objects of FastAPI's own body parsing.
+    """
+    try:
+        return RESUME_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
+@router.get("/json-resume")
+def get_json_resume(
+    response: Response,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get the CV as a JSON Resume document (https://jsonresume.org/schema)."""
+    profile_id, version, cv_data = get_user_cv_snapshot(current_user, db)
+    set_etag(response, make_etag(profile_id, version))
+    return to_json_resume(cv_data)
+
+
+@router.put("/json-resume")
+def replace_json_resume(
+    response: Response,
+    resume: JSONResume = Depends(read_json_resume),
+    if_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Replace the whole CV with a JSON Resume document, like PUT /cv/data.
+
+    Maps basics, work, education, certificates, projects and skills;
+    other sections are ignored. Returns the CV as a JSON Resume document.
+    """
+
+    def cv_data(profile: Profile) -> CVData:
+        try:
+            return from_json_resume(resume, (profile.first_name, profile.last_name))
+        except ValidationError as e:
+            # Only basics.email is checked again; report it where it was sent.
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", "basics", *error["loc"][1:])}
+                    for error in e.errors(include_url=False)
+                ]
+            )
+
+    return to_json_resume(save_cv_data(current_user, db, response, if_match, cv_data))
+
+
+@router.get("/export/pdf")
+async def export_cv_pdf(
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Export CV as a PDF rendered server-side in Harvard format.
+
+    The render is awaited, so waiting requests hold no thread or
+    connection; when the render pool is full the export gets a 503.
+    """
+    cv_data = await run_in_threadpool(get_user_cv_data, current_user, db)
+    # Release the connection while the PDF is rendered
+    await run_in_threadpool(db.close)
+
+    try:
+        pdf_path = await pdf_renderer.render(cv_data)
+    except PoolSaturated:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to render PDF: {str(e)}",
+        )
+
+    filename = export_filename(cv_data, "pdf")
+    return FileResponse(pdf_path, media_type="application/pdf", filename=filename)
+
+
+@router.get("/export/{format}")
+def export_cv(
+    format: str,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Export CV as DOCX, Markdown, plain text or HTML.
+
+    The document is streamed as it is generated and cached by content
+    hash, so later exports of the same CV are served from disk.
+    """
+    exporter = EXPORTERS.get(format)
+    if exporter is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown export format. Available: {', '.join(['pdf', *EXPORTERS])}",
+        )
+
+    cv_data = get_user_cv_data(current_user, db)
+    content_hash = cv_content_hash(cv_data)
+    filename = export_filename(cv_data, exporter.extension)
+
+    cached_path = export_cache.get(content_hash, exporter.extension)
+    if cached_path:
+        return FileResponse(cached_path, media_type=exporter.media_type, filename=filename)
+
+    chunks = exporter.render(get_layout(cv_data, content_hash))
+    return StreamingResponse(
+        export_cache.stream_into(content_hash, exporter.extension, chunks),
+        media_type=exporter.media_type,
+        headers={"Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}"},
+    )
+
+
+def export_filename(cv_data: dict, extension: str) -> str:
+    """Download name for an exported CV, e.g. CV_Jane_Doe.pdf."""
+    profile = cv_data["profile"]
+    return f"CV_{profile['first_name']}_{profile['last_name']}.{extension}".replace(" ", "_")
@@ -1,20 +1,42 @@
 """API dependencies."""
+from dataclasses import dataclass
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..core.database import get_db
+from ..core.cache import principal_cache
+from ..core.config import settings
+from ..core.database import get_async_db, get_db
 from ..core.security import decode_access_token
-from ..models import User
+from ..models import User, Profile
 
 security = HTTPBearer()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
-    """Get current authenticated user."""
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user as seen by request handlers.
+
+    Cached between requests, so it only carries what authorization and
+    profile scoping need rather than a session-bound User.
+    """
+
+    id: int
+    email: str
+    is_active: bool
+    profile_id: Optional[int]
+
+
+# One round trip resolves the user and their profile id.
+PRINCIPAL_QUERY = select(User.id, User.email, User.is_active, Profile.id).outerjoin(
+    Profile, Profile.user_id == User.id
+)
+
+
+def get_token_user_id(credentials: HTTPAuthorizationCredentials) -> int:
+    """Decode the bearer token and return the user id it was issued for."""
     token = credentials.credentials
     payload = decode_access_token(token)
 
@@ -32,14 +54,37 @@ def get_current_user(
         )
 
     try:
-        user_id = int(user_id_str)
+        return int(user_id_str)
     except (ValueError, TypeError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+
+def make_principal(row) -> Optional[Principal]:
+    """Build and cache a Principal from a PRINCIPAL_QUERY row."""
+    if row is None:
+        return None
+    principal = Principal(*row)
+    principal_cache.set(principal.id, principal)
+    return principal
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Forget the cached principal, e.g. after its profile was created or deleted."""
+    principal_cache.invalidate(user_id)
+
+
+@event.listens_for(User.is_active, "set")
+def _on_active_changed(target: User, value, oldvalue, initiator) -> None:
+    """Drop the cached principal as soon as a user is (de)activated."""
+    if target.id is not None:
+        invalidate_principal(target.id)
+
+
+def check_user(user: Optional[Principal]) -> Principal:
+    """Reject missing and inactive users."""
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -53,3 +98,52 @@ def get_current_user(
         )
 
     return user
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+) -> Principal:
+    """Get current authenticated user."""
+    user_id = get_token_user_id(credentials)
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        principal = make_principal(
+            db.execute(PRINCIPAL_QUERY.where(User.id == user_id)).first()
+        )
+    return check_user(principal)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> Principal:
+    """Get current authenticated user through the async session."""
+    user_id = get_token_user_id(credentials)
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        principal = make_principal(
+            (await db.execute(PRINCIPAL_QUERY.where(User.id == user_id))).first()
+        )
+    return check_user(principal)
+
+
+def get_current_admin(current_user: Principal = Depends(get_current_user)) -> Principal:
+    """Get current user, requiring their email to be listed in ADMIN_EMAILS."""
+    admins = {email.lower() for email in settings.ADMIN_EMAILS}
+    if current_user.email.lower() not in admins:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
+    return current_user
+
+
+def require_profile_id(user: Principal) -> int:
+    """Return the user's profile id or raise 404."""
+    if user.profile_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found. Please create a profile first.",
+        )
+    return user.profile_id
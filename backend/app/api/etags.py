@@ -0,0 +1,82 @@
+"""Profile versioning and conditional GET helpers."""
+from typing import Optional, Tuple
+from fastapi import Response, status
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from ..models import Profile
+
+# Clients may store responses but must revalidate them with If-None-Match.
+CACHE_CONTROL = "private, no-cache"
+
+
+def touch_profile(profile: Profile) -> None:
+    """Bump the profile version as part of the current transaction."""
+    profile.version = Profile.version + 1
+
+
+def has_pending_changes(db: Session) -> bool:
+    """Whether flushing the session would write anything.
+
+    Objects that were only assigned their current values are ignored.
+    """
+    return bool(
+        db.new or db.deleted or any(db.is_modified(obj) for obj in db.dirty)
+    )
+
+
+def profile_version_bump(profile_id: int):
+    """Return an UPDATE statement bumping the version of a profile by id."""
+    return (
+        update(Profile)
+        .where(Profile.id == profile_id)
+        .values(version=Profile.version + 1)
+    )
+
+
+def get_profile_version(user_id: int, db: Session) -> Optional[Tuple[int, int]]:
+    """Return (profile id, version) without loading the profile or its sections."""
+    row = (
+        db.query(Profile.id, Profile.version)
+        .filter(Profile.user_id == user_id)
+        .first()
+    )
+    return tuple(row) if row else None
+
+
+def make_etag(profile_id: int, version: int) -> str:
+    """Build a strong ETag for a profile version."""
+    return f'"{profile_id}-{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored.
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def etag_matches_strong(if_match: Optional[str], etag: str) -> bool:
+    """Check an If-Match header value against an ETag.
+
+    If-Match uses strong comparison: a W/ tag never matches, even when
+    its opaque part equals ``etag``.
+    """
+    if not if_match:
+        return False
+    candidates = [tag.strip() for tag in if_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach validator headers to a response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response for a matching ETag."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
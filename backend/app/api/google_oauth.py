@@ -1,46 +1,79 @@
 """Google OAuth and Docs export endpoints."""
+import asyncio
+import functools
 from typing import Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.responses import RedirectResponse
-from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from sqlalchemy.orm import Session
 
 from ..core.config import settings
-from ..core.database import get_db
-from ..models import User
-from ..services.google_docs import GoogleDocsService
-from .dependencies import get_current_user
+from ..core.database import SessionLocal, get_db
+from ..core.security import create_oauth_state, verify_oauth_state
+from ..core.workers import ThreadPool
+from ..models import ExportJob
+from ..schemas import ExportJobResponse
+from ..services.export_jobs import ACTIVE_STATUSES, export_queue, get_active_job
+from ..services.google_credentials import GoogleNotConnected, google_tokens
+from .dependencies import Principal, get_current_user
 from .cv_export import get_user_cv_data
 
 router = APIRouter()
 
+# Token exchanges are blocking HTTP calls to Google, so they run on their
+# own threads; past the pending limit callers get PoolSaturated (503).
+oauth_pool = ThreadPool(
+    max_workers=settings.GOOGLE_OAUTH_WORKERS,
+    max_pending=settings.GOOGLE_OAUTH_QUEUE_LIMIT,
+    name="google-oauth",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_client_config() -> Dict[str, Any]:
+    """OAuth client configuration, built once from settings."""
+    return {
+        "web": {
+            "client_id": settings.GOOGLE_CLIENT_ID,
+            "client_secret": settings.GOOGLE_CLIENT_SECRET,
+            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+            "token_uri": settings.GOOGLE_TOKEN_URI,
+            "redirect_uris": [settings.GOOGLE_REDIRECT_URI]
+        }
+    }
+
 
 def create_flow() -> Flow:
-    """Create OAuth flow for Google authentication."""
-    flow = Flow.from_client_config(
-        {
-            "web": {
-                "client_id": settings.GOOGLE_CLIENT_ID,
-                "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "redirect_uris": [settings.GOOGLE_REDIRECT_URI]
-            }
-        },
+    """Create OAuth flow for Google authentication.
+
+    A flow carries the state of one authorization, so each request gets
+    its own; only the client configuration is shared.
+    """
+    return Flow.from_client_config(
+        get_client_config(),
         scopes=settings.GOOGLE_SCOPES,
         redirect_uri=settings.GOOGLE_REDIRECT_URI
     )
-    return flow
+
+
+def connect_google_account(user_id: int, code: str) -> None:
+    """Exchange an authorization code and store the credentials. Blocks on Google."""
+    flow = create_flow()
+    flow.fetch_token(code=code, timeout=settings.GOOGLE_API_TIMEOUT)
+    with SessionLocal() as db:
+        google_tokens.save(user_id, flow.credentials, db)
 
 
 @router.get("/auth/google/url")
 async def get_google_auth_url(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ) -> Dict[str, str]:
     """
     Generate Google OAuth authorization URL.
 
+    The state is signed for the current user; the callback rejects any
+    other.
+
     Returns:
         Dictionary with authorization URL and state
     """
@@ -54,7 +87,8 @@ async def get_google_auth_url(
     authorization_url, state = flow.authorization_url(
         access_type='offline',
         include_granted_scopes='true',
-        prompt='consent'
+        prompt='consent',
+        state=create_oauth_state(current_user.id),
     )
 
     return {
@@ -67,81 +101,119 @@ async def get_google_auth_url(
 async def google_auth_callback(
     code: str,
     state: str,
-    db: Session = Depends(get_db)
-):
+    current_user: Principal = Depends(get_current_user)
+) -> Dict[str, bool]:
     """
     Handle Google OAuth callback.
 
-    This endpoint receives the authorization code from Google
-    and exchanges it for access tokens.
+    This endpoint receives the authorization code from Google, exchanges
+    it for tokens and stores them for the user. Tokens never leave the
+    server; exports use the stored credentials. ``state`` must be the
+    one GET /auth/google/url issued to the same user.
     """
+    if not verify_oauth_state(state, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired OAuth state"
+        )
+
+    future = oauth_pool.submit(connect_google_account, current_user.id, code)
     try:
-        flow = create_flow()
-        flow.fetch_token(code=code)
-
-        credentials = flow.credentials
-
-        # Store credentials in session or database
-        # For now, we'll return them to the frontend to store temporarily
-        return {
-            "success": True,
-            "credentials": {
-                "token": credentials.token,
-                "refresh_token": credentials.refresh_token,
-                "token_uri": credentials.token_uri,
-                "client_id": credentials.client_id,
-                "client_secret": credentials.client_secret,
-                "scopes": credentials.scopes
-            }
-        }
+        await asyncio.wrap_future(future)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Failed to authenticate with Google: {str(e)}"
         )
+    return {"success": True, "connected": True}
 
 
-@router.post("/export/google-docs")
-async def export_to_google_docs(
-    credentials_data: Dict[str, Any],
-    current_user: User = Depends(get_current_user),
+@router.get("/auth/google/status")
+def get_google_auth_status(
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
-) -> Dict[str, Any]:
+) -> Dict[str, bool]:
+    """Report whether the user has connected a Google account."""
+    return {"connected": google_tokens.is_connected(current_user.id, db)}
+
+
+@router.delete("/auth/google", status_code=status.HTTP_204_NO_CONTENT)
+def disconnect_google_account(
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Forget the user's stored Google credentials."""
+    google_tokens.delete(current_user.id, db)
+
+
+@router.post(
+    "/export/google-docs",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def export_to_google_docs(
+    response: Response,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
     """
-    Export CV to Google Docs.
+    Queue an export of the CV to Google Docs.
+
+    The document is created in the background. Poll the returned job at
+    GET /export/jobs/{id} for progress and the document URL. While an
+    export is already in progress for the user, that job is returned
+    instead of starting another one. The user must have connected a
+    Google account through the OAuth callback first.
 
     Args:
-        credentials_data: Google OAuth credentials from frontend
         current_user: Authenticated user
         db: Database session
 
     Returns:
-        Dictionary with document ID and URL
+        The export job
     """
-    try:
-        # Reconstruct credentials from received data
-        credentials = Credentials(
-            token=credentials_data.get("token"),
-            refresh_token=credentials_data.get("refresh_token"),
-            token_uri=credentials_data.get("token_uri"),
-            client_id=credentials_data.get("client_id"),
-            client_secret=credentials_data.get("client_secret"),
-            scopes=credentials_data.get("scopes")
-        )
-
-        # Get CV data
+    job = get_active_job(current_user.id, db)
+    if job is None:
+        # Fails fast when not connected, and leaves a fresh token cached
+        # for the export worker.
+        try:
+            google_tokens.get(current_user.id, db)
+        except GoogleNotConnected as e:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+        # Snapshot the CV as it is now; later edits don't leak into the export
         cv_data = get_user_cv_data(current_user, db)
 
-        # Create Google Docs service and export
-        docs_service = GoogleDocsService(credentials)
-        result = docs_service.create_cv_document(cv_data)
+        job = ExportJob(user_id=current_user.id, kind="google_docs", payload=cv_data)
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        export_queue.enqueue(job)
 
-        return result
+    response.headers["Location"] = f"{settings.API_V1_STR}/export/jobs/{job.id}"
+    return job
 
-    except HTTPException:
-        raise
-    except Exception as e:
+
+@router.get("/export/jobs/{job_id}", response_model=ExportJobResponse)
+def get_export_job(
+    job_id: int,
+    response: Response,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the status of an export job, including the document URL once done."""
+    job = (
+        db.query(ExportJob)
+        .filter(ExportJob.id == job_id, ExportJob.user_id == current_user.id)
+        .first()
+    )
+    if not job:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to export to Google Docs: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export job not found"
         )
+
+    export_queue.reclaim_if_stale(job, db)
+    if job.status in ACTIVE_STATUSES:
+        response.headers["Retry-After"] = "1"
+    return job
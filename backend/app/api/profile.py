@@ -1,33 +1,52 @@
 """Profile management endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy.orm import Session
+from ..core.cache import cv_cache
 from ..core.database import get_db
-from ..models import User, Profile
-from ..schemas import ProfileCreate, ProfileUpdate, ProfileResponse
-from .dependencies import get_current_user
+from ..models import Profile
+from ..schemas import ProfileCreate, ProfileUpdate, ProfilePatch, ProfileResponse
+from .cv_export import load_profile
+from .dependencies import Principal, get_current_user, invalidate_principal
+from .etags import (
+    etag_matches,
+    get_profile_version,
+    has_pending_changes,
+    make_etag,
+    not_modified,
+    set_etag,
+    touch_profile,
+)
 
 router = APIRouter(prefix="/profile", tags=["profile"])
 
 
 @router.get("", response_model=ProfileResponse)
 def get_profile(
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get current user's profile."""
-    profile = db.query(Profile).filter(Profile.user_id == current_user.id).first()
+    current = get_profile_version(current_user.id, db)
+    if current and etag_matches(if_none_match, make_etag(*current)):
+        return not_modified(make_etag(*current))
+
+    profile = load_profile(current_user.id, db)
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found",
         )
+    set_etag(response, make_etag(profile.id, profile.version))
     return profile
 
 
 @router.post("", response_model=ProfileResponse, status_code=status.HTTP_201_CREATED)
 def create_profile(
     profile_data: ProfileCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create user profile."""
@@ -41,23 +60,35 @@ def create_profile(
             detail="Profile already exists",
         )
 
-    # Create new profile
-    new_profile = Profile(**profile_data.model_dump(), user_id=current_user.id)
+    # Create new profile. Sections start out empty, so they are set
+    # explicitly instead of being lazy loaded after the insert.
+    new_profile = Profile(
+        **profile_data.model_dump(),
+        user_id=current_user.id,
+        education=[],
+        experience=[],
+        certifications=[],
+        projects=[],
+        skills=None,
+    )
     db.add(new_profile)
+    db.flush()
+    result = ProfileResponse.model_validate(new_profile)
     db.commit()
-    db.refresh(new_profile)
+    cv_cache.invalidate(current_user.id)
+    invalidate_principal(current_user.id)
 
-    return new_profile
+    return result
 
 
 @router.put("", response_model=ProfileResponse)
 def update_profile(
     profile_data: ProfileUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update user profile."""
-    profile = db.query(Profile).filter(Profile.user_id == current_user.id).first()
+    profile = load_profile(current_user.id, db)
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -68,21 +99,52 @@ def update_profile(
     for field, value in profile_data.model_dump().items():
         setattr(profile, field, value)
 
+    # Serialize before commit expires the loaded sections.
+    result = ProfileResponse.model_validate(profile)
+    touch_profile(profile)
     db.commit()
-    db.refresh(profile)
+    cv_cache.invalidate(current_user.id)
 
-    return profile
+    return result
+
+
+@router.patch("", response_model=ProfileResponse)
+def patch_profile(
+    profile_data: ProfilePatch,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Update only the given profile fields."""
+    profile = load_profile(current_user.id, db)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found",
+        )
+
+    for field, value in profile_data.model_dump(exclude_unset=True).items():
+        setattr(profile, field, value)
+
+    result = ProfileResponse.model_validate(profile)
+    if has_pending_changes(db):
+        touch_profile(profile)
+        db.commit()
+        cv_cache.invalidate(current_user.id)
+
+    return result
 
 
 @router.delete("", status_code=status.HTTP_204_NO_CONTENT)
 def delete_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete user profile and all associated data."""
-    profile = db.query(Profile).filter(Profile.user_id == current_user.id).first()
+    profile = load_profile(current_user.id, db)
     if profile:
         db.delete(profile)
         db.commit()
+        cv_cache.invalidate(current_user.id)
+        invalidate_principal(current_user.id)
 
     return None
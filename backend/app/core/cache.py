@@ -0,0 +1,66 @@
+"""In-process caches."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+from .config import settings
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+
+# Finished CV dicts keyed by user id. Cached values are shared between
+# requests and must be treated as read-only.
+cv_cache = TTLCache(maxsize=settings.CV_CACHE_SIZE, ttl=settings.CV_CACHE_TTL)
+
+# Authenticated principals keyed by user id. Kept short-lived because
+# changes made by other processes only become visible on expiry.
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL
+)
+
+# Google credentials keyed by user id, kept about as long as an access
+# token lives. Expiry is checked on every use by the credential store.
+google_token_cache = TTLCache(maxsize=settings.GOOGLE_TOKEN_CACHE_SIZE, ttl=60 * 60)
+
+# Compiled CV layouts keyed by CV content hash. A hash always maps to
+# the same layout, so entries only expire to bound memory.
+cv_layout_cache = TTLCache(maxsize=settings.CV_LAYOUT_CACHE_SIZE, ttl=60 * 60)
@@ -15,9 +15,25 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
+    PASSWORD_HASH_WORKERS: int = 2  # bcrypt worker processes
+    PASSWORD_HASH_QUEUE_LIMIT: int = 32  # hashes allowed to wait for a worker
+    ADMIN_EMAILS: list = []  # users allowed on the /admin endpoints
 
     # Database
     DATABASE_URL: str = "sqlite:///./harvard_cv.db"
+    # Serve the CRUD routers from an AsyncSession (asyncpg / aiosqlite)
+    DB_ASYNC: bool = False
+    # Derived from DATABASE_URL when unset
+    ASYNC_DATABASE_URL: Optional[str] = None
+    # Connection pool, per engine and per worker process
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    # SQLite connection pragmas
+    SQLITE_BUSY_TIMEOUT: int = 5000  # milliseconds
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # bytes
 
     # File Upload
     MAX_FILE_SIZE: int = 5 * 1024 * 1024  # 5 MB
@@ -30,6 +46,26 @@ class Settings(BaseSettings):
     # Templates
     TEMPLATES_DIR: str = "./app/templates"
 
+    # Caching
+    CV_CACHE_SIZE: int = 1024  # CV snapshots held in memory per process
+    CV_CACHE_TTL: int = 300  # seconds
+    CV_LAYOUT_CACHE_SIZE: int = 1024  # compiled CV layouts held in memory per process
+    PRINCIPAL_CACHE_SIZE: int = 10000  # authenticated users held per process
+    PRINCIPAL_CACHE_TTL: int = 30  # seconds
+    GOOGLE_TOKEN_CACHE_SIZE: int = 10000  # users' Google credentials held per process
+
+    # Rendering
+    RENDER_CACHE_DIR: str = "./cache/renders"
+    RENDER_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024  # least recently used renders go first; 0 = no cap
+    RENDER_CACHE_MAX_AGE: int = 7 * 24 * 3600  # seconds an unused render is kept; 0 = no cap
+    PDF_RENDER_WORKERS: int = 2
+    PDF_RENDER_TIMEOUT: int = 30  # seconds
+    PDF_RENDER_QUEUE_LIMIT: int = 8  # renders allowed to wait for a worker
+    BULK_EXPORT_WORKERS: int = 2  # processes rendering admin bulk exports
+    BULK_EXPORT_BATCH_SIZE: int = 200  # profiles fetched per database round trip
+    IMPORT_BATCH_SIZE: int = 500  # NDJSON lines validated and committed together
+    IMPORT_MAX_REPORTED_ERRORS: int = 1000  # failed lines listed in an import result
+
     # Google OAuth & Docs
     GOOGLE_CLIENT_ID: Optional[str] = None
     GOOGLE_CLIENT_SECRET: Optional[str] = None
@@ -38,6 +74,19 @@ class Settings(BaseSettings):
         "https://www.googleapis.com/auth/documents",
         "https://www.googleapis.com/auth/drive.file"
     ]
+    GOOGLE_TOKEN_URI: str = "https://oauth2.googleapis.com/token"
+    GOOGLE_API_TIMEOUT: int = 30  # seconds per Google API call
+    GOOGLE_OAUTH_WORKERS: int = 8  # concurrent token exchanges per process
+    GOOGLE_OAUTH_QUEUE_LIMIT: int = 32  # token exchanges allowed to wait for a worker
+    GOOGLE_OAUTH_STATE_EXPIRE_MINUTES: int = 10  # time to complete the Google consent screen
+    # Fernet key for stored Google tokens; derived from SECRET_KEY when unset
+    GOOGLE_CREDENTIALS_KEY: Optional[str] = None
+    GOOGLE_TOKEN_REFRESH_MARGIN: int = 300  # seconds before expiry to refresh
+    # Base URL for the Docs API, e.g. benchmarks/fake_google_api.py for load tests
+    GOOGLE_DOCS_API_ENDPOINT: Optional[str] = None
+    EXPORT_WORKERS: int = 4  # concurrent Google Docs exports per process
+    EXPORT_JOB_TIMEOUT: int = 120  # seconds without progress before a job is retried
+    EXPORT_JOB_MAX_ATTEMPTS: int = 3  # runs of an interrupted job before it fails
 
     class Config:
         env_file = ".env"
@@ -1,14 +1,210 @@
 """Database configuration and session management."""
-from sqlalchemy import create_engine
+import threading
+import time
+from typing import Any, Dict
+from sqlalchemy import create_engine, event, exc, inspect, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from .config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+
+class PoolMetrics:
+    """Connection checkout counters for one engine's pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += wait
+            self.wait_seconds_max = max(self.wait_seconds_max, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(
+                    self.wait_seconds_total / self.checkouts, 6
+                ) if self.checkouts else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+class InstrumentedPoolMixin:
+    """Times how long each checkout waits for a pooled connection."""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+
+def engine_options(url: str, poolclass: type) -> Dict[str, Any]:
+    """Return pool settings for an engine, skipping them for in-memory SQLite."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def configure_sqlite(sync_engine: Engine) -> None:
+    """Apply WAL journaling and tuning pragmas to every new SQLite connection."""
+    if sync_engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        # WAL lets readers proceed while a writer holds the database.
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.close()
+
+
+engine = create_engine(
+    settings.DATABASE_URL,
+    **engine_options(settings.DATABASE_URL, InstrumentedQueuePool),
+)
+configure_sqlite(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Async drivers used when DB_ASYNC is enabled, keyed by backend name.
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def get_async_database_url() -> str:
+    """Return the async driver URL for the configured database."""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(settings.DATABASE_URL)
+    backend = url.get_backend_name()
+    url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return url.render_as_string(hide_password=False)
+
+
+async_engine = None
+AsyncSessionLocal = None
+if settings.DB_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_database_url = get_async_database_url()
+    async_engine = create_async_engine(
+        async_database_url,
+        **engine_options(async_database_url, InstrumentedAsyncQueuePool),
+    )
+    configure_sqlite(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+# Columns added to tables after they first shipped, as (table, column,
+# DDL type). create_all never alters an existing table, so upgrade_schema
+# adds them to databases created by an earlier release.
+ADDED_COLUMNS = [
+    ("profiles", "version", "INTEGER NOT NULL DEFAULT 1"),
+    ("export_jobs", "payload", "JSON"),
+    ("export_jobs", "attempts", "INTEGER NOT NULL DEFAULT 0"),
+]
+
+
+# Indexes added to existing tables, as (table, column). The profile_id
+# indexes back the per-section SELECT ... WHERE profile_id IN (...) that
+# loads a CV, which otherwise scans each section table.
+ADDED_INDEXES = [
+    ("education", "profile_id"),
+    ("experience", "profile_id"),
+    ("certifications", "profile_id"),
+    ("projects", "profile_id"),
+]
+
+
+def upgrade_schema(bind: Engine) -> None:
+    """Apply ADDED_COLUMNS and ADDED_INDEXES missing from the database.
+
+    Safe to run on every start.
+    """
+    inspector = inspect(bind)
+    with bind.begin() as connection:
+        for table, column, ddl in ADDED_COLUMNS:
+            if not inspector.has_table(table):
+                continue  # created whole by create_all
+            if column not in {c["name"] for c in inspector.get_columns(table)}:
+                connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+        for table, column in ADDED_INDEXES:
+            if not inspector.has_table(table):
+                continue
+            # Named as create_all names index=True columns.
+            connection.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_{column} ON {table} ({column})"
+            ))
+
+
+def pool_status() -> Dict[str, Any]:
+    """Return live pool occupancy and checkout wait metrics per engine."""
+    engines = {"sync": engine}
+    if async_engine is not None:
+        engines["async"] = async_engine.sync_engine
+
+    status = {}
+    for name, current in engines.items():
+        pool = current.pool
+        if not isinstance(pool, InstrumentedPoolMixin):
+            status[name] = {"pool": type(pool).__name__}
+            continue
+        # Both engines are built from the same settings (see engine_options).
+        max_overflow = settings.DB_MAX_OVERFLOW
+        capacity = pool.size() + max(max_overflow, 0)
+        status[name] = {
+            "pool": type(pool).__name__,
+            "size": pool.size(),
+            "max_overflow": max_overflow,
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "saturation": round(pool.checkedout() / capacity, 3) if capacity else None,
+            **pool.metrics.snapshot(),
+        }
+    return status
+
 
 def get_db():
     """Dependency for getting database session."""
@@ -17,3 +213,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency for getting an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,28 +1,77 @@
 """Security utilities for authentication and authorization."""
+import asyncio
+import base64
+import functools
+import hashlib
 from datetime import datetime, timedelta
 from typing import Optional
+from cryptography.fernet import Fernet
 from jose import JWTError, jwt
 import bcrypt
 import secrets
 from .config import settings
+from .workers import ProcessPool
 
+# bcrypt is CPU-bound, so it runs on its own processes. The pending limit
+# bounds how many requests can wait on hashing; beyond it callers get
+# PoolSaturated immediately instead of queueing behind a login burst.
+hash_pool = ProcessPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_QUEUE_LIMIT,
+)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash."""
+
+# Stored for accounts created without a password, such as bulk imports.
+# Matches no password; the owner sets one through a password reset.
+UNUSABLE_PASSWORD = "!"
+
+
+def _checkpw(plain_password: str, hashed_password: str) -> bool:
+    if hashed_password == UNUSABLE_PASSWORD:
+        return False
     return bcrypt.checkpw(
         plain_password.encode('utf-8'),
         hashed_password.encode('utf-8')
     )
 
 
-def get_password_hash(password: str) -> str:
-    """Generate password hash."""
+def _hashpw(password: str) -> str:
     return bcrypt.hashpw(
         password.encode('utf-8'),
         bcrypt.gensalt()
     ).decode('utf-8')
 
 
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash. Blocks until a worker has checked it.
+
+    For scripts such as seed_data.py. Request handlers await
+    verify_password_async instead, so no thread is held while they wait.
+    """
+    return hash_pool.submit(_checkpw, plain_password, hashed_password).result()
+
+
+def get_password_hash(password: str) -> str:
+    """Generate password hash. Blocks until a worker has computed it.
+
+    For scripts such as seed_data.py. Request handlers await
+    get_password_hash_async instead, so no thread is held while they wait.
+    """
+    return hash_pool.submit(_hashpw, password).result()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop."""
+    return await asyncio.wrap_future(
+        hash_pool.submit(_checkpw, plain_password, hashed_password)
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Generate password hash without blocking the event loop."""
+    return await asyncio.wrap_future(hash_pool.submit(_hashpw, password))
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token."""
     to_encode = data.copy()
@@ -45,6 +94,60 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
+# Purpose claim of the signed OAuth state; see create_oauth_state.
+GOOGLE_OAUTH_STATE_PURPOSE = "google-oauth"
+
+
+def create_oauth_state(user_id: int) -> str:
+    """Create the signed OAuth state for an authorization started by a user.
+
+    The callback only accepts a state issued to the user presenting it,
+    so a forged callback link cannot attach another person's Google
+    account. The token has no ``sub`` claim and is never accepted as an
+    access token.
+    """
+    return create_access_token(
+        {
+            "uid": user_id,
+            "purpose": GOOGLE_OAUTH_STATE_PURPOSE,
+            "nonce": secrets.token_urlsafe(16),
+        },
+        expires_delta=timedelta(minutes=settings.GOOGLE_OAUTH_STATE_EXPIRE_MINUTES),
+    )
+
+
+def verify_oauth_state(state: str, user_id: int) -> bool:
+    """Check that an OAuth state was issued to user_id and has not expired."""
+    payload = decode_access_token(state)
+    return (
+        payload is not None
+        and payload.get("purpose") == GOOGLE_OAUTH_STATE_PURPOSE
+        and payload.get("uid") == user_id
+    )
+
+
 def generate_reset_token() -> str:
     """Generate a secure random token for password reset."""
     return secrets.token_urlsafe(32)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fernet() -> Fernet:
+    key = settings.GOOGLE_CREDENTIALS_KEY
+    if not key:
+        key = base64.urlsafe_b64encode(hashlib.sha256(settings.SECRET_KEY.encode()).digest())
+    return Fernet(key)
+
+
+def encrypt_secret(plaintext: str) -> str:
+    """Encrypt a secret for storage."""
+    return _get_fernet().encrypt(plaintext.encode('utf-8')).decode('ascii')
+
+
+def decrypt_secret(ciphertext: str) -> str:
+    """Decrypt a stored secret.
+
+    Raises:
+        cryptography.fernet.InvalidToken: If the key changed or the data was altered
+    """
+    return _get_fernet().decrypt(ciphertext.encode('ascii')).decode('utf-8')
@@ -0,0 +1,117 @@
+"""Shared worker pools for CPU-bound and blocking work."""
+import abc
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+
+def _noop() -> None:
+    """Task used to force worker processes to start."""
+    return None
+
+
+class PoolSaturated(Exception):
+    """Raised when a bounded pool already has its maximum number of tasks."""
+
+
+class WorkerPool(abc.ABC):
+    """Lazily started executor with an optional bound on outstanding tasks.
+
+    When ``max_pending`` is set, at most ``max_workers + max_pending`` tasks
+    may be running or queued; further submissions fail fast with
+    PoolSaturated.
+    """
+
+    def __init__(self, max_workers: int, max_pending: Optional[int] = None):
+        self.max_workers = max_workers
+        self._slots = (
+            threading.BoundedSemaphore(max_workers + max_pending)
+            if max_pending is not None
+            else None
+        )
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _new_executor(self) -> Executor:
+        """Create the executor, on first use and after a shutdown."""
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._new_executor()
+            return self._executor
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Submit a task, or raise PoolSaturated if the pool is full."""
+        if self._slots is not None and not self._slots.acquire(blocking=False):
+            raise PoolSaturated("Worker pool is saturated")
+        try:
+            future = self._submit(fn, *args)
+        except BaseException:
+            if self._slots is not None:
+                self._slots.release()
+            raise
+        if self._slots is not None:
+            future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        return self._get_executor().submit(fn, *args)
+
+    def shutdown(self) -> None:
+        """Stop the workers."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+class ProcessPool(WorkerPool):
+    """Process pool for CPU-bound work that stays warm for the lifetime of the app.
+
+    Workers are spawned (not forked) so they never inherit database
+    connections or locks held by the parent's threads.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        initializer: Optional[Callable[[], None]] = None,
+        max_pending: Optional[int] = None,
+    ):
+        super().__init__(max_workers, max_pending)
+        self.initializer = initializer
+
+    def _new_executor(self) -> Executor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=self.initializer,
+        )
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Submit a task, restarting the pool if a worker died."""
+        try:
+            return self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            self.shutdown()
+            return self._get_executor().submit(fn, *args)
+
+    def warm_up(self) -> None:
+        """Start every worker and run its initializer ahead of the first task."""
+        for future in [self.submit(_noop) for _ in range(self.max_workers)]:
+            future.result()
+
+
+class ThreadPool(WorkerPool):
+    """Thread pool for blocking I/O that must stay off the event loop."""
+
+    def __init__(self, max_workers: int, max_pending: Optional[int] = None, name: str = "pool"):
+        super().__init__(max_workers, max_pending)
+        self.name = name
+
+    def _new_executor(self) -> Executor:
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
@@ -1,6 +1,8 @@
 """Database models."""
 from .user import User
 from .profile import Profile, Education, Experience, Certification, Project, Skills
+from .export_job import ExportJob, GoogleDocExport
+from .google_credential import GoogleCredential
 
 __all__ = [
     "User",
@@ -10,4 +12,7 @@ __all__ = [
     "Certification",
     "Project",
     "Skills",
+    "ExportJob",
+    "GoogleDocExport",
+    "GoogleCredential",
 ]
@@ -0,0 +1,43 @@
+"""Background export job model."""
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class ExportJob(Base):
+    """An export running in the background, polled by the client."""
+
+    __tablename__ = "export_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    kind = Column(String, nullable=False, default="google_docs")
+
+    # queued -> running -> succeeded | failed
+    status = Column(String, nullable=False, default="queued", index=True)
+    progress = Column(Integer, nullable=False, default=0)  # percent
+    document_id = Column(String)
+    document_url = Column(String)
+    error = Column(Text)
+
+    # The CV snapshot to export, so any process can run or resume the job
+    payload = Column(JSON)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class GoogleDocExport(Base):
+    """The Google Doc a user last exported to, so re-exports update it in place."""
+
+    __tablename__ = "google_doc_exports"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
+
+    document_id = Column(String, nullable=False)
+    revision_id = Column(String)  # revision our last write produced
+    segments = Column(JSON, nullable=False)  # [[content key, length], ...] in order
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,19 @@
+"""Stored Google OAuth credentials."""
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class GoogleCredential(Base):
+    """A user's Google OAuth tokens, encrypted at rest."""
+
+    __tablename__ = "google_credentials"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
+
+    # Fernet token of a JSON object: token, refresh_token, expiry, scopes
+    encrypted_tokens = Column(Text, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
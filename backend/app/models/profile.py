@@ -21,12 +21,23 @@ class Profile(Base):
     linkedin = Column(String)
     summary = Column(Text)
 
-    # Relationships
+    # Bumped on every change to the profile or its sections; backs ETags.
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    # Relationships. Sections read back in id order, which is CV order.
     user = relationship("User", back_populates="profile")
-    education = relationship("Education", back_populates="profile", cascade="all, delete-orphan")
-    experience = relationship("Experience", back_populates="profile", cascade="all, delete-orphan")
-    certifications = relationship("Certification", back_populates="profile", cascade="all, delete-orphan")
-    projects = relationship("Project", back_populates="profile", cascade="all, delete-orphan")
+    education = relationship(
+        "Education", back_populates="profile", cascade="all, delete-orphan", order_by="Education.id"
+    )
+    experience = relationship(
+        "Experience", back_populates="profile", cascade="all, delete-orphan", order_by="Experience.id"
+    )
+    certifications = relationship(
+        "Certification", back_populates="profile", cascade="all, delete-orphan", order_by="Certification.id"
+    )
+    projects = relationship(
+        "Project", back_populates="profile", cascade="all, delete-orphan", order_by="Project.id"
+    )
     skills = relationship("Skills", back_populates="profile", uselist=False, cascade="all, delete-orphan")
 
 
@@ -36,7 +47,7 @@ class Education(Base):
     __tablename__ = "education"
 
     id = Column(Integer, primary_key=True, index=True)
-    profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False)
+    profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False, index=True)
 
     degree = Column(String, nullable=False)
     institution = Column(String, nullable=False)
@@ -54,7 +65,7 @@ class Experience(Base):
     __tablename__ = "experience"
 
     id = Column(Integer, primary_key=True, index=True)
-    profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False)
+    profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False, index=True)
 
     company = Column(String, nullable=False)
     role = Column(String, nullable=False)
@@ -72,7 +83,7 @@ class Certification(Base):
     __tablename__ = "certifications"
 
     id = Column(Integer, primary_key=True, index=True)
-    profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False)
+    profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False, index=True)
 
     name = Column(String, nullable=False)
     issuer = Column(String, nullable=False)
@@ -90,7 +101,7 @@ class Project(Base):
     __tablename__ = "projects"
 
     id = Column(Integer, primary_key=True, index=True)
-    profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False)
+    profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False, index=True)
 
     name = Column(String, nullable=False)
     impact = Column(Text)
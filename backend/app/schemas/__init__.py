@@ -1,21 +1,32 @@
 """Pydantic schemas."""
 from .auth import UserCreate, UserLogin, Token, TokenPayload, PasswordResetRequest, PasswordReset, Message
 from .cv import (
+    PatchBase,
     ProfileCreate,
     ProfileUpdate,
+    ProfilePatch,
     ProfileResponse,
     EducationCreate,
+    EducationPatch,
     EducationResponse,
     ExperienceCreate,
+    ExperiencePatch,
     ExperienceResponse,
     CertificationCreate,
+    CertificationPatch,
     CertificationResponse,
     ProjectCreate,
+    ProjectPatch,
     ProjectResponse,
     SkillsCreate,
+    SkillsPatch,
     SkillsResponse,
     CVData,
+    CVImportRecord,
 )
+from .batch import BatchOperation, BatchRequest, BatchItemResult, BatchResponse
+from .export_job import ExportJobResponse
+from .json_resume import JSONResume
 
 __all__ = [
     "UserCreate",
@@ -25,18 +36,32 @@ __all__ = [
     "PasswordResetRequest",
     "PasswordReset",
     "Message",
+    "PatchBase",
     "ProfileCreate",
     "ProfileUpdate",
+    "ProfilePatch",
     "ProfileResponse",
     "EducationCreate",
+    "EducationPatch",
     "EducationResponse",
     "ExperienceCreate",
+    "ExperiencePatch",
     "ExperienceResponse",
     "CertificationCreate",
+    "CertificationPatch",
     "CertificationResponse",
     "ProjectCreate",
+    "ProjectPatch",
     "ProjectResponse",
     "SkillsCreate",
+    "SkillsPatch",
     "SkillsResponse",
     "CVData",
+    "CVImportRecord",
+    "BatchOperation",
+    "BatchRequest",
+    "BatchItemResult",
+    "BatchResponse",
+    "ExportJobResponse",
+    "JSONResume",
 ]
@@ -0,0 +1,51 @@
+"""Schemas for batched section writes."""
+from typing import Generic, List, Literal, Optional, TypeVar
+from pydantic import BaseModel, Field, model_validator
+
+# Upper bound on operations per request; a full section save fits easily.
+MAX_BATCH_OPERATIONS = 200
+
+CreateT = TypeVar("CreateT", bound=BaseModel)
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+
+class BatchOperation(BaseModel, Generic[CreateT]):
+    """A single create, update or delete within a batch."""
+
+    op: Literal["create", "update", "delete"]
+    id: Optional[int] = None
+    data: Optional[CreateT] = None
+
+    @model_validator(mode="after")
+    def check_fields(self) -> "BatchOperation":
+        """Require the fields each kind of operation needs."""
+        if self.op == "create" and self.id is not None:
+            raise ValueError("create operations must not set id")
+        if self.op != "create" and self.id is None:
+            raise ValueError(f"{self.op} operations require id")
+        if self.op != "delete" and self.data is None:
+            raise ValueError(f"{self.op} operations require data")
+        return self
+
+
+class BatchRequest(BaseModel, Generic[CreateT]):
+    """Schema for a batch of section operations, applied atomically."""
+
+    operations: List[BatchOperation[CreateT]] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_OPERATIONS
+    )
+
+
+class BatchItemResult(BaseModel, Generic[ResponseT]):
+    """Outcome of one batch operation, in request order."""
+
+    op: Literal["create", "update", "delete"]
+    status: Literal["created", "updated", "deleted", "not_found"]
+    id: Optional[int] = None
+    item: Optional[ResponseT] = None
+
+
+class BatchResponse(BaseModel, Generic[ResponseT]):
+    """Schema for batch response."""
+
+    results: List[BatchItemResult[ResponseT]]
@@ -1,6 +1,21 @@
 """CV-related schemas."""
-from typing import List, Optional
-from pydantic import BaseModel, EmailStr
+from typing import ClassVar, List, Optional, Tuple
+from pydantic import BaseModel, EmailStr, Field, model_validator
+
+
+class PatchBase(BaseModel):
+    """Base for partial updates. Omitted fields are left unchanged."""
+
+    # Fields that may be omitted but not cleared with null.
+    required_fields: ClassVar[Tuple[str, ...]] = ()
+
+    @model_validator(mode="after")
+    def check_required_not_null(self) -> "PatchBase":
+        """Reject explicit nulls for columns that cannot be empty."""
+        for field in self.required_fields:
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
 
 
 class EducationBase(BaseModel):
@@ -29,6 +44,19 @@ class EducationResponse(EducationBase):
         from_attributes = True
 
 
+class EducationPatch(PatchBase):
+    """Schema for partially updating education entry."""
+
+    required_fields = ("degree", "institution")
+
+    degree: Optional[str] = None
+    institution: Optional[str] = None
+    location: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    details: Optional[List[str]] = None
+
+
 class ExperienceBase(BaseModel):
     """Base experience schema."""
 
@@ -55,6 +83,19 @@ class ExperienceResponse(ExperienceBase):
         from_attributes = True
 
 
+class ExperiencePatch(PatchBase):
+    """Schema for partially updating experience entry."""
+
+    required_fields = ("company", "role", "start_date", "bullets")
+
+    company: Optional[str] = None
+    role: Optional[str] = None
+    location: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    bullets: Optional[List[str]] = None
+
+
 class CertificationBase(BaseModel):
     """Base certification schema."""
 
@@ -81,6 +122,18 @@ class CertificationResponse(CertificationBase):
         from_attributes = True
 
 
+class CertificationPatch(PatchBase):
+    """Schema for partially updating certification."""
+
+    required_fields = ("name", "issuer")
+
+    name: Optional[str] = None
+    issuer: Optional[str] = None
+    date: Optional[str] = None
+    credential_id: Optional[str] = None
+    url: Optional[str] = None
+
+
 class ProjectBase(BaseModel):
     """Base project schema."""
 
@@ -105,6 +158,17 @@ class ProjectResponse(ProjectBase):
         from_attributes = True
 
 
+class ProjectPatch(PatchBase):
+    """Schema for partially updating project."""
+
+    required_fields = ("name",)
+
+    name: Optional[str] = None
+    impact: Optional[str] = None
+    technologies: Optional[List[str]] = None
+    url: Optional[str] = None
+
+
 class SkillsBase(BaseModel):
     """Base skills schema."""
 
@@ -128,6 +192,14 @@ class SkillsResponse(SkillsBase):
         from_attributes = True
 
 
+class SkillsPatch(PatchBase):
+    """Schema for partially updating skills."""
+
+    languages: Optional[List[str]] = None
+    tools: Optional[List[str]] = None
+    methods: Optional[List[str]] = None
+
+
 class ProfileBase(BaseModel):
     """Base profile schema."""
 
@@ -152,6 +224,20 @@ class ProfileUpdate(ProfileBase):
     pass
 
 
+class ProfilePatch(PatchBase):
+    """Schema for partially updating profile."""
+
+    required_fields = ("first_name", "last_name", "email")
+
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[EmailStr] = None
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    linkedin: Optional[str] = None
+    summary: Optional[str] = None
+
+
 class ProfileResponse(ProfileBase):
     """Schema for profile response."""
 
@@ -176,3 +262,15 @@ class CVData(BaseModel):
     certifications: List[CertificationBase] = []
     projects: List[ProjectBase] = []
     skills: Optional[SkillsBase] = None
+
+
+class CVImportRecord(CVData):
+    """One CV of a bulk import, with the account it belongs to."""
+
+    # Account email; the profile email when omitted.
+    account_email: Optional[EmailStr] = None
+    # bcrypt hash carried over from the previous tool. Without one the
+    # account has no password until it is reset.
+    hashed_password: Optional[str] = Field(
+        None, pattern=r"^\$2[aby]?\$\d{2}\$[./A-Za-z0-9]{53}$"
+    )
@@ -0,0 +1,21 @@
+"""Export job schemas."""
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class ExportJobResponse(BaseModel):
+    """Schema for export job status."""
+
+    id: int
+    kind: str
+    status: str
+    progress: int
+    document_id: Optional[str] = None
+    document_url: Optional[str] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
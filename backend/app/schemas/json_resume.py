@@ -0,0 +1,110 @@
+"""JSON Resume schemas (https://jsonresume.org/schema).
+
+Only the sections a CV maps to are modelled; other properties are
+ignored. Fields the CV cannot do without are required here, so a resume
+that validates always maps to valid CV data.
+"""
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class ResumeLocation(BaseModel):
+    """JSON Resume basics.location."""
+
+    address: Optional[str] = None
+    postalCode: Optional[str] = None
+    city: Optional[str] = None
+    countryCode: Optional[str] = None
+    region: Optional[str] = None
+
+
+class ResumeProfile(BaseModel):
+    """JSON Resume basics.profiles entry."""
+
+    network: Optional[str] = None
+    username: Optional[str] = None
+    url: Optional[str] = None
+
+
+class ResumeBasics(BaseModel):
+    """JSON Resume basics."""
+
+    name: str
+    label: Optional[str] = None
+    # Checked as an email when mapped to the CV profile.
+    email: str
+    phone: Optional[str] = None
+    url: Optional[str] = None
+    summary: Optional[str] = None
+    location: Optional[ResumeLocation] = None
+    profiles: List[ResumeProfile] = []
+
+
+class ResumeWork(BaseModel):
+    """JSON Resume work entry."""
+
+    name: str
+    position: str
+    location: Optional[str] = None
+    url: Optional[str] = None
+    startDate: str
+    endDate: Optional[str] = None
+    summary: Optional[str] = None
+    highlights: List[str] = []
+
+
+class ResumeEducation(BaseModel):
+    """JSON Resume education entry."""
+
+    institution: str
+    url: Optional[str] = None
+    area: Optional[str] = None
+    studyType: Optional[str] = None
+    startDate: Optional[str] = None
+    endDate: Optional[str] = None
+    score: Optional[str] = None
+    courses: List[str] = []
+    # Not part of the standard; written so exports round-trip.
+    location: Optional[str] = None
+
+
+class ResumeCertificate(BaseModel):
+    """JSON Resume certificates entry."""
+
+    name: str
+    date: Optional[str] = None
+    url: Optional[str] = None
+    issuer: str = ""
+    # Not part of the standard; written so exports round-trip.
+    credentialId: Optional[str] = None
+
+
+class ResumeProject(BaseModel):
+    """JSON Resume projects entry."""
+
+    name: str
+    description: Optional[str] = None
+    highlights: List[str] = []
+    keywords: List[str] = []
+    startDate: Optional[str] = None
+    endDate: Optional[str] = None
+    url: Optional[str] = None
+
+
+class ResumeSkill(BaseModel):
+    """JSON Resume skills entry."""
+
+    name: Optional[str] = None
+    level: Optional[str] = None
+    keywords: List[str] = []
+
+
+class JSONResume(BaseModel):
+    """A JSON Resume document."""
+
+    basics: ResumeBasics
+    work: List[ResumeWork] = []
+    education: List[ResumeEducation] = []
+    certificates: List[ResumeCertificate] = []
+    projects: List[ResumeProject] = []
+    skills: List[ResumeSkill] = []
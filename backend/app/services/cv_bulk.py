@@ -0,0 +1,102 @@
+"""Bulk export of many CVs as one streamed ZIP archive."""
+import logging
+import zipfile
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Tuple
+
+from ..core.config import settings
+from ..core.workers import ProcessPool
+from .cv_layout import CVLayout, compile_layout
+from .exporters import EXPORTERS, ChunkSink, export_cache
+from .pdf_renderer import _render_pdf
+from .render_cache import cv_content_hash
+
+logger = logging.getLogger(__name__)
+
+BULK_FORMATS = ("pdf", *EXPORTERS)
+
+# Formats that are compressed already and gain nothing from deflate.
+_PRECOMPRESSED = ("pdf", "docx")
+
+
+def render_document(format: str, layout: CVLayout) -> bytes:
+    """Render a compiled CV layout in any export format. Runs inside a pool worker."""
+    if format == "pdf":
+        return _render_pdf(layout)
+    return b"".join(EXPORTERS[format].render(layout))
+
+
+def archive_name(user_id: int, cv_data: Dict[str, Any], extension: str) -> str:
+    """File name of a CV inside the archive, unique per user."""
+    profile = cv_data["profile"]
+    name = f"{user_id}_CV_{profile['first_name']}_{profile['last_name']}.{extension}"
+    return name.replace(" ", "_").replace("/", "_")
+
+
+def stream_cv_archive(
+    cvs: Iterable[Tuple[int, Dict[str, Any]]], format: str
+) -> Iterator[bytes]:
+    """Render CVs on the bulk pool and stream them as a ZIP archive.
+
+    ``cvs`` yields (user id, CV data) pairs and is consumed lazily. A few
+    renders per worker are kept in flight; each finished document is
+    written to the archive and sent right away, so memory stays flat
+    however many CVs are exported. Only the ZIP central directory, a few
+    hundred bytes per file, is held until the end. Documents already in
+    the render cache are not rendered again. CVs that fail to render are
+    listed in errors.txt instead of aborting the archive.
+    """
+    extension = "pdf" if format == "pdf" else EXPORTERS[format].extension
+    compression = zipfile.ZIP_STORED if format in _PRECOMPRESSED else zipfile.ZIP_DEFLATED
+    window = settings.BULK_EXPORT_WORKERS * 4
+    pending: Deque[Tuple[str, Future]] = deque()
+    errors: List[str] = []
+    sink = ChunkSink()
+
+    def write_next(archive: zipfile.ZipFile) -> bytes:
+        name, future = pending.popleft()
+        try:
+            archive.writestr(name, future.result(timeout=settings.PDF_RENDER_TIMEOUT))
+        except Exception as e:
+            logger.warning("Bulk export of %s failed: %s", name, e)
+            errors.append(f"{name}: {e}")
+        return sink.drain()
+
+    try:
+        with zipfile.ZipFile(sink, "w", compression=compression) as archive:
+            for user_id, cv_data in cvs:
+                content_hash = cv_content_hash(cv_data)
+                cached_path = export_cache.get(content_hash, extension)
+                if cached_path:
+                    future = Future()
+                    with open(cached_path, "rb") as cached_file:
+                        future.set_result(cached_file.read())
+                else:
+                    # Compiled directly: bulk layouts would only evict hot
+                    # entries from the shared layout cache.
+                    future = bulk_pool.submit(render_document, format, compile_layout(cv_data))
+                pending.append((archive_name(user_id, cv_data, extension), future))
+
+                while pending and (len(pending) >= window or pending[0][1].done()):
+                    data = write_next(archive)
+                    if data:
+                        yield data
+
+            while pending:
+                data = write_next(archive)
+                if data:
+                    yield data
+            if errors:
+                archive.writestr("errors.txt", "\n".join(errors) + "\n")
+        yield sink.drain()
+    finally:
+        # The client went away or reading CVs failed; drop queued renders
+        # and release whatever the CV source holds, such as its session.
+        for _, future in pending:
+            future.cancel()
+        if hasattr(cvs, "close"):
+            cvs.close()
+
+
+bulk_pool = ProcessPool(max_workers=settings.BULK_EXPORT_WORKERS)
@@ -0,0 +1,105 @@
+"""Bulk reads of CV data straight from the tables.
+
+Used by the admin exports and dump_cv_data.py. Rows are fetched as plain
+tuples in profile-id batches and assembled into the same dicts that
+GET /cv/data serves, without building ORM objects on the way.
+"""
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models import Certification, Education, Experience, Profile, Project, Skills, User
+
+PROFILE_FIELDS = ("first_name", "last_name", "email", "phone", "location", "linkedin", "summary")
+
+# CV data key, model and the columns it serializes, in CV data order.
+SECTION_FIELDS = (
+    ("education", Education,
+     ("degree", "institution", "location", "start_date", "end_date", "details")),
+    ("experience", Experience,
+     ("company", "role", "location", "start_date", "end_date", "bullets")),
+    ("certifications", Certification, ("name", "issuer", "date", "credential_id", "url")),
+    ("projects", Project, ("name", "impact", "technologies", "url")),
+)
+SKILL_FIELDS = ("languages", "tools", "methods")
+
+# JSON list columns, served as [] when NULL.
+LIST_FIELDS = frozenset(("details", "bullets", "technologies", *SKILL_FIELDS))
+
+
+def _row_dict(fields: Tuple[str, ...], values: Iterable[Any]) -> Dict[str, Any]:
+    item = dict(zip(fields, values))
+    for field in LIST_FIELDS.intersection(item):
+        if item[field] is None:
+            item[field] = []
+    return item
+
+
+def iter_cv_data(
+    user_ids: Optional[List[int]] = None,
+    active_only: bool = False,
+    batch_size: Optional[int] = None,
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (user id, CV data) for every profile, in profile id order.
+
+    Profiles are read through a server-side cursor ``batch_size`` at a
+    time (BULK_EXPORT_BATCH_SIZE by default). Every batch then costs one
+    query per section table, whatever the number of entries, and nothing
+    is kept once its CVs are yielded, so memory stays constant. Opens its
+    own session, as callers stream the results past the request's.
+
+    Args:
+        user_ids: Only these users; every user when omitted
+        active_only: Skip profiles of deactivated users
+        batch_size: Profiles per batch
+    """
+    query = (
+        select(Profile.id, Profile.user_id, *(getattr(Profile, f) for f in PROFILE_FIELDS))
+        .order_by(Profile.id)
+        .execution_options(yield_per=batch_size or settings.BULK_EXPORT_BATCH_SIZE)
+    )
+    if active_only:
+        query = query.join(User, User.id == Profile.user_id).where(User.is_active.is_(True))
+    if user_ids:
+        query = query.where(Profile.user_id.in_(user_ids))
+
+    with SessionLocal() as db:
+        for rows in db.execute(query).partitions():
+            profile_ids = [row[0] for row in rows]
+            sections = {
+                profile_id: {key: [] for key, _, _ in SECTION_FIELDS}
+                for profile_id in profile_ids
+            }
+            for key, model, fields in SECTION_FIELDS:
+                entries = db.execute(
+                    select(model.profile_id, *(getattr(model, f) for f in fields))
+                    .where(model.profile_id.in_(profile_ids))
+                    .order_by(model.profile_id, model.id)
+                )
+                for profile_id, *values in entries:
+                    sections[profile_id][key].append(_row_dict(fields, values))
+            skills = {
+                profile_id: _row_dict(SKILL_FIELDS, values)
+                for profile_id, *values in db.execute(
+                    select(Skills.profile_id, *(getattr(Skills, f) for f in SKILL_FIELDS))
+                    .where(Skills.profile_id.in_(profile_ids))
+                )
+            }
+
+            for profile_id, user_id, *values in rows:
+                yield user_id, {
+                    "profile": dict(zip(PROFILE_FIELDS, values)),
+                    **sections.pop(profile_id),
+                    "skills": skills.get(profile_id),
+                }
+
+
+def ndjson_lines(cvs: Iterable[Tuple[int, Dict[str, Any]]]) -> Iterator[str]:
+    """One JSON object per CV and line: the user id plus the CV data."""
+    for user_id, cv_data in cvs:
+        yield json.dumps(
+            {"user_id": user_id, **cv_data}, ensure_ascii=False, separators=(",", ":")
+        ) + "\n"
@@ -0,0 +1,266 @@
+"""Bulk import of CVs from newline-delimited JSON.
+
+Each line is a CVImportRecord: the CV data served by /cv/data, plus an
+optional account email and bcrypt hash. Lines are validated and inserted
+in batches, with one multi-row INSERT per table and one commit per batch,
+so importing a record costs no password hashing and no per-record round
+trips. Every committed batch is a checkpoint: an interrupted import
+resumes by skipping the lines already handled.
+"""
+import json
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..core.security import UNUSABLE_PASSWORD
+from ..models import Certification, Education, Experience, Profile, Project, Skills, User
+from ..schemas import CVImportRecord
+
+# Built once; validating a whole batch in one call stays in pydantic-core.
+RECORD_ADAPTER = TypeAdapter(CVImportRecord)
+BATCH_ADAPTER = TypeAdapter(List[CVImportRecord])
+
+SECTION_MODELS = (
+    ("education", Education),
+    ("experience", Experience),
+    ("certifications", Certification),
+    ("projects", Project),
+)
+
+# A validated record and the line it came from.
+NumberedRecord = Tuple[int, CVImportRecord]
+
+
+@dataclass
+class ImportResult:
+    """Progress of an import. ``checkpoint`` lines have been fully handled."""
+
+    checkpoint: int = 0
+    imported: int = 0
+    skipped: int = 0  # accounts that already existed
+    failed: int = 0
+    # The first IMPORT_MAX_REPORTED_ERRORS failures, as {"line", "error"}.
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _error(line: int, error: Any) -> Dict[str, Any]:
+    if isinstance(error, ValidationError):
+        error = "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'record'}: {detail['msg']}"
+            for detail in error.errors(include_url=False)
+        )
+    return {"line": line, "error": str(error)}
+
+
+def validate_batch(
+    lines: List[Tuple[int, bytes]]
+) -> Tuple[List[NumberedRecord], List[Dict[str, Any]]]:
+    """Validate numbered NDJSON lines into records and per-line errors.
+
+    The batch is parsed as one JSON array in a single call; only a batch
+    with a bad line falls back to validating its lines one by one.
+    """
+    try:
+        records = BATCH_ADAPTER.validate_json(b"[" + b",".join(line for _, line in lines) + b"]")
+        # A line holding several comma-separated objects would shift the rest.
+        if len(records) == len(lines):
+            return [(number, record) for (number, _), record in zip(lines, records)], []
+    except ValidationError:
+        pass
+
+    valid, errors = [], []
+    for number, line in lines:
+        try:
+            valid.append((number, RECORD_ADAPTER.validate_json(line)))
+        except ValidationError as e:
+            errors.append(_error(number, e))
+    return valid, errors
+
+
+def _account_email(record: CVImportRecord) -> str:
+    return record.account_email or record.profile.email
+
+
+def insert_records(db: Session, records: List[CVImportRecord]) -> None:
+    """Insert users, profiles and sections of records with one INSERT per table.
+
+    The statements target the tables, skipping the ORM's bulk-insert
+    bookkeeping. New ids are matched back through the unique email and
+    user id rather than by row order, which not every backend can return
+    in a batch.
+    """
+    user_ids = dict(
+        db.execute(
+            insert(User.__table__).returning(User.email, User.id),
+            [
+                {
+                    "email": _account_email(record),
+                    "hashed_password": record.hashed_password or UNUSABLE_PASSWORD,
+                    "is_active": True,
+                }
+                for record in records
+            ],
+        ).all()
+    )
+    user_ids = [user_ids[_account_email(record)] for record in records]
+    profile_ids = dict(
+        db.execute(
+            insert(Profile.__table__).returning(Profile.user_id, Profile.id),
+            [
+                {"user_id": user_id, **record.profile.model_dump()}
+                for user_id, record in zip(user_ids, records)
+            ],
+        ).all()
+    )
+    profile_ids = [profile_ids[user_id] for user_id in user_ids]
+
+    for key, model in SECTION_MODELS:
+        rows = [
+            {"profile_id": profile_id, **item.model_dump()}
+            for profile_id, record in zip(profile_ids, records)
+            for item in getattr(record, key)
+        ]
+        if rows:
+            db.execute(insert(model.__table__), rows)
+    skills = [
+        {"profile_id": profile_id, **record.skills.model_dump()}
+        for profile_id, record in zip(profile_ids, records)
+        if record.skills is not None
+    ]
+    if skills:
+        db.execute(insert(Skills.__table__), skills)
+
+
+def import_batch(
+    db: Session, records: List[NumberedRecord]
+) -> Tuple[int, int, List[Dict[str, Any]]]:
+    """Insert a batch of records and commit, returning (imported, skipped, errors).
+
+    Accounts that already exist are skipped, so re-running an import is
+    safe. A batch that still hits a constraint is retried record by
+    record to pin the failure on the offending lines.
+    """
+    emails = [_account_email(record) for _, record in records]
+    existing = set(db.scalars(select(User.email).where(User.email.in_(emails))))
+    fresh, errors, seen = [], [], set()
+    for number, record in records:
+        email = _account_email(record)
+        if email in existing:
+            continue
+        if email in seen:
+            errors.append(_error(number, f"duplicate account {email} in the same batch"))
+            continue
+        seen.add(email)
+        fresh.append((number, record))
+    skipped = len(records) - len(fresh) - len(errors)
+
+    try:
+        insert_records(db, [record for _, record in fresh])
+        db.commit()
+        return len(fresh), skipped, errors
+    except IntegrityError:
+        db.rollback()
+
+    imported = 0
+    for number, record in fresh:
+        try:
+            insert_records(db, [record])
+            db.commit()
+            imported += 1
+        except IntegrityError as e:
+            db.rollback()
+            errors.append(_error(number, e.orig))
+    return imported, skipped, errors
+
+
+def iter_import_cvs(
+    lines: Iterable[bytes],
+    start: int = 0,
+    batch_size: Optional[int] = None,
+) -> Iterator[Tuple[ImportResult, List[Dict[str, Any]]]]:
+    """Import CVs from NDJSON lines, yielding after every committed batch.
+
+    Each step yields the running result and that batch's errors, so a
+    caller can report progress or save the checkpoint before the next
+    batch starts. Closing the iterator stops the import at the last
+    committed batch.
+
+    Args:
+        lines: NDJSON lines, e.g. an open file
+        start: Lines to skip, the checkpoint of an interrupted import
+        batch_size: Lines per batch; IMPORT_BATCH_SIZE by default
+    """
+    batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+    result = ImportResult(checkpoint=start)
+    numbered = enumerate(islice(lines, start, None), start=start + 1)
+
+    with SessionLocal() as db:
+        while True:
+            chunk = list(islice(numbered, batch_size))
+            if not chunk:
+                break
+            records, errors = validate_batch(
+                [(number, line) for number, line in chunk if line.strip()]
+            )
+            if records:
+                imported, skipped, insert_errors = import_batch(db, records)
+                result.imported += imported
+                result.skipped += skipped
+                errors.extend(insert_errors)
+
+            errors.sort(key=lambda error: error["line"])
+            result.failed += len(errors)
+            room = settings.IMPORT_MAX_REPORTED_ERRORS - len(result.errors)
+            result.errors.extend(errors[:max(room, 0)])
+            result.checkpoint = chunk[-1][0]
+            yield result, errors
+
+
+def import_cvs(
+    lines: Iterable[bytes],
+    start: int = 0,
+    batch_size: Optional[int] = None,
+    on_batch: Optional[Callable[[ImportResult, List[Dict[str, Any]]], None]] = None,
+) -> ImportResult:
+    """Import CVs from NDJSON lines, committing every ``batch_size`` lines.
+
+    Args:
+        lines: NDJSON lines, e.g. an open file
+        start: Lines to skip, the checkpoint of an interrupted import
+        batch_size: Lines per batch; IMPORT_BATCH_SIZE by default
+        on_batch: Called after each committed batch with the running
+            result and that batch's errors, e.g. to save a checkpoint
+
+    Returns:
+        The result, whose checkpoint is the number of lines handled
+    """
+    result = ImportResult(checkpoint=start)
+    for result, errors in iter_import_cvs(lines, start, batch_size):
+        if on_batch:
+            on_batch(result, errors)
+    return result
+
+
+def progress_lines(
+    progress: Iterable[Tuple[ImportResult, List[Dict[str, Any]]]], start: int = 0
+) -> Iterator[bytes]:
+    """Report an import as NDJSON, one line per committed batch.
+
+    Batch lines hold the running counts, the checkpoint and that batch's
+    errors. The last line is the final result with ``"done": true``; a
+    stream that ends without it was interrupted, and the last checkpoint
+    seen is where to resume.
+    """
+    result = ImportResult(checkpoint=start)
+    for result, errors in progress:
+        line = {**asdict(result), "errors": errors}
+        yield (json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n").encode()
+    line = {"done": True, **asdict(result)}
+    yield (json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n").encode()
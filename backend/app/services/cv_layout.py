@@ -0,0 +1,224 @@
+"""The Harvard CV layout as a tree shared by every renderer.
+
+The CV data dict is compiled once into sections of entries, each a list
+of styled paragraphs (blocks) made of text runs. Renderers only map
+block styles to their own formatting; which fields appear, in what order
+and how they are joined is decided here. Compiled layouts are immutable
+and cached by CV content hash.
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.cache import cv_layout_cache
+from .render_cache import cv_content_hash
+
+# Block styles. They double as CSS classes in cv.html (``cv-<style>``).
+NAME = "name"
+CONTACT = "contact"
+SUMMARY = "summary"
+ENTRY_HEADER = "entry-header"
+DEGREE = "degree"
+ROLE = "role"
+BULLET = "bullet"
+IMPACT = "impact"
+TECHNOLOGIES = "technologies"
+PROJECT_URL = "project-url"
+CREDENTIAL = "credential"
+CERT_URL = "cert-url"
+SKILL_CATEGORY = "skill-category"
+
+# Sections in the order of the Harvard template.
+SECTION_TITLES = (
+    ("education", "Education"),
+    ("experience", "Experience"),
+    ("projects", "Projects"),
+    ("certifications", "Certifications"),
+)
+
+SKILL_LABELS = (("languages", "Languages"), ("tools", "Tools"), ("methods", "Methods"))
+
+
+@dataclass(frozen=True)
+class Run:
+    """A piece of text with uniform formatting."""
+
+    text: str
+    bold: bool = False
+    italic: bool = False
+    link: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Block:
+    """One paragraph. ``aside`` is shown right-aligned, e.g. an entry's dates."""
+
+    style: str
+    runs: Tuple[Run, ...]
+    aside: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        return "".join(run.text for run in self.runs)
+
+
+@dataclass(frozen=True)
+class Entry:
+    """Blocks that belong together, such as one job with its bullets."""
+
+    blocks: Tuple[Block, ...]
+
+
+@dataclass(frozen=True)
+class Section:
+    """A part of the CV. Only titled sections get a heading."""
+
+    key: str
+    title: Optional[str]
+    entries: Tuple[Entry, ...]
+
+
+@dataclass(frozen=True)
+class CVLayout:
+    """A compiled CV, ready to be rendered in any format."""
+
+    title: str
+    sections: Tuple[Section, ...]
+
+    def section(self, key: str) -> Optional[Section]:
+        return next((section for section in self.sections if section.key == key), None)
+
+
+def format_date_range(start: Optional[str], end: Optional[str]) -> str:
+    """Format a date range the way the Harvard template does."""
+    if not start:
+        return ""
+    return f"{start} – {end or 'Present'}"
+
+
+def link_target(url: str) -> str:
+    """The URL to link to; entries like ``linkedin.com/in/x`` get https://."""
+    return url if re.match(r"[a-zA-Z][a-zA-Z0-9+.-]*:", url) else f"https://{url}"
+
+
+def _block(style: str, *runs: Run, aside: Optional[str] = None) -> Block:
+    return Block(style, tuple(run for run in runs if run.text), aside or None)
+
+
+def _header(title: Optional[str], detail: Optional[str], aside: Optional[str] = None) -> Block:
+    """Bold title, then `` — detail`` when there is one."""
+    return _block(
+        ENTRY_HEADER,
+        Run(title or "", bold=True),
+        Run(f" — {detail}" if detail else ""),
+        aside=aside,
+    )
+
+
+def _education(item: Dict[str, Any]) -> List[Block]:
+    blocks = [_header(
+        item.get("institution"), item.get("location"),
+        format_date_range(item.get("start_date"), item.get("end_date")),
+    )]
+    if item.get("degree"):
+        blocks.append(_block(DEGREE, Run(item["degree"], italic=True)))
+    blocks.extend(_block(BULLET, Run(detail)) for detail in item.get("details") or [])
+    return blocks
+
+
+def _experience(item: Dict[str, Any]) -> List[Block]:
+    blocks = [_header(
+        item.get("company"), item.get("location"),
+        format_date_range(item.get("start_date"), item.get("end_date")),
+    )]
+    if item.get("role"):
+        blocks.append(_block(ROLE, Run(item["role"], italic=True)))
+    blocks.extend(_block(BULLET, Run(bullet)) for bullet in item.get("bullets") or [])
+    return blocks
+
+
+def _project(item: Dict[str, Any]) -> List[Block]:
+    blocks = [_header(item.get("name"), None)]
+    if item.get("impact"):
+        blocks.append(_block(IMPACT, Run(item["impact"])))
+    if item.get("technologies"):
+        blocks.append(_block(
+            TECHNOLOGIES,
+            Run("Technologies:", italic=True),
+            Run(f" {', '.join(item['technologies'])}"),
+        ))
+    if item.get("url"):
+        blocks.append(_block(PROJECT_URL, Run(item["url"], link=link_target(item["url"]))))
+    return blocks
+
+
+def _certification(item: Dict[str, Any]) -> List[Block]:
+    blocks = [_header(item.get("name"), item.get("issuer"), item.get("date"))]
+    if item.get("credential_id"):
+        blocks.append(_block(CREDENTIAL, Run(f"Credential ID: {item['credential_id']}")))
+    if item.get("url"):
+        blocks.append(_block(CERT_URL, Run(item["url"], link=link_target(item["url"]))))
+    return blocks
+
+
+_ENTRY_BUILDERS = {
+    "education": _education,
+    "experience": _experience,
+    "projects": _project,
+    "certifications": _certification,
+}
+
+
+def compile_layout(cv_data: Dict[str, Any]) -> CVLayout:
+    """Compile a CV data dict, as served by /cv/data, into its layout."""
+    profile = cv_data.get("profile") or {}
+    name = f"{profile.get('first_name') or ''} {profile.get('last_name') or ''}".strip()
+    contact: List[Run] = []
+    for key in ("email", "phone", "location", "linkedin"):
+        if profile.get(key):
+            if contact:
+                contact.append(Run(" • "))
+            link = link_target(profile[key]) if key == "linkedin" else None
+            contact.append(Run(profile[key], link=link))
+
+    header = [_block(NAME, Run(name, bold=True))]
+    if contact:
+        header.append(_block(CONTACT, *contact))
+    sections = [Section("header", None, (Entry(tuple(header)),))]
+
+    if profile.get("summary"):
+        sections.append(Section(
+            "summary", None, (Entry((_block(SUMMARY, Run(profile["summary"])),)),)
+        ))
+
+    for key, title in SECTION_TITLES:
+        items = cv_data.get(key) or []
+        if items:
+            sections.append(Section(key, title, tuple(
+                Entry(tuple(_ENTRY_BUILDERS[key](item))) for item in items
+            )))
+
+    skills = cv_data.get("skills") or {}
+    skill_lines = tuple(
+        _block(SKILL_CATEGORY, Run(f"{label}:", bold=True), Run(f" {', '.join(skills[key])}"))
+        for key, label in SKILL_LABELS
+        if skills.get(key)
+    )
+    if skill_lines:
+        sections.append(Section("skills", "Skills", (Entry(skill_lines),)))
+
+    title = f"CV - {profile.get('first_name') or 'User'} {profile.get('last_name') or ''}".strip()
+    return CVLayout(title=title, sections=tuple(sections))
+
+
+def get_layout(cv_data: Dict[str, Any], content_hash: Optional[str] = None) -> CVLayout:
+    """Return the compiled layout of a CV, compiling it only on a cache miss.
+
+    Pass ``content_hash`` when the caller already computed it.
+    """
+    content_hash = content_hash or cv_content_hash(cv_data)
+    layout = cv_layout_cache.get(content_hash)
+    if layout is None:
+        layout = compile_layout(cv_data)
+        cv_layout_cache.set(content_hash, layout)
+    return layout
@@ -0,0 +1,228 @@
+"""Background Google Docs exports tracked in the export_jobs table."""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from google.oauth2.credentials import Credentials
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models import ExportJob, GoogleDocExport
+from .google_credentials import GoogleTokenStore, google_tokens
+from .google_docs import GoogleDocsService
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+class ExportJobQueue:
+    """Runs Google Docs exports on a thread pool and records their progress.
+
+    Jobs live in the database with the CV snapshot they export, so
+    clients can poll any API process and jobs outlive restarts. Each job
+    fetches the user's credentials from the token store when it starts.
+    Queued jobs are picked up again when a process starts (see resume);
+    a job whose process went away stops updating and, once it exceeds
+    EXPORT_JOB_TIMEOUT, is queued again by whichever process notices,
+    up to EXPORT_JOB_MAX_ATTEMPTS runs.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        session_factory: Callable[[], Session] = SessionLocal,
+        docs_service_factory: Callable[[Credentials], Any] = GoogleDocsService,
+        token_store: GoogleTokenStore = google_tokens,
+    ):
+        self.max_workers = max_workers
+        self.session_factory = session_factory
+        self.token_store = token_store
+        # Swappable so tests can run exports against a fake Docs API.
+        self.docs_service_factory = docs_service_factory
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="export"
+                )
+            return self._executor
+
+    def enqueue(self, job: ExportJob) -> None:
+        """Schedule a job row already committed with its payload."""
+        self._get_executor().submit(self._run, job.id)
+
+    def resume(self) -> None:
+        """Pick up the jobs left unfinished when a process stopped.
+
+        Queued jobs are scheduled at once; running ones may belong to a
+        live process, so they are only taken over once stale. Another
+        process scheduling the same job is harmless: only one can start it.
+        """
+        with self.session_factory() as db:
+            jobs = db.query(ExportJob).filter(ExportJob.status.in_(ACTIVE_STATUSES)).all()
+            for job in jobs:
+                if job.status == "queued":
+                    self.enqueue(job)
+                else:
+                    self.reclaim_if_stale(job, db)
+        if jobs:
+            logger.info("Resumed %d unfinished export jobs", len(jobs))
+
+    def reclaim_if_stale(self, job: ExportJob, db: Session) -> ExportJob:
+        """Queue a job again if the process running it went away.
+
+        After EXPORT_JOB_MAX_ATTEMPTS runs, or without a payload to run
+        from, the job is marked failed instead.
+        """
+        if not is_stale(job):
+            return job
+        # Only if no one changed it since it was read: the worker may have
+        # just completed it, or another process already took it over.
+        unchanged = db.query(ExportJob).filter(
+            ExportJob.id == job.id,
+            ExportJob.status == job.status,
+            ExportJob.attempts == job.attempts,
+        )
+        if job.payload is None or job.attempts >= settings.EXPORT_JOB_MAX_ATTEMPTS:
+            unchanged.update(
+                {"status": "failed", "error": "Export was interrupted, please try again"},
+                synchronize_session=False,
+            )
+            db.commit()
+        else:
+            requeued = unchanged.update(
+                {"status": "queued", "progress": 0}, synchronize_session=False
+            )
+            db.commit()
+            if requeued:
+                logger.info("Export job %s stalled, queued again", job.id)
+                self.enqueue(job)
+        db.refresh(job)
+        return job
+
+    def _update(self, job_id: int, **values: Any) -> None:
+        """Write job fields in a short transaction of their own."""
+        with self.session_factory() as db:
+            db.query(ExportJob).filter(ExportJob.id == job_id).update(
+                values, synchronize_session=False
+            )
+            db.commit()
+
+    def _start(self, job_id: int) -> Optional[ExportJob]:
+        """Move a job from queued to running; None if it is no longer queued.
+
+        A job can be scheduled more than once, by several processes or
+        when it was taken over while still waiting in an executor; only
+        the first to start it runs it.
+        """
+        with self.session_factory() as db:
+            started = (
+                db.query(ExportJob)
+                .filter(ExportJob.id == job_id, ExportJob.status == "queued")
+                .update(
+                    {"status": "running", "progress": 10, "attempts": ExportJob.attempts + 1},
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            return db.get(ExportJob, job_id) if started == 1 else None
+
+    def _load_previous(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Return the user's last exported document, if any."""
+        with self.session_factory() as db:
+            export = (
+                db.query(GoogleDocExport).filter(GoogleDocExport.user_id == user_id).first()
+            )
+            if export is None:
+                return None
+            return {
+                "document_id": export.document_id,
+                "document_url": f"https://docs.google.com/document/d/{export.document_id}/edit",
+                "revision_id": export.revision_id,
+                "segments": export.segments,
+            }
+
+    def _save_export(self, user_id: int, result: Dict[str, Any]) -> None:
+        """Remember the exported document so the next export can update it."""
+        with self.session_factory() as db:
+            export = (
+                db.query(GoogleDocExport).filter(GoogleDocExport.user_id == user_id).first()
+            )
+            if export is None:
+                export = GoogleDocExport(user_id=user_id)
+                db.add(export)
+            export.document_id = result["document_id"]
+            export.revision_id = result["revision_id"]
+            export.segments = result["segments"]
+            db.commit()
+
+    def _run(self, job_id: int) -> None:
+        job = self._start(job_id)
+        if job is None:
+            logger.info("Export job %s is no longer queued, skipping it", job_id)
+            return
+        user_id, cv_data = job.user_id, job.payload
+        try:
+            with self.session_factory() as db:
+                credentials = self.token_store.get(user_id, db)
+            service = self.docs_service_factory(credentials)
+            result = service.export_cv_document(
+                cv_data,
+                previous=self._load_previous(user_id),
+                on_progress=lambda progress: self._update(job_id, progress=progress),
+            )
+            self._save_export(user_id, result)
+        except Exception as e:
+            logger.warning("Export job %s failed: %s", job_id, e)
+            self._update(job_id, status="failed", error=str(e))
+            return
+
+        self._update(
+            job_id,
+            status="succeeded",
+            progress=100,
+            document_id=result["document_id"],
+            document_url=result["document_url"],
+        )
+
+    def shutdown(self) -> None:
+        """Stop accepting jobs; those still queued are resumed by the next process."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+def is_stale(job: ExportJob) -> bool:
+    """Whether an unfinished job has stopped reporting progress."""
+    if job.status not in ACTIVE_STATUSES or job.updated_at is None:
+        return False
+    updated_at = job.updated_at
+    if updated_at.tzinfo is None:
+        # SQLite hands back naive UTC timestamps.
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    timeout = timedelta(seconds=settings.EXPORT_JOB_TIMEOUT)
+    return datetime.now(timezone.utc) - updated_at > timeout
+
+
+def get_active_job(user_id: int, db: Session) -> Optional[ExportJob]:
+    """Return the user's unfinished export, queueing it again if it stalled."""
+    job = (
+        db.query(ExportJob)
+        .filter(ExportJob.user_id == user_id, ExportJob.status.in_(ACTIVE_STATUSES))
+        .order_by(ExportJob.id.desc())
+        .first()
+    )
+    if job is None or export_queue.reclaim_if_stale(job, db).status not in ACTIVE_STATUSES:
+        return None
+    return job
+
+
+export_queue = ExportJobQueue(max_workers=settings.EXPORT_WORKERS)
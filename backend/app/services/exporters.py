@@ -0,0 +1,397 @@
+"""Streaming CV exporters for DOCX, Markdown, plain text and HTML.
+
+Each exporter renders a compiled CV layout (see cv_layout) into an
+iterator of byte chunks, emitted section by section as they are
+generated, so a response can be streamed without building the whole
+document in memory first.
+"""
+import functools
+import io
+import os
+import re
+import zipfile
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+from ..core.config import settings
+from . import cv_layout
+from .cv_layout import Block, CVLayout, Run
+from .render_cache import render_cache
+
+
+@dataclass(frozen=True)
+class Exporter:
+    """A registered export format."""
+
+    name: str
+    extension: str
+    media_type: str
+    render: Callable[[CVLayout], Iterator[bytes]]
+
+
+EXPORTERS: Dict[str, Exporter] = {}
+
+
+def register_exporter(name: str, extension: str, media_type: str):
+    """Register a generator of byte chunks as the exporter for a format."""
+    def decorator(render: Callable[[CVLayout], Iterator[bytes]]):
+        EXPORTERS[name] = Exporter(name, extension, media_type, render)
+        return render
+    return decorator
+
+
+# Generated pieces are coalesced up to this size before being sent.
+CHUNK_SIZE = 16 * 1024
+
+
+def encode_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Encode text pieces, yielding them in chunks of about CHUNK_SIZE."""
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        buffer.append(data)
+        size += len(data)
+        if size >= CHUNK_SIZE:
+            yield b"".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+# ----- Plain text --------------------------------------------------------
+
+def _text_line(block: Block) -> str:
+    line = block.text
+    if block.aside:
+        line += f" | {block.aside}"
+    if block.style == cv_layout.BULLET:
+        line = f"- {line}"
+    return line
+
+
+@register_exporter("txt", "txt", "text/plain; charset=utf-8")
+def render_text(layout: CVLayout) -> Iterator[bytes]:
+    """Plain text with no columns or decoration, for applicant tracking systems."""
+    return encode_chunks(_text_chunks(layout))
+
+
+def _text_chunks(layout: CVLayout) -> Iterator[str]:
+    for section in layout.sections:
+        if section.key == "header":
+            for block in section.entries[0].blocks:
+                if block.style == cv_layout.NAME:
+                    yield block.text.upper() + "\n"
+                else:
+                    yield block.text.replace(" • ", " | ") + "\n"
+            continue
+        yield "\n"
+        if section.title:
+            yield section.title.upper() + "\n"
+        for entry in section.entries:
+            yield "\n".join(_text_line(block) for block in entry.blocks) + "\n"
+            if section.title and section.key != "skills":
+                yield "\n"
+
+
+# ----- Markdown ----------------------------------------------------------
+
+_MARKDOWN_SPECIAL = re.compile(r"([\\`*_\[\]<>#])")
+
+# Markers that open a block (list item, setext underline, code fence) only
+# at the start of a line; indentation there would open a code block.
+_MARKDOWN_LINE_START = re.compile(r"^[ \t]*(?:([-+=~])|(\d+)([.)]))?", re.MULTILINE)
+
+
+def _md(text: Optional[str]) -> str:
+    return _MARKDOWN_SPECIAL.sub(r"\\\1", text or "")
+
+
+def _md_line_start(match: re.Match) -> str:
+    marker, number, delimiter = match.groups()
+    if marker:
+        return f"\\{marker}"
+    if number:
+        return f"{number}\\{delimiter}"
+    return ""
+
+
+def _md_run(run: Run) -> str:
+    # Emphasis markers must hug the text, so surrounding spaces stay outside.
+    stripped = run.text.strip()
+    if not stripped:
+        return run.text
+    text = _md(stripped)
+    if run.link:
+        text = f"[{text}](<{run.link}>)"
+    if run.italic:
+        text = f"*{text}*"
+    if run.bold:
+        text = f"**{text}**"
+    lead = run.text[:len(run.text) - len(run.text.lstrip())]
+    trail = run.text[len(run.text.rstrip()):]
+    return lead + text + trail
+
+
+def _md_block(block: Block) -> str:
+    line = "".join(_md_run(run) for run in block.runs)
+    if block.aside:
+        line += f" | {_md(block.aside)}"
+    # User text must not start a list or heading of its own, including
+    # on lines after a newline it contains.
+    return _MARKDOWN_LINE_START.sub(_md_line_start, line)
+
+
+@register_exporter("markdown", "md", "text/markdown; charset=utf-8")
+def render_markdown(layout: CVLayout) -> Iterator[bytes]:
+    """Markdown with one heading per section."""
+    return encode_chunks(_markdown_chunks(layout))
+
+
+def _markdown_chunks(layout: CVLayout) -> Iterator[str]:
+    for section in layout.sections:
+        if section.title:
+            yield f"## {section.title}\n\n"
+        for entry in section.entries:
+            lines, bullets = [], []
+            for block in entry.blocks:
+                if block.style == cv_layout.NAME:
+                    yield f"# {_md(block.text)}\n\n"
+                elif block.style in (cv_layout.BULLET, cv_layout.SKILL_CATEGORY):
+                    bullets.append(f"- {_md_block(block)}\n")
+                else:
+                    lines.append(_md_block(block))
+            # Two trailing spaces keep the entry's lines on separate rows.
+            if lines:
+                yield "  \n".join(lines) + "\n"
+            yield "".join(bullets) + "\n"
+
+
+# ----- HTML --------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def _html_template():
+    """The Harvard template plus its stylesheet, loaded once."""
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    templates_dir = os.path.abspath(settings.TEMPLATES_DIR)
+    env = Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=select_autoescape(["html"]),
+    )
+    with open(os.path.join(templates_dir, "cv.css"), encoding="utf-8") as css_file:
+        return env.get_template("cv.html"), css_file.read()
+
+
+@register_exporter("html", "html", "text/html; charset=utf-8")
+def render_html(layout: CVLayout) -> Iterator[bytes]:
+    """The PDF's Harvard template as a standalone page with inline styles."""
+    template, css = _html_template()
+    return encode_chunks(template.generate(layout=layout, inline_css=css))
+
+
+# ----- DOCX --------------------------------------------------------------
+
+_INVALID_XML = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Text width of a Letter page with 1" margins, in twentieths of a point.
+_TEXT_WIDTH = 9360
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+_PACKAGE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+_DOCUMENT_RELS_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+)
+_HYPERLINK_REL = (
+    '<Relationship Id="{id}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"'
+    ' Target={target} TargetMode="External"/>'
+)
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:docDefaults><w:rPrDefault><w:rPr>'
+    '<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman"/>'
+    '<w:sz w:val="22"/></w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="0" w:line="240" w:lineRule="auto"/></w:pPr></w:pPrDefault>'
+    '</w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Title"><w:name w:val="Title"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:jc w:val="center"/></w:pPr><w:rPr><w:b/><w:sz w:val="40"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:keepNext/>'
+    '<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="000000"/></w:pBdr>'
+    '<w:spacing w:before="240" w:after="60"/></w:pPr>'
+    '<w:rPr><w:b/><w:caps/><w:sz w:val="24"/></w:rPr></w:style>'
+    '<w:style w:type="character" w:styleId="Hyperlink"><w:name w:val="Hyperlink"/>'
+    '<w:rPr><w:color w:val="0563C1"/><w:u w:val="single"/></w:rPr></w:style>'
+    '</w:styles>'
+)
+_DOCUMENT_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><w:body>'
+)
+_DOCUMENT_END = (
+    '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" w:header="720" w:footer="720" w:gutter="0"/>'
+    '</w:sectPr></w:body></w:document>'
+)
+
+
+class DocxLinks:
+    """Hyperlink relationships of a document, one per distinct URL."""
+
+    def __init__(self):
+        self._ids: Dict[str, str] = {}
+
+    def rel_id(self, url: str) -> str:
+        # rId1 is the styles part.
+        return self._ids.setdefault(url, f"rId{len(self._ids) + 2}")
+
+    def rels_xml(self) -> str:
+        hyperlinks = "".join(
+            _HYPERLINK_REL.format(id=rel_id, target=quoteattr(_INVALID_XML.sub("", url)))
+            for url, rel_id in self._ids.items()
+        )
+        return f"{_DOCUMENT_RELS_START}{hyperlinks}</Relationships>"
+
+
+def _docx_paragraph(
+    runs: Iterable[Run],
+    style: Optional[str] = None,
+    align: Optional[str] = None,
+    right_text: Optional[str] = None,
+    indent: bool = False,
+    space_after: int = 0,
+    links: Optional[DocxLinks] = None,
+) -> str:
+    """One w:p element. ``right_text`` is pushed to the right margin with a tab.
+
+    Runs with a link become hyperlinks registered in ``links``.
+    """
+    properties = []
+    if style:
+        properties.append(f'<w:pStyle w:val="{style}"/>')
+    if right_text:
+        properties.append(f'<w:tabs><w:tab w:val="right" w:pos="{_TEXT_WIDTH}"/></w:tabs>')
+    if space_after:
+        properties.append(f'<w:spacing w:after="{space_after}"/>')
+    if indent:
+        properties.append('<w:ind w:left="360" w:hanging="216"/>')
+    if align:
+        properties.append(f'<w:jc w:val="{align}"/>')
+
+    xml = ["<w:p>"]
+    if properties:
+        xml.append(f"<w:pPr>{''.join(properties)}</w:pPr>")
+    for run in runs:
+        link = run.link and links is not None
+        style_xml = (
+            ('<w:rStyle w:val="Hyperlink"/>' if link else "")
+            + ("<w:b/>" if run.bold else "") + ("<w:i/>" if run.italic else "")
+        )
+        run_xml = (
+            f"<w:r>{f'<w:rPr>{style_xml}</w:rPr>' if style_xml else ''}"
+            f'<w:t xml:space="preserve">{escape(_INVALID_XML.sub("", run.text))}</w:t></w:r>'
+        )
+        if link:
+            run_xml = f'<w:hyperlink r:id="{links.rel_id(run.link)}">{run_xml}</w:hyperlink>'
+        xml.append(run_xml)
+    if right_text:
+        xml.append(f'<w:r><w:tab/><w:t>{escape(_INVALID_XML.sub("", right_text))}</w:t></w:r>')
+    xml.append("</w:p>")
+    return "".join(xml)
+
+
+def _docx_block(block: Block, links: DocxLinks) -> str:
+    if block.style == cv_layout.NAME:
+        # The Title style sets the weight and size.
+        return _docx_paragraph([Run(block.text)], style="Title")
+    if block.style == cv_layout.CONTACT:
+        return _docx_paragraph(block.runs, align="center", links=links)
+    if block.style == cv_layout.BULLET:
+        return _docx_paragraph((Run("• "), *block.runs), indent=True, links=links)
+    return _docx_paragraph(block.runs, right_text=block.aside, links=links)
+
+
+def _docx_body(layout: CVLayout, links: DocxLinks) -> Iterator[str]:
+    for section in layout.sections:
+        if section.key == "summary":
+            yield _docx_paragraph([], space_after=120)
+        if section.title:
+            yield _docx_paragraph([Run(section.title)], style="Heading1")
+        for entry in section.entries:
+            yield "".join(_docx_block(block, links) for block in entry.blocks)
+            if section.title and section.key != "skills":
+                # Space below the entry
+                yield _docx_paragraph([], space_after=60)
+
+
+class ChunkSink(io.RawIOBase):
+    """Write-only, unseekable stream that collects what zipfile writes to it."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+@register_exporter(
+    "docx", "docx",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+)
+def render_docx(layout: CVLayout) -> Iterator[bytes]:
+    """A Word document, zipped as it is written.
+
+    zipfile writes to an unseekable stream using data descriptors, so
+    each compressed piece can be sent as soon as it is produced. The
+    document's relationships, which list its hyperlinks, follow it.
+    """
+    sink = ChunkSink()
+    links = DocxLinks()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _PACKAGE_RELS)
+        archive.writestr("word/styles.xml", _STYLES)
+        yield sink.drain()
+        with archive.open("word/document.xml", "w") as document:
+            document.write(_DOCUMENT_START.encode("utf-8"))
+            for chunk in _docx_body(layout, links):
+                document.write(chunk.encode("utf-8"))
+                data = sink.drain()
+                if data:
+                    yield data
+            document.write(_DOCUMENT_END.encode("utf-8"))
+        archive.writestr("word/_rels/document.xml.rels", links.rels_xml())
+    yield sink.drain()
+
+
+# Exports share the PDF renders' cache and its size and age caps.
+export_cache = render_cache
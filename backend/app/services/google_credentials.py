@@ -0,0 +1,169 @@
+"""Per-user Google credentials, stored encrypted and cached in memory."""
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from cryptography.fernet import InvalidToken
+from google.auth.exceptions import RefreshError
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import Request
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..core.cache import TTLCache, google_token_cache
+from ..core.config import settings
+from ..core.security import decrypt_secret, encrypt_secret
+from ..models import GoogleCredential
+from .google_docs import get_http
+
+logger = logging.getLogger(__name__)
+
+
+class GoogleNotConnected(Exception):
+    """The user has no usable Google credentials and must authorize again."""
+
+
+class GoogleTokenStore:
+    """Hands out Google credentials with an access token that is still fresh.
+
+    Credentials live encrypted in the google_credentials table. Loaded
+    ones are cached in memory and reused until their access token gets
+    within GOOGLE_TOKEN_REFRESH_MARGIN of expiry, when they are refreshed
+    ahead of time so exports never start on a token about to lapse.
+    Refreshes run under a per-user lock: concurrent callers for the same
+    user wait for one refresh instead of each asking Google.
+    """
+
+    def __init__(self, cache: TTLCache, refresh_margin: int, lock_stripes: int = 64):
+        self.cache = cache
+        self.refresh_margin = timedelta(seconds=refresh_margin)
+        self._locks = [threading.Lock() for _ in range(lock_stripes)]
+
+    def _is_fresh(self, credentials: Credentials) -> bool:
+        # google-auth keeps expiry as naive UTC
+        return bool(
+            credentials.token
+            and credentials.expiry
+            and credentials.expiry - datetime.utcnow() > self.refresh_margin
+        )
+
+    def get(self, user_id: int, db: Session) -> Credentials:
+        """Return fresh credentials for a user, refreshing them if needed.
+
+        Raises:
+            GoogleNotConnected: If the user never authorized or revoked access
+        """
+        credentials = self.cache.get(user_id)
+        if credentials is not None and self._is_fresh(credentials):
+            return credentials
+
+        with self._locks[user_id % len(self._locks)]:
+            # Another thread may have refreshed while we waited.
+            credentials = self.cache.get(user_id)
+            if credentials is None or not self._is_fresh(credentials):
+                credentials = self._load(user_id, db)
+            if not self._is_fresh(credentials):
+                credentials = self._refresh(user_id, credentials, db)
+            self.cache.set(user_id, credentials)
+            return credentials
+
+    def save(self, user_id: int, credentials: Credentials, db: Session) -> None:
+        """Store credentials from a completed authorization and commit."""
+        row = db.query(GoogleCredential).filter(GoogleCredential.user_id == user_id).first()
+        if row is None:
+            row = GoogleCredential(user_id=user_id)
+            db.add(row)
+        elif credentials.refresh_token is None:
+            # Google only sends a refresh token on first consent; keep ours.
+            try:
+                refresh_token = json.loads(decrypt_secret(row.encrypted_tokens))["refresh_token"]
+            except InvalidToken:
+                refresh_token = None
+            credentials = self._build(
+                credentials.token, refresh_token, credentials.expiry, credentials.scopes
+            )
+        row.encrypted_tokens = self._encrypt(credentials)
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent callback stored the user's first credentials;
+            # the retry finds its row and updates it instead.
+            db.rollback()
+            return self.save(user_id, credentials, db)
+        self.cache.set(user_id, credentials)
+
+    def delete(self, user_id: int, db: Session) -> None:
+        """Forget a user's credentials and commit."""
+        self.cache.invalidate(user_id)
+        db.query(GoogleCredential).filter(GoogleCredential.user_id == user_id).delete(
+            synchronize_session=False
+        )
+        db.commit()
+
+    def is_connected(self, user_id: int, db: Session) -> bool:
+        """Whether the user has stored credentials, without refreshing them."""
+        if self.cache.get(user_id) is not None:
+            return True
+        return db.query(
+            db.query(GoogleCredential).filter(GoogleCredential.user_id == user_id).exists()
+        ).scalar()
+
+    def _load(self, user_id: int, db: Session) -> Credentials:
+        row = db.query(GoogleCredential).filter(GoogleCredential.user_id == user_id).first()
+        if row is None:
+            raise GoogleNotConnected("Google account is not connected")
+        try:
+            data = json.loads(decrypt_secret(row.encrypted_tokens))
+        except InvalidToken:
+            # Encrypted under a different key; the user has to authorize again.
+            logger.warning("Discarding undecryptable Google credentials of user %s", user_id)
+            self.delete(user_id, db)
+            raise GoogleNotConnected("Google account is not connected")
+        expiry = datetime.fromisoformat(data["expiry"]) if data.get("expiry") else None
+        return self._build(data["token"], data["refresh_token"], expiry, data.get("scopes"))
+
+    def _refresh(self, user_id: int, credentials: Credentials, db: Session) -> Credentials:
+        if not credentials.refresh_token:
+            raise GoogleNotConnected("Google access expired, please connect again")
+        try:
+            credentials.refresh(Request(get_http()))
+        except RefreshError as e:
+            if getattr(e, "retryable", False):
+                raise
+            # Revoked or expired grant: drop it so the user is asked again.
+            logger.info("Google refresh for user %s rejected: %s", user_id, e)
+            self.delete(user_id, db)
+            raise GoogleNotConnected("Google access was revoked, please connect again")
+        db.query(GoogleCredential).filter(GoogleCredential.user_id == user_id).update(
+            {"encrypted_tokens": self._encrypt(credentials)}, synchronize_session=False
+        )
+        db.commit()
+        return credentials
+
+    def _build(
+        self, token: Optional[str], refresh_token: Optional[str], expiry, scopes
+    ) -> Credentials:
+        return Credentials(
+            token=token,
+            refresh_token=refresh_token,
+            token_uri=settings.GOOGLE_TOKEN_URI,
+            client_id=settings.GOOGLE_CLIENT_ID,
+            client_secret=settings.GOOGLE_CLIENT_SECRET,
+            scopes=scopes,
+            expiry=expiry,
+        )
+
+    def _encrypt(self, credentials: Credentials) -> str:
+        return encrypt_secret(json.dumps({
+            "token": credentials.token,
+            "refresh_token": credentials.refresh_token,
+            "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
+            "scopes": list(credentials.scopes) if credentials.scopes else None,
+        }))
+
+
+google_tokens = GoogleTokenStore(
+    cache=google_token_cache, refresh_margin=settings.GOOGLE_TOKEN_REFRESH_MARGIN
+)
@@ -1,387 +1,406 @@
 """Google Docs service for CV export."""
-from typing import Dict, Any, Optional, List
+import copy
+import functools
+import hashlib
+import json
+import logging
+import threading
+from typing import Callable, Dict, Any, Optional, List, Tuple
+import httplib2
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import Resource, build
 from googleapiclient.errors import HttpError
 
+from ..core.config import settings
+from . import cv_layout
+from .cv_layout import Block, Run, get_layout
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+# Errors after which an existing document is abandoned and a new one
+# created: edited by hand (revision mismatch), no longer shared, or deleted.
+STALE_DOCUMENT_STATUSES = (400, 403, 404)
+
+# A run of document content: (requests indexed from 0, length in characters).
+Segment = Tuple[List[Dict], int]
+
+
+@functools.lru_cache(maxsize=None)
+def get_api_resource(api: str, version: str, collection: str) -> Resource:
+    """Return an API collection (e.g. docs.documents) built once per process.
+
+    Building a client parses the bundled discovery document and every
+    collection accessor builds a fresh sub-resource, which together cost
+    tens of milliseconds. The result holds no credentials: each request
+    is executed with the caller's authorized transport.
+    """
+    endpoints = {'docs': settings.GOOGLE_DOCS_API_ENDPOINT}
+    client = build(
+        api, version, http=httplib2.Http(), static_discovery=True, cache_discovery=False,
+        client_options={'api_endpoint': endpoints.get(api)},
+    )
+    return getattr(client, collection)()
+
+
+def get_http() -> httplib2.Http:
+    """Return this thread's HTTP transport, which keeps connections alive.
+
+    httplib2 objects are not thread-safe, so each worker thread reuses
+    its own across exports.
+    """
+    http = getattr(_local, "http", None)
+    if http is None:
+        http = _local.http = httplib2.Http(timeout=settings.GOOGLE_API_TIMEOUT)
+    return http
+
+
+def _shift(requests: List[Dict], offset: int) -> List[Dict]:
+    """Copy requests with every document index moved by ``offset``."""
+    shifted = copy.deepcopy(requests)
+    for request in shifted:
+        body = next(iter(request.values()))
+        if 'location' in body:
+            body['location']['index'] += offset
+        if 'range' in body:
+            body['range']['startIndex'] += offset
+            body['range']['endIndex'] += offset
+    return shifted
+
+
+def _style_key(request: Dict) -> Tuple[str, str]:
+    """Group style requests that set the same properties to the same values."""
+    kind, body = next(iter(request.items()))
+    values = {key: value for key, value in body.items() if key != 'range'}
+    return kind, json.dumps(values, sort_keys=True)
+
+
+def _merge_styles(requests: List[Dict]) -> List[Dict]:
+    """Merge style requests whose ranges touch and that apply the same style.
+
+    CV styles cover disjoint ranges, so merged requests can be applied in
+    the order of their first range without changing the result.
+    """
+    merged: List[Dict] = []
+    open_ranges: Dict[Tuple[str, str], Dict] = {}
+    for request in requests:
+        key = _style_key(request)
+        body = request[key[0]]
+        last = open_ranges.get(key)
+        if last is not None and last['endIndex'] >= body['range']['startIndex']:
+            last['endIndex'] = max(last['endIndex'], body['range']['endIndex'])
+            continue
+        merged.append(request)
+        open_ranges[key] = body['range']
+    return merged
+
+
+def segment_key(segment: Segment) -> str:
+    """Fingerprint of a segment's text and styling."""
+    requests, _ = segment
+    return hashlib.sha256(
+        json.dumps(requests, sort_keys=True, ensure_ascii=False).encode()
+    ).hexdigest()[:32]
+
+
+def _concat(segments: List[Segment]) -> Segment:
+    """Join segments into one, shifting each past the ones before it."""
+    requests, length = [], 0
+    for segment_requests, segment_length in segments:
+        requests.extend(_shift(segment_requests, length))
+        length += segment_length
+    return requests, length
+
+
+def _pt(magnitude: float) -> Dict[str, Any]:
+    return {'magnitude': magnitude, 'unit': 'PT'}
+
+
+# Docs formatting of the layout's block styles: (paragraph style, text style).
+_BLOCK_STYLES = {
+    cv_layout.NAME: ({'namedStyleType': 'HEADING_1', 'alignment': 'CENTER'}, {'fontSize': _pt(24)}),
+    cv_layout.CONTACT: ({'alignment': 'CENTER'}, {}),
+    cv_layout.BULLET: ({'indentStart': _pt(18), 'indentFirstLine': _pt(9)}, {}),
+}
+
+# Section titles are underlined with a paragraph border, as in the PDF.
+_HEADING_STYLE = {
+    'borderBottom': {
+        'color': {'color': {'rgbColor': {}}},
+        'width': _pt(1),
+        'padding': _pt(1),
+        'dashStyle': 'SOLID',
+    }
+}
+
+# Everything a segment may style; reset on text inserted by an update.
+_PARAGRAPH_FIELDS = 'namedStyleType,alignment,borderBottom,indentStart,indentFirstLine'
+_TEXT_FIELDS = 'bold,italic,fontSize,link'
+
+
+def _paragraph(
+    runs: List[Run],
+    paragraph_style: Dict[str, Any],
+    text_style: Dict[str, Any],
+) -> Segment:
+    """One paragraph of styled runs, indexed from 0."""
+    text = ''.join(run.text for run in runs) + '\n'
+    requests = [{'insertText': {'location': {'index': 0}, 'text': text}}]
+    index = 0
+    for run in runs:
+        style = dict(text_style)
+        if run.bold:
+            style['bold'] = True
+        if run.italic:
+            style['italic'] = True
+        if run.link:
+            style['link'] = {'url': run.link}
+        if style and run.text:
+            requests.append({'updateTextStyle': {
+                'range': {'startIndex': index, 'endIndex': index + len(run.text)},
+                'textStyle': style,
+                'fields': ','.join(style)
+            }})
+        index += len(run.text)
+    if paragraph_style:
+        requests.append({'updateParagraphStyle': {
+            'range': {'startIndex': 0, 'endIndex': len(text)},
+            'paragraphStyle': paragraph_style,
+            'fields': ','.join(paragraph_style)
+        }})
+    return requests, len(text)
+
+
+def _block_segment(block: Block) -> Segment:
+    """A layout block as a paragraph."""
+    paragraph_style, text_style = _BLOCK_STYLES.get(block.style, ({}, {}))
+    runs = list(block.runs)
+    if block.style == cv_layout.BULLET:
+        runs.insert(0, Run('• '))
+    if block.aside:
+        # Tab stops are read-only in the Docs API, so the aside goes to
+        # the next default stop rather than the right margin.
+        runs.append(Run(f"\t{block.aside}"))
+    return _paragraph(runs, paragraph_style, text_style)
+
+
+def _heading_segment(title: str) -> Segment:
+    return _paragraph(
+        [Run(title.upper(), bold=True)], _HEADING_STYLE, {'fontSize': _pt(13)}
+    )
+
+
+_BLANK_LINE = _paragraph([], {}, {})
+
+
+def warm_up_clients() -> None:
+    """Build the API resources ahead of the first export."""
+    get_api_resource('docs', 'v1', 'documents')
+
 
 class GoogleDocsService:
     """Service for creating and formatting Google Docs."""
 
     def __init__(self, credentials: Credentials):
-        """Initialize with Google credentials."""
-        self.docs_service = build('docs', 'v1', credentials=credentials)
-        self.drive_service = build('drive', 'v3', credentials=credentials)
+        """Bind Google credentials to the shared API resources."""
+        self.documents = get_api_resource('docs', 'v1', 'documents')
+        self.http = AuthorizedHttp(credentials, http=get_http())
+
+    def export_cv_document(
+        self,
+        cv_data: Dict[str, Any],
+        previous: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Export a CV, updating the previously exported document when possible.
+
+        Args:
+            cv_data: CV data dict as served by /cv/data
+            previous: Result of the user's last export, if any
+            on_progress: Called with a completion percentage between steps
 
-    def create_cv_document(self, cv_data: Dict[str, Any]) -> Dict[str, str]:
+        Returns:
+            Dict with document ID, URL, revision and segment layout
+        """
+        if previous and previous.get('revision_id'):
+            try:
+                return self.update_cv_document(previous, cv_data)
+            except HttpError as error:
+                if error.resp.status not in STALE_DOCUMENT_STATUSES:
+                    raise Exception(f"Error updating Google Doc: {error}")
+                logger.info(
+                    "Document %s cannot be updated in place (%s), creating a new one",
+                    previous['document_id'], error.resp.status
+                )
+        return self.create_cv_document(cv_data, on_progress=on_progress)
+
+    def create_cv_document(
+        self,
+        cv_data: Dict[str, Any],
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Dict[str, Any]:
         """
         Create a Google Doc with CV data.
 
+        Args:
+            cv_data: CV data dict as served by /cv/data
+            on_progress: Called with a completion percentage between steps
+
         Returns:
-            Dict with document ID and URL
+            Dict with document ID, URL, revision and segment layout
         """
         try:
             # Create document
-            profile = cv_data.get('profile', {})
-            title = f"CV - {profile.get('first_name', 'User')} {profile.get('last_name', '')}"
-
-            document = self.docs_service.documents().create(body={
-                'title': title
-            }).execute()
+            document = self.documents.create(body={
+                'title': get_layout(cv_data).title
+            }).execute(http=self.http)
 
             doc_id = document['documentId']
+            if on_progress:
+                on_progress(50)
 
             # Format the document
-            self._format_cv_document(doc_id, cv_data)
-
-            # Get document URL
-            doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
+            segments = self._build_cv_segments(cv_data)
+            response = self.documents.batchUpdate(
+                documentId=doc_id,
+                body={'requests': self._place_segments(segments, 1)}
+            ).execute(http=self.http)
 
-            return {
-                'document_id': doc_id,
-                'document_url': doc_url,
-                'success': True
-            }
+            return self._export_result(doc_id, response, segments)
 
         except HttpError as error:
             raise Exception(f"Error creating Google Doc: {error}")
 
-    def _format_cv_document(self, doc_id: str, cv_data: Dict[str, Any]):
-        """Format the CV document with proper styling."""
-        requests = []
+    def update_cv_document(
+        self, previous: Dict[str, Any], cv_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Bring a previously exported document in line with ``cv_data``.
 
-        # Build content first
-        content_requests = self._build_cv_content(cv_data)
+        Segments shared with the last export at the start and end of the
+        document are left alone; only the range between them is replaced.
+        The write is pinned to the revision produced by the last export, so
+        a document edited by hand since then is rejected instead of patched.
 
-        # Apply all requests
-        if content_requests:
-            self.docs_service.documents().batchUpdate(
-                documentId=doc_id,
-                body={'requests': content_requests}
-            ).execute()
+        Raises:
+            HttpError: When the document is gone, inaccessible or was edited
+        """
+        segments = self._build_cv_segments(cv_data)
+        keys = [segment_key(segment) for segment in segments]
+        old_keys = [key for key, _ in previous['segments']]
+        old_lengths = [length for _, length in previous['segments']]
+
+        prefix = 0
+        while prefix < min(len(keys), len(old_keys)) and keys[prefix] == old_keys[prefix]:
+            prefix += 1
+        suffix = 0
+        while (
+            suffix < min(len(keys), len(old_keys)) - prefix
+            and keys[-1 - suffix] == old_keys[-1 - suffix]
+        ):
+            suffix += 1
+
+        start = 1 + sum(old_lengths[:prefix])
+        old_end = start + sum(old_lengths[prefix:len(old_keys) - suffix])
+        changed = segments[prefix:len(segments) - suffix]
+        if old_end == start and not changed:
+            # Nothing changed since the last export.
+            return dict(previous, success=True)
 
-    def _build_cv_content(self, cv_data: Dict[str, Any]) -> List[Dict]:
-        """Build the CV content with formatting."""
         requests = []
-        index = 1  # Start after title
-
-        profile = cv_data.get('profile', {})
-        education = cv_data.get('education', [])
-        experience = cv_data.get('experience', [])
-        projects = cv_data.get('projects', [])
-        certifications = cv_data.get('certifications', [])
-        skills = cv_data.get('skills')
-
-        # Header - Name
-        name_text = f"{profile.get('first_name', '')} {profile.get('last_name', '')}\n"
-        requests.append({
-            'insertText': {
-                'location': {'index': index},
-                'text': name_text
-            }
-        })
-
-        # Style name as bold, large, centered
-        name_length = len(name_text) - 1
-        requests.extend([
-            {
-                'updateParagraphStyle': {
-                    'range': {'startIndex': index, 'endIndex': index + name_length},
-                    'paragraphStyle': {
-                        'namedStyleType': 'HEADING_1',
-                        'alignment': 'CENTER'
-                    },
-                    'fields': 'namedStyleType,alignment'
-                }
-            },
-            {
-                'updateTextStyle': {
-                    'range': {'startIndex': index, 'endIndex': index + name_length},
-                    'textStyle': {
-                        'bold': True,
-                        'fontSize': {'magnitude': 24, 'unit': 'PT'}
-                    },
-                    'fields': 'bold,fontSize'
-                }
-            }
-        ])
-        index += len(name_text)
-
-        # Contact Info
-        contact_parts = []
-        if profile.get('email'):
-            contact_parts.append(profile['email'])
-        if profile.get('phone'):
-            contact_parts.append(profile['phone'])
-        if profile.get('location'):
-            contact_parts.append(profile['location'])
-        if profile.get('linkedin'):
-            contact_parts.append(profile['linkedin'])
-
-        if contact_parts:
-            contact_text = ' • '.join(contact_parts) + '\n'
+        if old_end > start:
+            requests.append({'deleteContentRange': {
+                'range': {'startIndex': start, 'endIndex': old_end}
+            }})
+        if changed:
+            placed = self._place_segments(changed, start)
+            new_end = start + sum(length for _, length in changed)
+            inserts = [request for request in placed if 'insertText' in request]
+            styles = [request for request in placed if 'insertText' not in request]
+            # Inserted text inherits the style of its neighbours; reset it
+            # before applying the segments' own styles.
+            requests.extend(inserts)
             requests.extend([
-                {'insertText': {'location': {'index': index}, 'text': contact_text}},
                 {'updateParagraphStyle': {
-                    'range': {'startIndex': index, 'endIndex': index + len(contact_text)},
-                    'paragraphStyle': {'alignment': 'CENTER'},
-                    'fields': 'alignment'
-                }}
-            ])
-            index += len(contact_text)
-
-        # Horizontal line
-        requests.append({'insertText': {'location': {'index': index}, 'text': '\n'}})
-        index += 1
-
-        # Summary
-        if profile.get('summary'):
-            summary_text = profile['summary'] + '\n\n'
-            requests.append({'insertText': {'location': {'index': index}, 'text': summary_text}})
-            index += len(summary_text)
-
-        # Education Section
-        if education:
-            section_requests, new_index = self._add_section(
-                'EDUCATION', education, index, 'education'
-            )
-            requests.extend(section_requests)
-            index = new_index
-
-        # Experience Section
-        if experience:
-            section_requests, new_index = self._add_section(
-                'EXPERIENCE', experience, index, 'experience'
-            )
-            requests.extend(section_requests)
-            index = new_index
-
-        # Projects Section
-        if projects:
-            section_requests, new_index = self._add_section(
-                'PROJECTS', projects, index, 'projects'
-            )
-            requests.extend(section_requests)
-            index = new_index
-
-        # Certifications Section
-        if certifications:
-            section_requests, new_index = self._add_section(
-                'CERTIFICATIONS', certifications, index, 'certifications'
-            )
-            requests.extend(section_requests)
-            index = new_index
-
-        # Skills Section
-        if skills:
-            section_requests, new_index = self._add_skills_section(skills, index)
-            requests.extend(section_requests)
-            index = new_index
-
-        return requests
-
-    def _add_section(self, title: str, items: List[Dict], index: int, section_type: str) -> tuple:
-        """Add a section with items."""
-        requests = []
-
-        # Section title
-        title_text = f"{title}\n"
-        requests.extend([
-            {'insertText': {'location': {'index': index}, 'text': title_text}},
-            {
-                'updateTextStyle': {
-                    'range': {'startIndex': index, 'endIndex': index + len(title_text) - 1},
-                    'textStyle': {
-                        'bold': True,
-                        'fontSize': {'magnitude': 13, 'unit': 'PT'}
-                    },
-                    'fields': 'bold,fontSize'
-                }
-            }
-        ])
-        index += len(title_text)
-
-        # Underline
-        line_text = '─' * 80 + '\n'
-        requests.append({'insertText': {'location': {'index': index}, 'text': line_text}})
-        index += len(line_text)
-
-        # Add items
-        for item in items:
-            item_requests, new_index = self._format_item(item, index, section_type)
-            requests.extend(item_requests)
-            index = new_index
-
-        # Add spacing
-        requests.append({'insertText': {'location': {'index': index}, 'text': '\n'}})
-        index += 1
-
-        return requests, index
-
-    def _format_item(self, item: Dict, index: int, item_type: str) -> tuple:
-        """Format an individual item based on type."""
-        requests = []
-
-        if item_type == 'education':
-            # Institution and location
-            header = f"{item.get('institution', '')} — {item.get('location', '')}"
-            date_range = self._format_date_range(item.get('start_date'), item.get('end_date'))
-            header_text = f"{header}".ljust(80 - len(date_range)) + f"{date_range}\n"
-
-            requests.extend([
-                {'insertText': {'location': {'index': index}, 'text': header_text}},
-                {'updateTextStyle': {
-                    'range': {'startIndex': index, 'endIndex': index + len(item.get('institution', ''))},
-                    'textStyle': {'bold': True},
-                    'fields': 'bold'
-                }}
-            ])
-            index += len(header_text)
-
-            # Degree
-            if item.get('degree'):
-                degree_text = f"{item['degree']}\n"
-                requests.extend([
-                    {'insertText': {'location': {'index': index}, 'text': degree_text}},
-                    {'updateTextStyle': {
-                        'range': {'startIndex': index, 'endIndex': index + len(degree_text) - 1},
-                        'textStyle': {'italic': True},
-                        'fields': 'italic'
-                    }}
-                ])
-                index += len(degree_text)
-
-        elif item_type == 'experience':
-            # Company and location
-            header = f"{item.get('company', '')} — {item.get('location', '')}"
-            date_range = self._format_date_range(item.get('start_date'), item.get('end_date'))
-            header_text = f"{header}".ljust(80 - len(date_range)) + f"{date_range}\n"
-
-            requests.extend([
-                {'insertText': {'location': {'index': index}, 'text': header_text}},
-                {'updateTextStyle': {
-                    'range': {'startIndex': index, 'endIndex': index + len(item.get('company', ''))},
-                    'textStyle': {'bold': True},
-                    'fields': 'bold'
-                }}
-            ])
-            index += len(header_text)
-
-            # Role
-            if item.get('role'):
-                role_text = f"{item['role']}\n"
-                requests.extend([
-                    {'insertText': {'location': {'index': index}, 'text': role_text}},
-                    {'updateTextStyle': {
-                        'range': {'startIndex': index, 'endIndex': index + len(role_text) - 1},
-                        'textStyle': {'italic': True},
-                        'fields': 'italic'
-                    }}
-                ])
-                index += len(role_text)
-
-            # Bullets
-            if item.get('bullets'):
-                for bullet in item['bullets']:
-                    bullet_text = f"  • {bullet}\n"
-                    requests.append({'insertText': {'location': {'index': index}, 'text': bullet_text}})
-                    index += len(bullet_text)
-
-        elif item_type == 'projects':
-            project_text = f"{item.get('name', '')}\n"
-            requests.extend([
-                {'insertText': {'location': {'index': index}, 'text': project_text}},
-                {'updateTextStyle': {
-                    'range': {'startIndex': index, 'endIndex': index + len(project_text) - 1},
-                    'textStyle': {'bold': True},
-                    'fields': 'bold'
-                }}
-            ])
-            index += len(project_text)
-
-            if item.get('impact'):
-                impact_text = f"{item['impact']}\n"
-                requests.append({'insertText': {'location': {'index': index}, 'text': impact_text}})
-                index += len(impact_text)
-
-            if item.get('technologies'):
-                tech_text = f"Technologies: {', '.join(item['technologies'])}\n"
-                requests.append({'insertText': {'location': {'index': index}, 'text': tech_text}})
-                index += len(tech_text)
-
-        elif item_type == 'certifications':
-            cert_header = f"{item.get('name', '')} — {item.get('issuer', '')}"
-            if item.get('date'):
-                cert_header += f" ({item['date']})"
-            cert_text = cert_header + "\n"
-
-            requests.extend([
-                {'insertText': {'location': {'index': index}, 'text': cert_text}},
+                    'range': {'startIndex': start, 'endIndex': new_end},
+                    'paragraphStyle': {'namedStyleType': 'NORMAL_TEXT', 'alignment': 'START'},
+                    'fields': _PARAGRAPH_FIELDS
+                }},
                 {'updateTextStyle': {
-                    'range': {'startIndex': index, 'endIndex': index + len(item.get('name', ''))},
-                    'textStyle': {'bold': True},
-                    'fields': 'bold'
-                }}
+                    'range': {'startIndex': start, 'endIndex': new_end},
+                    'textStyle': {},
+                    'fields': _TEXT_FIELDS
+                }},
             ])
-            index += len(cert_text)
+            requests.extend(styles)
 
-        # Add spacing between items
-        requests.append({'insertText': {'location': {'index': index}, 'text': '\n'}})
-        index += 1
+        response = self.documents.batchUpdate(
+            documentId=previous['document_id'],
+            body={
+                'requests': requests,
+                'writeControl': {'requiredRevisionId': previous['revision_id']},
+            }
+        ).execute(http=self.http)
+
+        return self._export_result(previous['document_id'], response, segments)
+
+    def _export_result(
+        self, doc_id: str, response: Dict[str, Any], segments: List[Segment]
+    ) -> Dict[str, Any]:
+        """Describe an exported document so the next export can update it."""
+        return {
+            'document_id': doc_id,
+            'document_url': f"https://docs.google.com/document/d/{doc_id}/edit",
+            'revision_id': response.get('writeControl', {}).get('requiredRevisionId'),
+            'segments': [[segment_key(segment), segment[1]] for segment in segments],
+            'success': True
+        }
 
-        return requests, index
+    def _build_cv_content(self, cv_data: Dict[str, Any]) -> List[Dict]:
+        """Build the CV content with formatting."""
+        return self._place_segments(self._build_cv_segments(cv_data), 1)
 
-    def _add_skills_section(self, skills: Dict, index: int) -> tuple:
-        """Add skills section."""
-        requests = []
+    def _build_cv_segments(self, cv_data: Dict[str, Any]) -> List[Segment]:
+        """Build the CV as consecutive segments, each indexed from 0.
 
-        # Section title
-        title_text = "SKILLS\n"
-        requests.extend([
-            {'insertText': {'location': {'index': index}, 'text': title_text}},
-            {
-                'updateTextStyle': {
-                    'range': {'startIndex': index, 'endIndex': index + len(title_text) - 1},
-                    'textStyle': {
-                        'bold': True,
-                        'fontSize': {'magnitude': 13, 'unit': 'PT'}
-                    },
-                    'fields': 'bold,fontSize'
-                }
-            }
-        ])
-        index += len(title_text)
-
-        # Underline
-        line_text = '─' * 80 + '\n'
-        requests.append({'insertText': {'location': {'index': index}, 'text': line_text}})
-        index += len(line_text)
-
-        # Languages
-        if skills.get('languages'):
-            lang_text = f"Languages: {', '.join(skills['languages'])}\n"
-            requests.append({'insertText': {'location': {'index': index}, 'text': lang_text}})
-            index += len(lang_text)
-
-        # Tools
-        if skills.get('tools'):
-            tools_text = f"Tools: {', '.join(skills['tools'])}\n"
-            requests.append({'insertText': {'location': {'index': index}, 'text': tools_text}})
-            index += len(tools_text)
-
-        # Methods
-        if skills.get('methods'):
-            methods_text = f"Methods: {', '.join(skills['methods'])}\n"
-            requests.append({'insertText': {'location': {'index': index}, 'text': methods_text}})
-            index += len(methods_text)
-
-        return requests, index
-
-    def _format_date_range(self, start: Optional[str], end: Optional[str]) -> str:
-        """Format date range."""
-        if not start:
-            return ""
-
-        if end:
-            return f"{start} – {end}"
-        return f"{start} – Present"
+        Segments follow the compiled layout: the header, the summary,
+        each section title and each entry, with the blank lines between
+        them. Every segment ends with a newline, so replacing a run of
+        segments in a document only ever touches whole paragraphs.
+        """
+        segments = []
+        for section in get_layout(cv_data).sections:
+            if section.title:
+                segments.append(_heading_segment(section.title))
+            for entry in section.entries:
+                paragraphs = [_block_segment(block) for block in entry.blocks]
+                if section.key != 'skills':
+                    paragraphs.append(_BLANK_LINE)
+                segments.append(_concat(paragraphs))
+            if section.title and section.key != 'skills':
+                segments.append(_BLANK_LINE)
+        return segments
+
+    def _place_segments(self, segments: List[Segment], index: int) -> List[Dict]:
+        """Compile segments into requests that write them starting at ``index``.
+
+        All text goes in with a single insertText, followed by the merged
+        style requests, instead of one insert per line.
+        """
+        start = index
+        text = []
+        styles = []
+        for segment_requests, length in segments:
+            for request in _shift(segment_requests, index):
+                if 'insertText' in request:
+                    text.append(request['insertText']['text'])
+                else:
+                    styles.append(request)
+            index += length
+        if not text:
+            return []
+        insert = {'insertText': {'location': {'index': start}, 'text': ''.join(text)}}
+        return [insert] + _merge_styles(styles)
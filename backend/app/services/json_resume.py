@@ -0,0 +1,237 @@
+"""Mapping between CV data and JSON Resume documents.
+
+Exports are built straight from the CV data dicts served by /cv/data and
+yielded by iter_cv_data, so converting CVs in bulk needs no ORM objects.
+Imports validate the raw JSON with a TypeAdapter compiled once, then map
+to CVData, which is applied like PUT /cv/data.
+
+Exported resumes import back to the same CV. CV fields with no standard
+JSON Resume property (education location, credential id) are written as
+extra properties, which the standard allows.
+"""
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from ..schemas import CVData, JSONResume
+from ..schemas.json_resume import ResumeBasics, ResumeLocation, ResumeSkill
+from .cv_layout import SKILL_LABELS
+
+RESUME_ADAPTER = TypeAdapter(JSONResume)
+
+# Skill group names accepted on import, mapped to the CV skill keys.
+SKILL_KEYS = {
+    **{key: key for key, _ in SKILL_LABELS},
+    **{label.casefold(): key for key, label in SKILL_LABELS},
+}
+# Imported skill groups with any other name.
+DEFAULT_SKILL_KEY = "tools"
+
+CURRENT_END_DATES = frozenset(("present", "current", "now"))
+
+
+def _compact(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop empty properties; JSON Resume leaves out what is unknown."""
+    return {key: value for key, value in item.items() if value is not None and value != []}
+
+
+def _location(location: Optional[str]) -> Optional[Dict[str, str]]:
+    """Split ``City, Region`` into a JSON Resume location."""
+    if not location:
+        return None
+    city, _, region = location.partition(", ")
+    return _compact({"city": city, "region": region or None})
+
+
+def _end_date(end_date: Optional[str]) -> Optional[str]:
+    """JSON Resume marks an ongoing entry by leaving out its end date."""
+    if end_date and end_date.strip().casefold() in CURRENT_END_DATES:
+        return None
+    return end_date
+
+
+def to_json_resume(cv_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert CV data to a JSON Resume document."""
+    profile = cv_data["profile"]
+    basics = _compact({
+        "name": f"{profile['first_name']} {profile['last_name']}".strip(),
+        "email": profile["email"],
+        "phone": profile.get("phone"),
+        "summary": profile.get("summary"),
+        "location": _location(profile.get("location")),
+        "profiles": (
+            [{"network": "LinkedIn", "url": profile["linkedin"]}]
+            if profile.get("linkedin")
+            else None
+        ),
+    })
+    skills = cv_data.get("skills") or {}
+
+    return {
+        "basics": basics,
+        "work": [
+            _compact({
+                "name": exp["company"],
+                "position": exp["role"],
+                "location": exp.get("location"),
+                "startDate": exp["start_date"],
+                "endDate": _end_date(exp.get("end_date")),
+                "highlights": exp.get("bullets"),
+            })
+            for exp in cv_data.get("experience", [])
+        ],
+        "education": [
+            _compact({
+                "institution": edu["institution"],
+                "studyType": edu["degree"] or None,
+                "startDate": edu.get("start_date"),
+                "endDate": _end_date(edu.get("end_date")),
+                "courses": edu.get("details"),
+                "location": edu.get("location"),
+            })
+            for edu in cv_data.get("education", [])
+        ],
+        "certificates": [
+            _compact({
+                "name": cert["name"],
+                "issuer": cert["issuer"] or None,
+                "date": cert.get("date"),
+                "url": cert.get("url"),
+                "credentialId": cert.get("credential_id"),
+            })
+            for cert in cv_data.get("certifications", [])
+        ],
+        "projects": [
+            _compact({
+                "name": proj["name"],
+                "description": proj.get("impact"),
+                "keywords": proj.get("technologies"),
+                "url": proj.get("url"),
+            })
+            for proj in cv_data.get("projects", [])
+        ],
+        "skills": [
+            {"name": label, "keywords": skills[key]}
+            for key, label in SKILL_LABELS
+            if skills.get(key)
+        ],
+    }
+
+
+def _split_name(name: str, name_parts: Optional[Tuple[str, str]]) -> Tuple[str, str]:
+    """Split a full name into first and last name at the first space.
+
+    ``name_parts`` is the current split, kept when it still spells the
+    same name, so a resume exported and imported back keeps e.g. a
+    two-word first name.
+    """
+    name = " ".join(name.split())
+    if name_parts and " ".join(" ".join(name_parts).split()) == name:
+        return name_parts
+    first, _, last = name.partition(" ")
+    return first, last
+
+
+def _location_text(location: Optional[ResumeLocation]) -> Optional[str]:
+    """Join a JSON Resume location back into ``City, Region``."""
+    if location is None:
+        return None
+    parts = (location.city, location.region, location.countryCode)
+    return ", ".join(part for part in parts if part) or None
+
+
+def _linkedin(basics: ResumeBasics) -> Optional[str]:
+    for profile in basics.profiles:
+        if (profile.network or "").casefold() == "linkedin":
+            if profile.url:
+                return profile.url
+            if profile.username:
+                return f"https://www.linkedin.com/in/{profile.username}"
+    return None
+
+
+def _skills(groups: Iterable[ResumeSkill]) -> Optional[Dict[str, list]]:
+    """Sort skill groups into the CV's skill keys.
+
+    Groups named after a CV key or label fill it; any other group adds
+    its keywords, or its own name when it has none, to the default key.
+    """
+    skills = {key: [] for key, _ in SKILL_LABELS}
+    for group in groups:
+        key = SKILL_KEYS.get((group.name or "").casefold())
+        if key:
+            skills[key].extend(group.keywords)
+        else:
+            skills[DEFAULT_SKILL_KEY].extend(group.keywords or ([group.name] if group.name else []))
+    return skills if any(skills.values()) else None
+
+
+def from_json_resume(
+    resume: JSONResume, name_parts: Optional[Tuple[str, str]] = None
+) -> CVData:
+    """Convert a validated JSON Resume document to CV data.
+
+    Args:
+        resume: Resume validated with RESUME_ADAPTER
+        name_parts: Current (first name, last name), kept if the resume
+            name is unchanged
+
+    Raises:
+        ValidationError: If the mapped data is not valid CV data, i.e.
+            basics.email is not an email address
+    """
+    basics = resume.basics
+    first_name, last_name = _split_name(basics.name, name_parts)
+    return CVData.model_validate({
+        "profile": {
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": basics.email,
+            "phone": basics.phone,
+            "location": _location_text(basics.location),
+            "linkedin": _linkedin(basics),
+            "summary": basics.summary,
+        },
+        "experience": [
+            {
+                "company": work.name,
+                "role": work.position,
+                "location": work.location,
+                "start_date": work.startDate,
+                "end_date": work.endDate,
+                "bullets": work.highlights or ([work.summary] if work.summary else []),
+            }
+            for work in resume.work
+        ],
+        "education": [
+            {
+                "degree": " in ".join(part for part in (edu.studyType, edu.area) if part),
+                "institution": edu.institution,
+                "location": edu.location,
+                "start_date": edu.startDate,
+                "end_date": edu.endDate,
+                "details": edu.courses,
+            }
+            for edu in resume.education
+        ],
+        "certifications": [
+            {
+                "name": cert.name,
+                "issuer": cert.issuer,
+                "date": cert.date,
+                "credential_id": cert.credentialId,
+                "url": cert.url,
+            }
+            for cert in resume.certificates
+        ],
+        "projects": [
+            {
+                "name": proj.name,
+                "impact": proj.description or " ".join(proj.highlights) or None,
+                "technologies": proj.keywords,
+                "url": proj.url,
+            }
+            for proj in resume.projects
+        ],
+        "skills": _skills(resume.skills),
+    })
@@ -0,0 +1,102 @@
+"""Server-side PDF rendering of the Harvard CV layout."""
+import asyncio
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict
+
+from ..core.config import settings
+from ..core.workers import ProcessPool
+from .cv_layout import CVLayout, get_layout
+from .render_cache import RenderCache, cv_content_hash, render_cache
+
+# Per-worker state, populated by _init_worker inside each pool process.
+_template = None
+_stylesheet = None
+
+
+def _init_worker() -> None:
+    """Load WeasyPrint, the template and the stylesheet once per worker."""
+    global _template, _stylesheet
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+    from weasyprint import CSS
+
+    templates_dir = os.path.abspath(settings.TEMPLATES_DIR)
+    env = Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=select_autoescape(["html"]),
+    )
+    _template = env.get_template("cv.html")
+    _stylesheet = CSS(filename=os.path.join(templates_dir, "cv.css"))
+
+
+def _render_pdf(layout: CVLayout) -> bytes:
+    """Render a compiled CV layout to PDF bytes. Runs inside a pool worker."""
+    from weasyprint import HTML
+
+    if _template is None:
+        _init_worker()
+
+    html = _template.render(layout=layout)
+    return HTML(
+        string=html, base_url=os.path.abspath(settings.TEMPLATES_DIR)
+    ).write_pdf(stylesheets=[_stylesheet])
+
+
+class PDFRenderer:
+    """Renders CVs to PDF on a warm process pool with a content-hash cache."""
+
+    def __init__(self, pool: ProcessPool, cache: RenderCache):
+        self.pool = pool
+        self.cache = cache
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    async def render(self, cv_data: Dict[str, Any]) -> str:
+        """Return the path of the rendered PDF, rendering only on a cache miss.
+
+        Waits on the pool without holding a thread. Raises PoolSaturated
+        when the pool already has its maximum of pending renders.
+        """
+        content_hash = cv_content_hash(cv_data)
+        cached_path = self.cache.get(content_hash, "pdf")
+        if cached_path:
+            return cached_path
+
+        # Concurrent requests for the same content share a single render.
+        with self._lock:
+            future = self._in_flight.get(content_hash)
+            owner = future is None
+            if owner:
+                future = self.pool.submit(
+                    _render_pdf, get_layout(cv_data, content_hash)
+                )
+                self._in_flight[content_hash] = future
+
+        try:
+            # Shielded so a timeout or a dropped client does not cancel
+            # a render other requests are waiting on.
+            pdf_bytes = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)),
+                timeout=settings.PDF_RENDER_TIMEOUT,
+            )
+            return await asyncio.to_thread(self._store, content_hash, pdf_bytes)
+        finally:
+            if owner:
+                with self._lock:
+                    self._in_flight.pop(content_hash, None)
+
+    def _store(self, content_hash: str, pdf_bytes: bytes) -> str:
+        return self.cache.get(content_hash, "pdf") or self.cache.put(
+            content_hash, "pdf", pdf_bytes
+        )
+
+
+# Beyond the pending limit exports get PoolSaturated (503) at once
+# rather than queueing for up to PDF_RENDER_TIMEOUT each.
+pdf_pool = ProcessPool(
+    max_workers=settings.PDF_RENDER_WORKERS,
+    initializer=_init_worker,
+    max_pending=settings.PDF_RENDER_QUEUE_LIMIT,
+)
+pdf_renderer = PDFRenderer(pdf_pool, render_cache)
@@ -0,0 +1,175 @@
+"""On-disk cache for rendered CV documents, keyed by CV content hash."""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when templates or renderers change so stale renders are not served.
+LAYOUT_VERSION = "3"
+
+# A prune shrinks the cache to this share of its byte cap, so the next
+# one is not due after a single write.
+PRUNE_TARGET = 0.9
+# Longest time between age checks while entries are being written.
+PRUNE_INTERVAL = 3600  # seconds
+
+
+def cv_content_hash(cv_data: Dict[str, Any]) -> str:
+    """Return a stable hash of the CV content and the current layout version."""
+    payload = json.dumps(
+        cv_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    digest = hashlib.sha256(LAYOUT_VERSION.encode("utf-8"))
+    digest.update(payload.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Content-addressed file cache for rendered documents.
+
+    Entries unused for ``max_age`` seconds are deleted, and beyond
+    ``max_bytes`` the least recently used go first; 0 disables either
+    cap. A hit refreshes the entry's mtime, which is what "used" means.
+    The directory is pruned when ``prune`` is called, e.g. at startup,
+    and whenever writes take it past a cap.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 0, max_age: float = 0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        # Bytes on disk as of the last prune plus those written since.
+        self._size = 0
+        self._pruned_at = time.monotonic()
+        self._size_lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+
+    def path_for(self, content_hash: str, extension: str) -> str:
+        """Return the cache path for a hash, sharded by its first two characters."""
+        return os.path.join(
+            self.directory, content_hash[:2], f"{content_hash}.{extension}"
+        )
+
+    def get(self, content_hash: str, extension: str) -> Optional[str]:
+        """Return the cached file path, or None on a miss."""
+        path = self.path_for(content_hash, extension)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, content_hash: str, extension: str, data: bytes) -> str:
+        """Store rendered bytes atomically and return the cached file path."""
+        path = self.path_for(content_hash, extension)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._written(len(data))
+        return path
+
+    def stream_into(
+        self, content_hash: str, extension: str, chunks: Iterable[bytes]
+    ) -> Iterator[bytes]:
+        """Pass chunks through while writing them to the cache.
+
+        The entry only appears once every chunk was written, so a stream
+        abandoned halfway (e.g. a client disconnect) leaves nothing behind.
+        """
+        path = self.path_for(content_hash, extension)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                for chunk in chunks:
+                    tmp_file.write(chunk)
+                    size += len(chunk)
+                    yield chunk
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._written(size)
+
+    def _written(self, size: int) -> None:
+        """Account for a new entry and prune once a cap may be exceeded."""
+        with self._size_lock:
+            self._size += size
+            due = (self.max_bytes and self._size > self.max_bytes) or (
+                self.max_age
+                and time.monotonic() - self._pruned_at > min(self.max_age, PRUNE_INTERVAL)
+            )
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete expired and least recently used entries; return bytes freed.
+
+        Only one prune runs at a time; a call made while another is
+        running returns 0 at once. Temporary files of renders still being
+        written are left alone until they are older than ``max_age``.
+        """
+        if not self._prune_lock.acquire(blocking=False):
+            return 0
+        try:
+            entries = []
+            for root, _, names in os.walk(self.directory):
+                for name in names:
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+            entries.sort()
+
+            now = time.time()
+            total = sum(size for _, size, _ in entries)
+            target = self.max_bytes * PRUNE_TARGET
+            freed = 0
+            for mtime, size, path in entries:
+                expired = self.max_age and now - mtime > self.max_age
+                oversized = self.max_bytes and total - freed > target
+                if not expired and not oversized:
+                    # Sorted oldest first: no later entry is expired either.
+                    break
+                if not expired and path.endswith(".tmp"):
+                    continue
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                freed += size
+
+            with self._size_lock:
+                self._size = total - freed
+                self._pruned_at = time.monotonic()
+            if freed:
+                logger.info("Pruned %d bytes from the render cache", freed)
+            return freed
+        finally:
+            self._prune_lock.release()
+
+
+# Shared by PDF renders and every export format; the extension tells
+# formats apart.
+render_cache = RenderCache(
+    settings.RENDER_CACHE_DIR,
+    max_bytes=settings.RENDER_CACHE_MAX_BYTES,
+    max_age=settings.RENDER_CACHE_MAX_AGE,
+)
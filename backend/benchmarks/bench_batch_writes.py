@@ -0,0 +1,92 @@
+"""Compare saving a CV section item by item against one batch request.
+
+Replaces an experience section of --items entries, first with one POST per
+entry and then with a single POST /experience:batch, and reports wall time
+and the number of SQL statements each approach issued.
+
+Usage (from the backend directory):
+    python benchmarks/bench_batch_writes.py [--items 30] [--rounds 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def experience(i: int) -> dict:
+    return {
+        "company": f"Company {i}", "role": "Engineer",
+        "start_date": "2020-01", "bullets": ["Shipped things", "Fixed things"],
+    }
+
+
+def run(items: int, rounds: int) -> None:
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+
+    sys.path.insert(0, BACKEND_DIR)
+    from main import app
+    from app.core.database import engine
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(1))
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/v1/auth/signup", json={"email": "batch@example.com", "password": "bench"}
+        )
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        client.post(
+            "/api/v1/profile",
+            json={"first_name": "Batch", "last_name": "User", "email": "batch@example.com"},
+            headers=headers,
+        )
+
+        def clear() -> None:
+            current = client.get("/api/v1/experience", headers=headers).json()
+            operations = [{"op": "delete", "id": entry["id"]} for entry in current]
+            if operations:
+                client.post(
+                    "/api/v1/experience:batch",
+                    json={"operations": operations}, headers=headers,
+                )
+
+        def single() -> None:
+            for i in range(items):
+                client.post("/api/v1/experience", json=experience(i), headers=headers)
+
+        def batch() -> None:
+            operations = [{"op": "create", "data": experience(i)} for i in range(items)]
+            client.post(
+                "/api/v1/experience:batch", json={"operations": operations}, headers=headers
+            )
+
+        print(f"{'mode':>8} {'ms':>9} {'statements':>11}")
+        for label, save in (("single", single), ("batch", batch)):
+            timings = []
+            for _ in range(rounds):
+                clear()
+                statements.clear()
+                start = time.perf_counter()
+                save()
+                timings.append((time.perf_counter() - start) * 1000)
+            print(f"{label:>8} {statistics.median(timings):>9.1f} {len(statements):>11}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=30)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ.setdefault("DATABASE_URL", f"sqlite:///{tmp_dir}/bench.db")
+        run(args.items, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Measure the admin bulk CV export and check that its memory stays flat.
+
+Seeds a temporary SQLite database with --users users, each with a
+profile of --entries entries per section, then streams the ZIP archive
+built by GET /admin/cv/export.zip for growing subsets of them and
+discards the chunks. Reports throughput and the peak Python heap of the
+streaming process; the peak must not grow with the number of CVs.
+
+Usage (from the backend directory):
+    python benchmarks/bench_bulk_export.py [--users 5000] [--entries 3] [--format txt]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+
+
+def seed(users: int, entries: int) -> None:
+    """Insert users and full profiles with multi-row inserts."""
+    from sqlalchemy import insert
+
+    from app.core.database import engine
+    from app.models import Certification, Education, Experience, Profile, Project, Skills, User
+
+    sys.path.insert(0, BENCH_DIR)
+    from sample_cv import make_cv
+
+    cv = make_cv(entries)
+    with engine.begin() as connection:
+        connection.execute(insert(User), [
+            {"id": i, "email": f"bulk{i}@example.com", "hashed_password": "-", "is_active": True}
+            for i in range(1, users + 1)
+        ])
+        connection.execute(insert(Profile), [
+            {"id": i, "user_id": i, **dict(cv["profile"], first_name=f"Bulk{i}")}
+            for i in range(1, users + 1)
+        ])
+        for model, key in (
+            (Education, "education"), (Experience, "experience"),
+            (Certification, "certifications"), (Project, "projects"),
+        ):
+            connection.execute(insert(model), [
+                dict(item, profile_id=i) for i in range(1, users + 1) for item in cv[key]
+            ])
+        connection.execute(insert(Skills), [
+            dict(cv["skills"], profile_id=i) for i in range(1, users + 1)
+        ])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--entries", type=int, default=3, help="entries per CV section")
+    parser.add_argument("--format", default="txt")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ.setdefault("DATABASE_URL", f"sqlite:///{tmp_dir}/bench.db")
+        os.environ["RENDER_CACHE_DIR"] = os.path.join(tmp_dir, "renders")
+        sys.path.insert(0, BACKEND_DIR)
+        from app.services.cv_dump import iter_cv_data
+        from app.core.database import Base, engine
+        from app.services.cv_bulk import bulk_pool, stream_cv_archive
+
+        Base.metadata.create_all(bind=engine)
+        seed(args.users, args.entries)
+        bulk_pool.warm_up()
+
+        peaks = []
+        for users in (args.users // 10, args.users):
+            tracemalloc.start()
+            start = time.perf_counter()
+            user_ids = list(range(1, users + 1)) if users < args.users else None
+            size = sum(
+                len(chunk) for chunk in stream_cv_archive(iter_cv_data(user_ids), args.format)
+            )
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+            peaks.append(peak)
+            print(
+                f"{users:>7} CVs: {users / elapsed:7.1f} CVs/s   "
+                f"{size / 1024 / 1024:7.1f} MB archive   peak heap {peak:6.1f} MB"
+            )
+        bulk_pool.shutdown()
+
+    # The ZIP central directory grows by a few hundred bytes per file;
+    # everything else must stay flat.
+    assert peaks[1] < peaks[0] * 2 + args.users * 0.001, "memory grows with the number of CVs"
+
+
+if __name__ == "__main__":
+    main()
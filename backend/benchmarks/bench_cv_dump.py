@@ -0,0 +1,89 @@
+"""Compare the NDJSON CV dump with walking the ORM object graph.
+
+Seeds a temporary SQLite database with --users full profiles (see
+bench_bulk_export.py) and dumps them twice: once through
+app.services.cv_dump, which reads plain rows in profile-id batches, and
+once by loading Profile objects with their sections through yield_per
+and serializing them with serialize_cv. Reports CVs per second and the
+peak Python heap of each, measured in a second traced pass, and checks
+that both produce the same data.
+
+Usage (from the backend directory):
+    python benchmarks/bench_cv_dump.py [--users 20000] [--entries 3]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+
+
+def orm_cv_data(batch_size: int):
+    """The dump as it would be built from ORM objects."""
+    from sqlalchemy import select
+
+    from app.api.cv_export import CV_LOAD_OPTIONS, serialize_cv
+    from app.core.database import SessionLocal
+    from app.models import Profile
+
+    query = (
+        select(Profile)
+        .options(*CV_LOAD_OPTIONS)
+        .order_by(Profile.id)
+        .execution_options(yield_per=batch_size)
+    )
+    with SessionLocal() as db:
+        for profile in db.scalars(query):
+            yield profile.user_id, serialize_cv(profile)
+            db.expunge(profile)
+
+
+def measure(label: str, dump) -> int:
+    """Time a full dump, then repeat it under tracemalloc for its peak heap."""
+    start = time.perf_counter()
+    digest, count = 0, 0
+    for user_id, cv_data in dump():
+        digest ^= hash(json.dumps(cv_data, sort_keys=True))
+        count += 1
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _ in dump():
+        pass
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    print(f"{label:>6}: {count / elapsed:8.0f} CVs/s   peak heap {peak:6.1f} MB")
+    return digest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--entries", type=int, default=3, help="entries per CV section")
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ.setdefault("DATABASE_URL", f"sqlite:///{tmp_dir}/bench.db")
+        sys.path.insert(0, BACKEND_DIR)
+        sys.path.insert(0, BENCH_DIR)
+        from bench_bulk_export import seed
+        from app.core.database import Base, engine
+        from app.services.cv_dump import iter_cv_data
+
+        Base.metadata.create_all(bind=engine)
+        seed(args.users, args.entries)
+
+        print(f"{args.users} CVs, {args.entries} entries per section")
+        orm = measure("orm", lambda: orm_cv_data(args.batch_size))
+        rows = measure("rows", lambda: iter_cv_data(batch_size=args.batch_size))
+        assert orm == rows, "dumps differ"
+
+
+if __name__ == "__main__":
+    main()
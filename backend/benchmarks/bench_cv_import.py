@@ -0,0 +1,113 @@
+"""Compare the batched NDJSON CV import with adding ORM objects per record.
+
+Writes --users CVs as NDJSON (see bench_bulk_export.py for their shape),
+then imports them twice into an empty SQLite database: once through
+app.services.cv_import, which validates a batch at a time and inserts it
+with one multi-row INSERT per table, and once by validating each line
+and adding User, Profile and section objects to a session, committing
+every --batch-size records. Reports CVs per second and SQL statements
+per CV, and checks that both imports dump the same data.
+
+Usage (from the backend directory):
+    python benchmarks/bench_cv_import.py [--users 5000] [--entries 3] [--batch-size 500]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+
+
+def make_lines(users: int, entries: int):
+    from sample_cv import make_cv
+
+    cv = make_cv(entries)
+    return [
+        json.dumps(dict(cv, account_email=f"bulk{i}@example.com")).encode()
+        for i in range(1, users + 1)
+    ]
+
+
+def orm_import(lines, batch_size: int) -> None:
+    """The import as it would be written with the ORM, one record at a time."""
+    from app.core.database import SessionLocal
+    from app.core.security import UNUSABLE_PASSWORD
+    from app.models import Profile, Skills, User
+    from app.services.cv_import import RECORD_ADAPTER, SECTION_MODELS
+
+    with SessionLocal() as db:
+        for number, line in enumerate(lines, start=1):
+            record = RECORD_ADAPTER.validate_json(line)
+            user = User(email=record.account_email, hashed_password=UNUSABLE_PASSWORD)
+            profile = Profile(user=user, **record.profile.model_dump())
+            for key, model in SECTION_MODELS:
+                for item in getattr(record, key):
+                    db.add(model(profile=profile, **item.model_dump()))
+            if record.skills is not None:
+                db.add(Skills(profile=profile, **record.skills.model_dump()))
+            db.add(profile)
+            if number % batch_size == 0:
+                db.commit()
+        db.commit()
+
+
+def measure(label: str, run):
+    """Import into emptied tables and return their dump."""
+    from sqlalchemy import event
+
+    from app.core.database import Base, engine
+    from app.services.cv_dump import iter_cv_data
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    statements = [0]
+
+    def count(*args):
+        statements[0] += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    start = time.perf_counter()
+    users = run()
+    elapsed = time.perf_counter() - start
+    event.remove(engine, "before_cursor_execute", count)
+    print(f"{label:>6}: {users / elapsed:8.0f} CVs/s   {statements[0] / users:5.2f} statements/CV")
+    return [cv_data for _, cv_data in iter_cv_data()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--entries", type=int, default=3, help="entries per CV section")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ.setdefault("DATABASE_URL", f"sqlite:///{tmp_dir}/bench.db")
+        sys.path.insert(0, BACKEND_DIR)
+        sys.path.insert(0, BENCH_DIR)
+        import app.models  # noqa: F401 - registers the tables
+        from app.services.cv_import import import_cvs
+
+        lines = make_lines(args.users, args.entries)
+        print(f"{args.users} CVs, {args.entries} entries per section")
+
+        def batched():
+            result = import_cvs(lines, batch_size=args.batch_size)
+            assert result.imported == args.users, result
+            return result.imported
+
+        def orm():
+            orm_import(lines, args.batch_size)
+            return args.users
+
+        orm_dump = measure("orm", orm)
+        batched_dump = measure("batch", batched)
+        assert orm_dump == batched_dump, "imports differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark CV loading strategies against CV size.
+
+Compares the old single-SELECT joinedload of every collection with the
+CV_LOAD_OPTIONS used by get_user_cv_data, reporting statements issued,
+rows returned by the database and median load latency.
+
+Usage (from the backend directory):
+    python benchmarks/bench_cv_loading.py [--sizes 1,2,5,10] [--iterations 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import joinedload, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.cv_export import CV_LOAD_OPTIONS
+from app.core.database import Base
+from app.models import User, Profile, Education, Experience, Certification, Project, Skills
+
+JOINED_OPTIONS = (
+    joinedload(Profile.education),
+    joinedload(Profile.experience),
+    joinedload(Profile.certifications),
+    joinedload(Profile.projects),
+    joinedload(Profile.skills),
+)
+
+
+def seed_profile(session, user_id: int, size: int) -> None:
+    """Create a profile with ``size`` entries in every section."""
+    user = User(id=user_id, email=f"bench{user_id}@example.com", hashed_password="x")
+    profile = Profile(
+        user=user, first_name="Bench", last_name=str(size), email=user.email
+    )
+    profile.education = [
+        Education(degree=f"Degree {i}", institution="University", details=["a", "b"])
+        for i in range(size)
+    ]
+    profile.experience = [
+        Experience(
+            company=f"Company {i}", role="Engineer", start_date="2020-01",
+            bullets=["Shipped things", "Measured impact"],
+        )
+        for i in range(size)
+    ]
+    profile.certifications = [
+        Certification(name=f"Cert {i}", issuer="Issuer") for i in range(size)
+    ]
+    profile.projects = [
+        Project(name=f"Project {i}", impact="Impact", technologies=["python"])
+        for i in range(size)
+    ]
+    profile.skills = Skills(languages=["python"], tools=["git"], methods=["tdd"])
+    session.add(user)
+    session.commit()
+
+
+class StatementRecorder:
+    """Records statements and re-runs them to count the rows they return."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement, parameters))
+
+    def count_rows(self) -> int:
+        raw = self.engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            total = 0
+            for statement, parameters in self.statements:
+                cursor.execute(statement, parameters)
+                total += len(cursor.fetchall())
+            return total
+        finally:
+            raw.close()
+
+
+def load(Session, user_id: int, options) -> None:
+    session = Session()
+    try:
+        session.query(Profile).options(*options).filter(Profile.user_id == user_id).first()
+    finally:
+        session.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1,2,5,10")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+
+    for user_id, size in enumerate(sizes, start=1):
+        seed_profile(Session(), user_id, size)
+
+    print(f"{'size':>5} {'strategy':>10} {'queries':>8} {'rows':>8} {'median ms':>10}")
+    for user_id, size in enumerate(sizes, start=1):
+        for name, options in (("joined", JOINED_OPTIONS), ("selectin", CV_LOAD_OPTIONS)):
+            recorder = StatementRecorder(engine)
+            load(Session, user_id, options)
+            event.remove(engine, "before_cursor_execute", recorder._record)
+            queries, rows = len(recorder.statements), recorder.count_rows()
+
+            timings = []
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                load(Session, user_id, options)
+                timings.append((time.perf_counter() - start) * 1000)
+            print(
+                f"{size:>5} {name:>10} {queries:>8} {rows:>8} "
+                f"{statistics.median(timings):>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
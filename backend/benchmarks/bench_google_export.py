@@ -0,0 +1,107 @@
+"""Measure Google Docs export throughput and latency against the fake API.
+
+Starts benchmarks/fake_google_api.py in process, points the Docs client
+at it and runs --exports first-time exports with --workers running at
+once, as the export job queue does. It then re-exports each document
+after a one-line change, which takes the in-place update path. Reports
+throughput, latency percentiles, failures and the API calls made.
+
+Usage (from the backend directory):
+    python benchmarks/bench_google_export.py [--exports 200] [--workers 4]
+        [--latency 80] [--jitter 40] [--error-rate 0.0] [--entries 5]
+"""
+import argparse
+import copy
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+
+
+def report(label: str, latencies: list, failures: int, elapsed: float) -> None:
+    latencies = sorted(latencies) or [0.0]
+    print(
+        f"{label:>10}: {len(latencies) / elapsed:6.1f} exports/s   "
+        f"p50 {statistics.median(latencies):6.1f} ms   "
+        f"p95 {latencies[int(len(latencies) * 0.95) - 1]:6.1f} ms   "
+        f"p99 {latencies[int(len(latencies) * 0.99) - 1]:6.1f} ms   "
+        f"failed {failures}"
+    )
+
+
+def run_round(label: str, workers: int, jobs: list, export) -> list:
+    """Run ``export`` over ``jobs`` concurrently, returning the results."""
+    latencies, results, failures = [], [], 0
+
+    def timed(job):
+        start = time.perf_counter()
+        try:
+            return export(*job), (time.perf_counter() - start) * 1000
+        except Exception:
+            return None, None
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for result, latency in pool.map(timed, jobs):
+            results.append(result)
+            if result is None:
+                failures += 1
+            else:
+                latencies.append(latency)
+    report(label, latencies, failures, time.perf_counter() - start)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--exports", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=80.0, help="ms per API call")
+    parser.add_argument("--jitter", type=float, default=40.0, help="+/- ms per API call")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--entries", type=int, default=5, help="entries per CV section")
+    args = parser.parse_args()
+
+    sys.path.insert(0, BENCH_DIR)
+    from sample_cv import make_cv
+    from fake_google_api import FakeGoogleAPI
+
+    api = FakeGoogleAPI(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate
+    ).start()
+    os.environ["GOOGLE_DOCS_API_ENDPOINT"] = api.url
+
+    sys.path.insert(0, BACKEND_DIR)
+    from google.oauth2.credentials import Credentials
+    from app.services.google_docs import GoogleDocsService, warm_up_clients
+
+    warm_up_clients()  # as at application startup
+    credentials = Credentials(token="fake-token")
+
+    def export(cv_data, previous=None):
+        return GoogleDocsService(credentials).export_cv_document(cv_data, previous=previous)
+
+    cv_data = make_cv(args.entries)
+    first = run_round("create", args.workers, [(cv_data,)] * args.exports, export)
+
+    changed = copy.deepcopy(cv_data)
+    changed["experience"][0]["role"] = "Staff Engineer"
+    exported = [previous for previous in first if previous is not None]
+    jobs = [(changed, previous) for previous in exported]
+    updated = run_round("update", args.workers, jobs, export)
+
+    reused = sum(
+        1 for previous, result in zip(exported, updated)
+        if result is not None and result["document_id"] == previous["document_id"]
+    )
+    print(f"updated in place: {reused}/{len(jobs)}   documents: {len(api.documents)}")
+    print("API calls:", ", ".join(f"{call} {count}" for call, count in sorted(api.calls.items())))
+    api.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Measure JSON Resume conversion in both directions.
+
+Export: converts --users CVs seeded into a temporary SQLite database
+(see bench_bulk_export.py) to JSON Resume documents, once from the rows
+read by app.services.cv_dump and once from Profile objects loaded
+through the ORM. Import: validates the resulting documents from raw
+bytes with the precompiled adapter, as PUT /cv/json-resume does, and
+with a json.loads followed by model validation, as a plain FastAPI body
+parameter would. Reports documents per second for each and checks that
+every document maps back to the CV it came from.
+
+Usage (from the backend directory):
+    python benchmarks/bench_json_resume.py [--users 5000] [--entries 3]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:>24}: {count / elapsed:8.0f} documents/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--entries", type=int, default=3, help="entries per CV section")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ.setdefault("DATABASE_URL", f"sqlite:///{tmp_dir}/bench.db")
+        sys.path.insert(0, BACKEND_DIR)
+        sys.path.insert(0, BENCH_DIR)
+        from bench_bulk_export import seed
+        from bench_cv_dump import orm_cv_data
+        from app.core.database import Base, engine
+        from app.schemas import JSONResume
+        from app.services.cv_dump import iter_cv_data
+        from app.services.json_resume import RESUME_ADAPTER, from_json_resume, to_json_resume
+
+        Base.metadata.create_all(bind=engine)
+        seed(args.users, args.entries)
+        print(f"{args.users} CVs, {args.entries} entries per section")
+
+        start = time.perf_counter()
+        orm = [to_json_resume(cv_data) for _, cv_data in orm_cv_data(200)]
+        report("export from ORM objects", args.users, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        resumes = [to_json_resume(cv_data) for _, cv_data in iter_cv_data()]
+        report("export from rows", args.users, time.perf_counter() - start)
+        assert orm == resumes, "exports differ"
+
+        bodies = [json.dumps(resume).encode() for resume in resumes]
+        start = time.perf_counter()
+        for body in bodies:
+            JSONResume.model_validate(json.loads(body))
+        report("import via json.loads", args.users, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for body in bodies:
+            RESUME_ADAPTER.validate_json(body)
+        report("import via adapter", args.users, time.perf_counter() - start)
+
+        validated = (RESUME_ADAPTER.validate_json(body) for body in bodies)
+        for resume, (_, cv_data) in zip(validated, iter_cv_data()):
+            assert from_json_resume(resume).model_dump() == cv_data, "round trip differs"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Measure CRUD latency while a burst of logins is hashing passwords.
+
+Reads GET /profile in a loop, first on an idle server and then while
+--logins concurrent logins run, and reports read latency percentiles
+alongside how many logins succeeded or were shed with 503.
+
+Usage (from the backend directory):
+    python benchmarks/bench_login_storm.py [--logins 200] [--reads 200]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def read_latencies(client, headers, count: int) -> list:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = await client.get("/api/v1/profile", headers=headers)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return sorted(latencies)
+
+
+def report(label: str, latencies: list) -> None:
+    print(
+        f"{label:>12} p50 {statistics.median(latencies):7.1f} ms   "
+        f"p99 {latencies[int(len(latencies) * 0.99) - 1]:7.1f} ms"
+    )
+
+
+async def run(logins: int, reads: int) -> None:
+    import httpx
+
+    sys.path.insert(0, BACKEND_DIR)
+    from main import app
+    from app.core.security import hash_pool
+
+    hash_pool.warm_up()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        credentials = {"email": "storm@example.com", "password": "storm"}
+        response = await client.post("/api/v1/auth/signup", json=credentials)
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        await client.post(
+            "/api/v1/profile",
+            json={"first_name": "Storm", "last_name": "User", "email": credentials["email"]},
+            headers=headers,
+        )
+
+        report("idle", await read_latencies(client, headers, reads))
+
+        storm = asyncio.gather(
+            *(client.post("/api/v1/auth/login", json=credentials) for _ in range(logins))
+        )
+        latencies, responses = await asyncio.gather(
+            read_latencies(client, headers, reads), storm
+        )
+        report("login storm", latencies)
+
+    codes = [response.status_code for response in responses]
+    print(f"logins: {codes.count(200)} ok, {codes.count(503)} shed with 503")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--reads", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ.setdefault("DATABASE_URL", f"sqlite:///{tmp_dir}/bench.db")
+        asyncio.run(run(args.logins, args.reads))
+
+
+if __name__ == "__main__":
+    main()
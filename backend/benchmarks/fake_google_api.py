@@ -0,0 +1,284 @@
+"""Local stand-in for the Google Docs API.
+
+Implements the calls the export path makes (documents.create,
+documents.batchUpdate, documents.get) and the OAuth token endpoint
+against in-memory documents, with configurable latency and error
+injection. batchUpdate checks request indices against the document text
+and honours writeControl, so in-place re-exports are exercised the way
+Google would accept or reject them.
+
+Point the backend at it with:
+    GOOGLE_DOCS_API_ENDPOINT=http://127.0.0.1:8090/
+    GOOGLE_TOKEN_URI=http://127.0.0.1:8090/token
+    OAUTHLIB_INSECURE_TRANSPORT=1  # oauthlib refuses plain-HTTP token URLs
+
+Usage (from the backend directory):
+    python benchmarks/fake_google_api.py [--port 8090] [--latency 80]
+        [--jitter 40] [--error-rate 0.01] [--error-status 503]
+"""
+import argparse
+import itertools
+import json
+import random
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+class ApiError(Exception):
+    """An error response in the Google API JSON format."""
+
+    def __init__(self, code: int, message: str, status: str):
+        self.code = code
+        self.message = message
+        self.status = status
+
+    def body(self) -> Dict[str, Any]:
+        return {"error": {"code": self.code, "message": self.message, "status": self.status}}
+
+
+class FakeDocument:
+    """Document text plus a revision counter.
+
+    Index 1 is the first character and the body always ends with the
+    newline Google keeps at the end of a document.
+    """
+
+    def __init__(self, document_id: str, title: str):
+        self.document_id = document_id
+        self.title = title
+        self.text = "\n"
+        self.revision = 1
+
+    @property
+    def revision_id(self) -> str:
+        return f"{self.document_id}-r{self.revision}"
+
+    def apply(self, request: Dict[str, Any]) -> None:
+        kind, body = next(iter(request.items()))
+        if kind == "insertText":
+            index = body["location"]["index"]
+            self._check(1 <= index <= len(self.text), f"insertText index {index}")
+            self.text = self.text[:index - 1] + body["text"] + self.text[index - 1:]
+        elif kind == "deleteContentRange":
+            start, end = body["range"]["startIndex"], body["range"]["endIndex"]
+            self._check(1 <= start < end <= len(self.text), f"delete range {start}-{end}")
+            self.text = self.text[:start - 1] + self.text[end - 1:]
+        elif kind in ("updateTextStyle", "updateParagraphStyle"):
+            start, end = body["range"]["startIndex"], body["range"]["endIndex"]
+            self._check(1 <= start <= end <= len(self.text) + 1, f"{kind} range {start}-{end}")
+            self._check(bool(body.get("fields")), f"{kind} without fields")
+        else:
+            raise ApiError(400, f"Unsupported request: {kind}", "INVALID_ARGUMENT")
+
+    def _check(self, condition: bool, what: str) -> None:
+        if not condition:
+            raise ApiError(
+                400, f"Invalid requests: {what} is outside the document", "INVALID_ARGUMENT"
+            )
+
+    def as_resource(self) -> Dict[str, Any]:
+        content = []
+        index = 1
+        for line in self.text.splitlines(keepends=True):
+            content.append({
+                "startIndex": index,
+                "endIndex": index + len(line),
+                "paragraph": {"elements": [{"textRun": {"content": line}}]},
+            })
+            index += len(line)
+        return {
+            "documentId": self.document_id,
+            "title": self.title,
+            "revisionId": self.revision_id,
+            "body": {"content": content},
+        }
+
+
+class FakeGoogleAPI:
+    """Threaded HTTP server holding fake documents in memory."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.documents: Dict[str, FakeDocument] = {}
+        self.calls: Dict[str, int] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like Google's frontends
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out in separate writes; without this
+                # Nagle's algorithm adds ~40 ms to every response.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET(self):
+                api.handle(self, "GET")
+
+            def do_POST(self):
+                api.handle(self, "POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FakeGoogleAPI":
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        length = int(handler.headers.get("Content-Length") or 0)
+        raw = handler.rfile.read(length) if length else b""
+        path = handler.path.split("?", 1)[0]
+
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        try:
+            if self.error_rate and random.random() < self.error_rate:
+                raise ApiError(self.error_status, "Injected failure", "UNAVAILABLE")
+            if method == "POST" and path == "/token":
+                code, body = self._count("oauth.token", self.token(parse_qs(raw.decode())))
+            elif not handler.headers.get("Authorization", "").startswith("Bearer "):
+                raise ApiError(401, "Request is missing a bearer token", "UNAUTHENTICATED")
+            else:
+                code, body = self.route(method, path, json.loads(raw) if raw else {})
+        except ApiError as error:
+            code, body = error.code, error.body()
+
+        payload = json.dumps(body).encode()
+        handler.send_response(code)
+        handler.send_header("Content-Type", "application/json; charset=UTF-8")
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def route(self, method: str, path: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        match = re.fullmatch(r"/v1/documents(?:/([^/:]+))?(:batchUpdate)?", path)
+        if match:
+            document_id, batch = match.groups()
+            if method == "POST" and document_id is None:
+                return self._count("documents.create", self.create(body))
+            if method == "POST" and batch:
+                return self._count("documents.batchUpdate", self.batch_update(document_id, body))
+            if method == "GET" and document_id and not batch:
+                return self._count("documents.get", (200, self._get(document_id).as_resource()))
+
+        raise ApiError(404, f"No fake for {method} {path}", "NOT_FOUND")
+
+    def token(self, form: Dict[str, List[str]]) -> Tuple[int, Any]:
+        """OAuth token endpoint: any authorization code or refresh token is accepted."""
+        grant_type = form.get("grant_type", [""])[0]
+        if grant_type not in ("authorization_code", "refresh_token"):
+            return 400, {"error": "unsupported_grant_type"}
+        body = {
+            "access_token": f"fake-access-{next(self._ids)}",
+            "expires_in": 3599,
+            "token_type": "Bearer",
+            "scope": " ".join(form.get("scope", [])) or None,
+        }
+        if grant_type == "authorization_code":
+            body["refresh_token"] = f"fake-refresh-{next(self._ids)}"
+        return 200, {key: value for key, value in body.items() if value is not None}
+
+    def create(self, body: Dict[str, Any]) -> Tuple[int, Any]:
+        document_id = f"fake-doc-{next(self._ids)}"
+        document = FakeDocument(document_id, body.get("title", "Untitled document"))
+        with self._lock:
+            self.documents[document_id] = document
+        return 200, document.as_resource()
+
+    def batch_update(self, document_id: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        document = self._get(document_id)
+        requests = body.get("requests") or []
+        required = (body.get("writeControl") or {}).get("requiredRevisionId")
+        with self._lock:
+            if required and required != document.revision_id:
+                raise ApiError(
+                    400, "The document was modified after the required revision",
+                    "FAILED_PRECONDITION",
+                )
+            # Requests apply atomically: roll back if any is rejected.
+            text = document.text
+            try:
+                for request in requests:
+                    document.apply(request)
+            except ApiError:
+                document.text = text
+                raise
+            document.revision += 1
+            return 200, {
+                "documentId": document_id,
+                "replies": [{} for _ in requests],
+                "writeControl": {"requiredRevisionId": document.revision_id},
+            }
+
+    def _get(self, document_id: str) -> FakeDocument:
+        with self._lock:
+            document = self.documents.get(document_id)
+        if document is None:
+            raise ApiError(404, f"Requested entity was not found: {document_id}", "NOT_FOUND")
+        return document
+
+    def _count(self, call: str, result: Tuple[int, Any]) -> Tuple[int, Any]:
+        with self._lock:
+            self.calls[call] = self.calls.get(call, 0) + 1
+        return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.0, help="milliseconds per call")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- milliseconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls")
+    parser.add_argument("--error-status", type=int, default=503)
+    args = parser.parse_args()
+
+    api = FakeGoogleAPI(
+        args.host, args.port, args.latency, args.jitter, args.error_rate, args.error_status
+    )
+    print(f"Fake Google API listening on {api.url}")
+    try:
+        api.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
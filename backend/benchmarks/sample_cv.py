@@ -0,0 +1,30 @@
+"""Sample CV data shared by the benchmarks and tests."""
+
+
+def make_cv(entries: int) -> dict:
+    """CV data with ``entries`` entries in every section."""
+    return {
+        "profile": {
+            "first_name": "Plan", "last_name": "User", "email": "plan@example.com",
+            "phone": "555-0100", "location": "Boston, MA", "summary": "Builds things.",
+        },
+        "education": [
+            {"institution": f"University {i}", "location": "Cambridge, MA",
+             "degree": "BSc Computer Science", "start_date": "2010", "end_date": "2014"}
+            for i in range(entries)
+        ],
+        "experience": [
+            {"company": f"Company {i}", "location": "Remote", "role": "Engineer",
+             "start_date": "2020-01", "bullets": ["Shipped things", "Fixed things", "Led things"]}
+            for i in range(entries)
+        ],
+        "projects": [
+            {"name": f"Project {i}", "impact": "Saved time", "technologies": ["Python", "SQL"]}
+            for i in range(entries)
+        ],
+        "certifications": [
+            {"name": f"Certificate {i}", "issuer": "Issuer", "date": "2021"}
+            for i in range(entries)
+        ],
+        "skills": {"languages": ["Python", "Go"], "tools": ["Docker"], "methods": ["TDD"]},
+    }
@@ -0,0 +1,45 @@
+"""Dump all CV data as newline-delimited JSON, one line per profile.
+
+Same output as GET /api/v1/admin/cv/export.ndjson, read straight from
+the database configured in .env.
+
+Usage:
+    python dump_cv_data.py [-o cvs.ndjson] [--active-only] [--batch-size 1000]
+"""
+import argparse
+import sys
+import time
+
+from app.core.config import settings
+from app.services.cv_dump import iter_cv_data, ndjson_lines
+
+
+def dump_cv_data(output, active_only: bool, batch_size: int) -> int:
+    """Write every CV to a binary file object and return how many were written."""
+    count = 0
+    for line in ndjson_lines(iter_cv_data(active_only=active_only, batch_size=batch_size)):
+        output.write(line.encode("utf-8"))
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="file to write; standard output by default")
+    parser.add_argument("--active-only", action="store_true", help="skip deactivated users")
+    parser.add_argument("--batch-size", type=int, default=settings.BULK_EXPORT_BATCH_SIZE,
+                        help="profiles fetched per round trip")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.output:
+        with open(args.output, "wb") as output:
+            count = dump_cv_data(output, args.active_only, args.batch_size)
+    else:
+        count = dump_cv_data(sys.stdout.buffer, args.active_only, args.batch_size)
+        sys.stdout.flush()
+    print(f"✓ Dumped {count} CVs in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Import CVs from newline-delimited JSON, creating a user per line.
+
+Reads the format written by dump_cv_data.py (see POST
+/api/v1/admin/cv/import.ndjson) into the database configured in .env.
+The number of lines handled is saved to a checkpoint file after every
+committed batch; running the same command again resumes from it. Failed
+lines are appended to an errors file as {"line", "error"} objects.
+
+Usage:
+    python import_cv_data.py cvs.ndjson [--checkpoint FILE] [--errors FILE] [--batch-size 500]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from app.core.config import settings
+from app.services.cv_import import import_cvs
+
+
+def read_checkpoint(path: str) -> int:
+    """Lines already handled by a previous run, 0 when starting afresh."""
+    try:
+        with open(path) as f:
+            return int(f.read().strip() or 0)
+    except FileNotFoundError:
+        return 0
+
+
+def write_checkpoint(path: str, checkpoint: int) -> None:
+    """Replace the checkpoint file atomically, so a crash never leaves it half written."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(f"{checkpoint}\n")
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="NDJSON file, one CV per line")
+    parser.add_argument("--checkpoint", help="progress file; INPUT.checkpoint by default")
+    parser.add_argument("--errors", help="failed lines; INPUT.errors.ndjson by default")
+    parser.add_argument("--batch-size", type=int, default=settings.IMPORT_BATCH_SIZE,
+                        help="lines validated and committed together")
+    args = parser.parse_args()
+    checkpoint_path = args.checkpoint or f"{args.input}.checkpoint"
+    errors_path = args.errors or f"{args.input}.errors.ndjson"
+
+    start = read_checkpoint(checkpoint_path)
+    if start:
+        print(f"Resuming after line {start}", file=sys.stderr)
+
+    began = time.perf_counter()
+    with open(args.input, "rb") as lines, open(errors_path, "a", encoding="utf-8") as errors:
+
+        def on_batch(result, batch_errors):
+            for error in batch_errors:
+                errors.write(json.dumps(error, ensure_ascii=False) + "\n")
+            errors.flush()
+            write_checkpoint(checkpoint_path, result.checkpoint)
+
+        result = import_cvs(lines, start=start, batch_size=args.batch_size, on_batch=on_batch)
+
+    print(
+        f"✓ Imported {result.imported} CVs in {time.perf_counter() - began:.1f}s "
+        f"({result.skipped} existing accounts skipped, {result.failed} failed)",
+        file=sys.stderr,
+    )
+    if result.failed:
+        print(f"  Failed lines are listed in {errors_path}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
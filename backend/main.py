@@ -1,12 +1,25 @@
 """Main FastAPI application."""
-from fastapi import FastAPI
+import logging
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.core.config import settings
-from app.core.database import Base, engine
-from app.api import auth, profile, cv_data, cv_export, google_oauth
+from app.core.database import Base, async_engine, engine, pool_status, upgrade_schema
+from app.core.security import hash_pool
+from app.core.workers import PoolSaturated
+from app.api import auth, profile, cv_data, cv_export, google_oauth, admin
+from app.api.dependencies import get_current_admin
+from app.services.cv_bulk import bulk_pool
+from app.services.export_jobs import export_queue
+from app.services.google_docs import warm_up_clients
+from app.services.pdf_renderer import pdf_pool
+from app.services.render_cache import render_cache
 
-# Create database tables
+logger = logging.getLogger(__name__)
+
+# Create database tables, and add columns newer than an existing database
 Base.metadata.create_all(bind=engine)
+upgrade_schema(engine)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -22,14 +35,73 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # The frontend reads ETag for If-Match saves, the export filename and
+    # the location of queued jobs.
+    expose_headers=["ETag", "Content-Disposition", "Location"],
 )
 
 # Include routers
+if settings.DB_ASYNC:
+    # Registered first so its routes shadow the matching sync ones.
+    from app.api import async_routes
+
+    app.include_router(async_routes.router, prefix=settings.API_V1_STR)
 app.include_router(auth.router, prefix=settings.API_V1_STR)
 app.include_router(profile.router, prefix=settings.API_V1_STR)
 app.include_router(cv_data.router, prefix=settings.API_V1_STR)
 app.include_router(cv_export.router, prefix=settings.API_V1_STR)
 app.include_router(google_oauth.router, prefix=settings.API_V1_STR, tags=["google"])
+app.include_router(admin.router, prefix=settings.API_V1_STR)
+
+
+@app.exception_handler(PoolSaturated)
+async def pool_saturated_handler(request: Request, exc: PoolSaturated):
+    """Reject work that would queue behind a saturated worker pool."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.on_event("startup")
+def start_workers():
+    """Start worker pools so the first request does not pay the spawn cost.
+
+    Also picks up the export jobs a previous run left unfinished.
+    """
+    hash_pool.warm_up()
+    try:
+        pdf_pool.warm_up()
+    except Exception as e:
+        # PDF export reports the failure per request; the API stays up.
+        logger.warning("PDF render workers failed to start: %s", e)
+    try:
+        warm_up_clients()
+    except Exception as e:
+        logger.warning("Google API clients failed to load: %s", e)
+    export_queue.resume()
+
+
+@app.on_event("startup")
+def prune_render_cache():
+    """Drop renders left past the cache caps by earlier runs."""
+    try:
+        render_cache.prune()
+    except OSError as e:
+        logger.warning("Render cache could not be pruned: %s", e)
+
+
+@app.on_event("shutdown")
+async def stop_workers():
+    """Stop worker pools and close database connections."""
+    hash_pool.shutdown()
+    pdf_pool.shutdown()
+    bulk_pool.shutdown()
+    export_queue.shutdown()
+    google_oauth.oauth_pool.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 @app.get("/")
@@ -46,3 +118,9 @@ def root():
 def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/health/db", dependencies=[Depends(get_current_admin)])
+def database_health():
+    """Connection pool occupancy and checkout wait metrics, for admins only."""
+    return pool_status()
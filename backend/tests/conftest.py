@@ -0,0 +1,69 @@
+"""Shared fixtures: the app running against a throwaway SQLite database.
+
+Run from the backend directory:
+    python -m pytest
+"""
+import os
+import sys
+import tempfile
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_DIR = tempfile.mkdtemp(prefix="harvard-cv-tests-")
+
+# Settings are read once at import, so point them away from real data first.
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DIR}/test.db"
+os.environ["RENDER_CACHE_DIR"] = os.path.join(TEST_DIR, "renders")
+sys.path.insert(0, BACKEND_DIR)
+# The fake Google API and sample CVs are shared with the benchmarks.
+sys.path.insert(0, os.path.join(BACKEND_DIR, "benchmarks"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from main import app  # noqa: E402
+
+API = "/api/v1"
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    return TestClient(app)
+
+
+def new_user_credentials() -> dict:
+    """Credentials of a user no other test uses."""
+    return {"email": f"user-{uuid.uuid4().hex[:12]}@example.com", "password": "secret"}
+
+
+def signup(client: TestClient) -> dict:
+    """Sign up a new user and return their bearer headers."""
+    response = client.post(f"{API}/auth/signup", json=new_user_credentials())
+    assert response.status_code == 201, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def auth_headers(client) -> dict:
+    """Bearer headers of a freshly signed-up user."""
+    return signup(client)
+
+
+@contextmanager
+def count_queries() -> Iterator[List[str]]:
+    """Collect the SQL statements sent to the database inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
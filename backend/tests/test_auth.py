@@ -0,0 +1,44 @@
+"""Signup, login and password reset through the async handlers."""
+from conftest import API, new_user_credentials
+from app.core.database import SessionLocal
+from app.models import User
+
+
+def test_login_checks_password(client):
+    credentials = new_user_credentials()
+    assert client.post(f"{API}/auth/signup", json=credentials).status_code == 201
+
+    assert client.post(f"{API}/auth/login", json=credentials).status_code == 200
+    wrong = {**credentials, "password": "not-it"}
+    assert client.post(f"{API}/auth/login", json=wrong).status_code == 401
+
+
+def test_password_reset_replaces_password(client):
+    credentials = new_user_credentials()
+    client.post(f"{API}/auth/signup", json=credentials)
+    response = client.post(f"{API}/auth/password-reset-request", json={"email": credentials["email"]})
+    assert response.status_code == 200
+    with SessionLocal() as db:
+        token = db.query(User).filter(User.email == credentials["email"]).one().reset_token
+
+    response = client.post(f"{API}/auth/password-reset", json={"token": token, "new_password": "new-secret"})
+    assert response.status_code == 200, response.text
+
+    assert client.post(f"{API}/auth/login", json=credentials).status_code == 401
+    renewed = {**credentials, "password": "new-secret"}
+    assert client.post(f"{API}/auth/login", json=renewed).status_code == 200
+    # The token is single-use.
+    response = client.post(f"{API}/auth/password-reset", json={"token": token, "new_password": "again"})
+    assert response.status_code == 400
+
+
+def test_password_reset_request_does_not_log_token(client, caplog):
+    credentials = new_user_credentials()
+    client.post(f"{API}/auth/signup", json=credentials)
+    with caplog.at_level("DEBUG"):
+        client.post(f"{API}/auth/password-reset-request", json={"email": credentials["email"]})
+    with SessionLocal() as db:
+        token = db.query(User).filter(User.email == credentials["email"]).one().reset_token
+
+    assert token
+    assert token not in caplog.text
@@ -0,0 +1,116 @@
+"""Batched create/update/delete on CV sections."""
+import re
+
+import pytest
+
+from conftest import API, count_queries, signup
+
+PROFILE = {"first_name": "Ana", "last_name": "Lopez", "email": "ana@example.com"}
+WRITE = re.compile(r"^(INSERT|UPDATE|DELETE)(?: INTO| FROM)? (\w+)")
+
+
+def project(name: str) -> dict:
+    return {"name": name, "impact": f"Impact of {name}", "technologies": ["Python"]}
+
+
+def new_cv(client) -> dict:
+    """Headers of a new user with a profile."""
+    headers = signup(client)
+    assert client.post(f"{API}/profile", json=PROFILE, headers=headers).status_code == 201
+    return headers
+
+
+@pytest.fixture
+def headers(client) -> dict:
+    return new_cv(client)
+
+
+def create_projects(client, headers: dict, *names: str) -> list:
+    return [
+        client.post(f"{API}/projects", json=project(name), headers=headers).json()["id"]
+        for name in names
+    ]
+
+
+def batch(client, headers: dict, *operations: dict):
+    return client.post(f"{API}/projects:batch", json={"operations": list(operations)}, headers=headers)
+
+
+def projects_by_id(client, headers: dict) -> dict:
+    return {item["id"]: item["name"] for item in client.get(f"{API}/projects", headers=headers).json()}
+
+
+def test_mixed_batch_applies_in_one_request(client, headers):
+    kept, dropped = create_projects(client, headers, "Kept", "Dropped")
+
+    response = batch(
+        client, headers,
+        {"op": "create", "data": project("New A")},
+        {"op": "update", "id": kept, "data": project("Renamed")},
+        {"op": "delete", "id": dropped},
+        {"op": "create", "data": project("New B")},
+    )
+
+    assert response.status_code == 200, response.text
+    results = response.json()["results"]
+    assert [(r["op"], r["status"]) for r in results] == [
+        ("create", "created"), ("update", "updated"), ("delete", "deleted"), ("create", "created"),
+    ]
+    assert results[1]["item"]["name"] == "Renamed"
+    assert projects_by_id(client, headers) == {
+        results[0]["id"]: "New A", kept: "Renamed", results[3]["id"]: "New B",
+    }
+
+
+def test_items_of_another_user_are_not_found(client, headers):
+    (theirs,) = create_projects(client, headers, "Theirs")
+    intruder = new_cv(client)
+
+    response = batch(
+        client, intruder,
+        {"op": "update", "id": theirs, "data": project("Hijacked")},
+        {"op": "delete", "id": theirs + 1000},
+    )
+
+    assert response.status_code == 200
+    assert [r["status"] for r in response.json()["results"]] == ["not_found", "not_found"]
+    assert projects_by_id(client, headers) == {theirs: "Theirs"}
+
+    response = batch(client, intruder, {"op": "delete", "id": theirs})
+    assert response.json()["results"][0]["status"] == "not_found"
+    assert projects_by_id(client, headers) == {theirs: "Theirs"}
+
+
+def test_created_ids_follow_request_order(client, headers):
+    names = [f"Project {i}" for i in range(25)]
+
+    response = batch(client, headers, *({"op": "create", "data": project(name)} for name in names))
+
+    results = response.json()["results"]
+    assert [r["item"]["name"] for r in results] == names
+    # Each returned id is the row holding that entry, not just any new id.
+    stored = projects_by_id(client, headers)
+    assert [stored[r["id"]] for r in results] == names
+
+
+def batch_statements(client, headers: dict, size: int) -> list:
+    """Statements of a batch with ``size`` creates, updates and deletes."""
+    existing = create_projects(client, headers, *(f"Old {i}" for i in range(2 * size)))
+    operations = (
+        [{"op": "create", "data": project(f"New {i}")} for i in range(size)]
+        + [{"op": "update", "id": id_, "data": project("Updated")} for id_ in existing[:size]]
+        + [{"op": "delete", "id": id_} for id_ in existing[size:]]
+    )
+    with count_queries() as statements:
+        response = batch(client, headers, *operations)
+    assert response.status_code == 200, response.text
+    return statements
+
+
+def test_batch_uses_one_statement_per_kind_of_write(client):
+    small = batch_statements(client, new_cv(client), 1)
+    large = batch_statements(client, new_cv(client), 10)
+
+    assert len(small) == len(large)
+    writes = sorted(" ".join(WRITE.match(s).groups()) for s in large if WRITE.match(s))
+    assert writes == ["DELETE projects", "INSERT projects", "UPDATE profiles", "UPDATE projects"]
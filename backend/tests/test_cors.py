@@ -0,0 +1,17 @@
+"""Cross-origin access from the frontend dev server."""
+from conftest import API
+
+FRONTEND_ORIGIN = "http://localhost:5173"
+
+
+def test_frontend_can_read_etag(client, auth_headers):
+    profile = {"first_name": "Ana", "last_name": "Lopez", "email": "ana@example.com"}
+    assert client.post(f"{API}/profile", json=profile, headers=auth_headers).status_code == 201
+
+    response = client.get(f"{API}/cv/data", headers={**auth_headers, "Origin": FRONTEND_ORIGIN})
+    assert response.headers["etag"]
+    exposed = {
+        header.strip().lower()
+        for header in response.headers["access-control-expose-headers"].split(",")
+    }
+    assert {"etag", "content-disposition", "location"} <= exposed
@@ -0,0 +1,68 @@
+"""PUT /cv/data writes only the rows that changed."""
+import copy
+import re
+
+import pytest
+
+from conftest import API, count_queries
+from sample_cv import make_cv
+
+ENTRIES = 5
+
+
+WRITE = re.compile(r"^(INSERT|UPDATE|DELETE)(?: INTO| FROM)? (\w+)")
+
+
+def writes(statements) -> list:
+    """The writes among ``statements`` as sorted "VERB table" strings."""
+    matches = (WRITE.match(statement) for statement in statements)
+    return sorted(" ".join(match.groups()) for match in matches if match)
+
+
+@pytest.fixture
+def saved_cv(client, auth_headers):
+    """A CV with ENTRIES distinct entries per section, saved through PUT /cv/data."""
+    client.post(
+        f"{API}/profile",
+        json={"first_name": "Plan", "last_name": "User", "email": "plan@example.com"},
+        headers=auth_headers,
+    )
+    response = client.put(f"{API}/cv/data", json=make_cv(ENTRIES), headers=auth_headers)
+    assert response.status_code == 200, response.text
+    # As served back, with every optional field filled in.
+    return response.json()
+
+
+def put_cv(client, headers: dict, cv: dict) -> list:
+    with count_queries() as statements:
+        response = client.put(f"{API}/cv/data", json=cv, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json() == cv
+    assert client.get(f"{API}/cv/data", headers=headers).json() == cv
+    return writes(statements)
+
+
+def test_deleting_first_entry_deletes_one_row(client, auth_headers, saved_cv):
+    cv = copy.deepcopy(saved_cv)
+    del cv["experience"][0]
+
+    assert put_cv(client, auth_headers, cv) == ["DELETE experience", "UPDATE profiles"]
+
+
+def test_editing_one_field_updates_one_row(client, auth_headers, saved_cv):
+    cv = copy.deepcopy(saved_cv)
+    cv["projects"][2]["impact"] = "Saved money"
+
+    assert put_cv(client, auth_headers, cv) == ["UPDATE profiles", "UPDATE projects"]
+
+
+def test_moving_first_entry_to_end(client, auth_headers, saved_cv):
+    cv = copy.deepcopy(saved_cv)
+    cv["education"].append(cv["education"].pop(0))
+
+    # Rows are read back in id order, so the moved entry becomes a new row.
+    assert put_cv(client, auth_headers, cv) == ["DELETE education", "INSERT education", "UPDATE profiles"]
+
+
+def test_unchanged_cv_writes_nothing(client, auth_headers, saved_cv):
+    assert put_cv(client, auth_headers, saved_cv) == []
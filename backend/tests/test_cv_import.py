@@ -0,0 +1,53 @@
+"""Progress streamed by POST /admin/cv/import.ndjson."""
+import json
+import uuid
+
+import pytest
+
+from conftest import API, new_user_credentials
+from sample_cv import make_cv
+from app.core.config import settings
+
+
+@pytest.fixture
+def admin_headers(client, monkeypatch):
+    credentials = new_user_credentials()
+    response = client.post(f"{API}/auth/signup", json=credentials)
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [credentials["email"]])
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def import_body(count: int) -> bytes:
+    """``count`` CVs for new accounts, with an invalid line third."""
+    lines = []
+    for _ in range(count):
+        cv = make_cv(1)
+        cv["profile"]["email"] = f"import-{uuid.uuid4().hex[:12]}@example.com"
+        lines.append(json.dumps(cv))
+    lines.insert(2, '{"profile": {}}')
+    return ("\n".join(lines) + "\n").encode()
+
+
+def test_import_streams_a_checkpoint_per_batch(client, admin_headers, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 2)
+
+    response = client.post(f"{API}/admin/cv/import.ndjson", content=import_body(5), headers=admin_headers)
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["checkpoint"] for line in lines] == [2, 4, 6, 6]
+    assert [len(line["errors"]) for line in lines[:-1]] == [0, 1, 0]
+    assert lines[1]["errors"][0]["line"] == 3
+    assert lines[-1]["done"] is True
+    assert (lines[-1]["imported"], lines[-1]["failed"]) == (5, 1)
+
+
+def test_import_resumes_from_checkpoint(client, admin_headers):
+    response = client.post(
+        f"{API}/admin/cv/import.ndjson", content=import_body(5), headers=admin_headers, params={"start": 4}
+    )
+
+    final = json.loads(response.text.splitlines()[-1])
+    assert final["done"] is True
+    assert (final["checkpoint"], final["imported"], final["failed"]) == (6, 2, 0)
@@ -0,0 +1,34 @@
+"""CV snapshots served to exports follow edits made outside this process."""
+from sqlalchemy import update
+
+from conftest import API
+from app.api.etags import profile_version_bump
+from app.core.database import SessionLocal
+from app.models import Profile
+
+PROFILE = {"first_name": "Ana", "last_name": "Lopez", "email": "ana@example.com"}
+
+
+def edit_elsewhere(profile_id: int, **values) -> None:
+    """Change a profile the way another worker process would, bypassing this one's cache."""
+    with SessionLocal() as db:
+        db.execute(update(Profile).where(Profile.id == profile_id).values(**values))
+        db.execute(profile_version_bump(profile_id))
+        db.commit()
+
+
+def test_exports_serve_current_version(client, auth_headers):
+    response = client.post(f"{API}/profile", json=PROFILE, headers=auth_headers)
+    assert response.status_code == 201, response.text
+    profile_id = response.json()["id"]
+    # Warm the snapshot cache.
+    resume = client.get(f"{API}/cv/json-resume", headers=auth_headers).json()
+    assert resume["basics"]["name"] == "Ana Lopez"
+
+    edit_elsewhere(profile_id, first_name="Ada")
+
+    resume = client.get(f"{API}/cv/json-resume", headers=auth_headers).json()
+    assert resume["basics"]["name"] == "Ada Lopez"
+    markdown = client.get(f"{API}/cv/export/markdown", headers=auth_headers)
+    assert markdown.status_code == 200, markdown.text
+    assert "Ada Lopez" in markdown.text
@@ -0,0 +1,66 @@
+"""Size of the Google Docs batchUpdate plan as the CV grows."""
+import json
+
+import pytest
+
+from sample_cv import make_cv
+from app.services.google_docs import GoogleDocsService, _shift
+
+SIZES = (1, 5, 20, 50)
+
+# The compiled plan: fixed requests for the header, skills and section
+# titles, then two per section entry (four sections, one entry each per
+# size step).
+BASE_OPS = 17
+OPS_PER_ENTRY = 8
+# Payload bytes: text plus style ranges, about 1.4 KB per size step.
+BASE_BYTES = 4 * 1024
+BYTES_PER_ENTRY = int(1.5 * 1024)
+
+
+@pytest.fixture(scope="module")
+def service() -> GoogleDocsService:
+    # Only the pure plan builders are used, so no credentials are needed.
+    return GoogleDocsService.__new__(GoogleDocsService)
+
+
+def per_line_plan(service: GoogleDocsService, cv_data: dict) -> list:
+    """The plan as one insert and its styles per line, as the update path builds it."""
+    plan, index = [], 1
+    for requests, length in service._build_cv_segments(cv_data):
+        plan.extend(_shift(requests, index))
+        index += length
+    return plan
+
+
+@pytest.mark.parametrize("entries", SIZES)
+def test_plan_inserts_all_text_at_once(service, entries):
+    cv_data = make_cv(entries)
+    plan = service._build_cv_content(cv_data)
+
+    inserts = [request for request in plan if "insertText" in request]
+    assert len(inserts) == 1
+    assert inserts[0]["insertText"]["text"] == "".join(
+        request["insertText"]["text"]
+        for request in per_line_plan(service, cv_data)
+        if "insertText" in request
+    )
+
+
+@pytest.mark.parametrize("entries", SIZES)
+def test_plan_size_bounds(service, entries):
+    cv_data = make_cv(entries)
+    plan = service._build_cv_content(cv_data)
+    per_line = per_line_plan(service, cv_data)
+    payload = len(json.dumps(plan))
+
+    assert len(plan) <= BASE_OPS + OPS_PER_ENTRY * entries
+    assert len(plan) * 2 < len(per_line)
+    assert payload <= BASE_BYTES + BYTES_PER_ENTRY * entries
+    assert payload * 10 < len(json.dumps(per_line)) * 7
+
+
+def test_plan_grows_linearly(service):
+    """Every added entry costs the same number of requests."""
+    ops = [len(service._build_cv_content(make_cv(entries))) for entries in range(1, 6)]
+    assert {b - a for a, b in zip(ops, ops[1:])} == {OPS_PER_ENTRY}
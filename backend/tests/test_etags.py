@@ -0,0 +1,49 @@
+"""Conditional GET and If-Match preconditions on profile and CV data."""
+from conftest import API
+from sample_cv import make_cv
+
+PROFILE = {"first_name": "Ana", "last_name": "Lopez", "email": "ana@example.com"}
+
+
+def test_get_returns_304_for_current_etag(client, auth_headers):
+    client.post(f"{API}/profile", json=PROFILE, headers=auth_headers)
+
+    for path in ("/profile", "/cv/data"):
+        response = client.get(f"{API}{path}", headers=auth_headers)
+        etag = response.headers["ETag"]
+
+        # Weak comparison: a W/ prefix still matches.
+        for if_none_match in (etag, f"W/{etag}", f'"other", {etag}'):
+            cached = client.get(f"{API}{path}", headers={**auth_headers, "If-None-Match": if_none_match})
+            assert cached.status_code == 304, path
+            assert cached.content == b""
+            assert cached.headers["ETag"] == etag
+
+    client.put(f"{API}/profile", json=dict(PROFILE, summary="Changed"), headers=auth_headers)
+    response = client.get(f"{API}/cv/data", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_put_with_stale_if_match_returns_412(client, auth_headers):
+    client.post(f"{API}/profile", json=PROFILE, headers=auth_headers)
+    etag = client.get(f"{API}/cv/data", headers=auth_headers).headers["ETag"]
+
+    saved = client.put(f"{API}/cv/data", json=make_cv(1), headers={**auth_headers, "If-Match": etag})
+    assert saved.status_code == 200, saved.text
+    assert saved.headers["ETag"] != etag
+
+    stale = client.put(f"{API}/cv/data", json=make_cv(2), headers={**auth_headers, "If-Match": etag})
+    assert stale.status_code == 412
+    assert len(client.get(f"{API}/cv/data", headers=auth_headers).json()["education"]) == 1
+
+
+def test_if_match_uses_strong_comparison(client, auth_headers):
+    client.post(f"{API}/profile", json=PROFILE, headers=auth_headers)
+    etag = client.get(f"{API}/cv/data", headers=auth_headers).headers["ETag"]
+
+    weak = client.put(f"{API}/cv/data", json=make_cv(1), headers={**auth_headers, "If-Match": f"W/{etag}"})
+    assert weak.status_code == 412
+
+    any_version = client.put(f"{API}/cv/data", json=make_cv(1), headers={**auth_headers, "If-Match": "*"})
+    assert any_version.status_code == 200
@@ -0,0 +1,136 @@
+"""Google Docs export jobs: running, taking over stalled ones and resuming."""
+import time
+import uuid
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from fake_google_api import FakeGoogleAPI
+from sample_cv import make_cv
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import ExportJob, User
+from app.services import export_jobs, google_docs
+from app.services.export_jobs import ExportJobQueue, get_active_job
+
+
+class StaticTokenStore:
+    """Hands every job the same credentials and counts the calls."""
+
+    def __init__(self, credentials=None):
+        self.credentials = credentials
+        self.calls = 0
+
+    def get(self, user_id, db):
+        self.calls += 1
+        return self.credentials
+
+
+class ScheduleRecorder(ExportJobQueue):
+    """A queue that records scheduled jobs instead of running them."""
+
+    def __init__(self, **kwargs):
+        super().__init__(max_workers=1, token_store=StaticTokenStore(), **kwargs)
+        self.scheduled = []
+
+    def enqueue(self, job):
+        self.scheduled.append(job.id)
+
+
+@pytest.fixture
+def queued_job():
+    """A committed queued job of a new user, as POST /export/google-docs leaves it."""
+    with SessionLocal() as db:
+        user = User(email=f"export-{uuid.uuid4().hex[:12]}@example.com", hashed_password="-")
+        db.add(user)
+        db.flush()
+        job = ExportJob(user_id=user.id, payload=make_cv(2))
+        db.add(job)
+        db.commit()
+        return job.id, user.id
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    """The process-wide queue, replaced by a ScheduleRecorder."""
+    queue = ScheduleRecorder()
+    monkeypatch.setattr(export_jobs, "export_queue", queue)
+    return queue
+
+
+def get_job(job_id: int) -> ExportJob:
+    with SessionLocal() as db:
+        return db.get(ExportJob, job_id)
+
+
+def test_queued_job_starts_once(queued_job):
+    job_id, _ = queued_job
+    queue = ScheduleRecorder()
+
+    assert queue._start(job_id).payload == make_cv(2)
+    assert get_job(job_id).status == "running"
+    assert get_job(job_id).attempts == 1
+    assert queue._start(job_id) is None
+
+
+def test_stalled_job_is_queued_again(queued_job, recorder, monkeypatch):
+    job_id, user_id = queued_job
+    recorder._start(job_id)
+
+    # The process running it went away; the next poll takes it over.
+    monkeypatch.setattr(settings, "EXPORT_JOB_TIMEOUT", -1)
+    with SessionLocal() as db:
+        assert get_active_job(user_id, db).status == "queued"
+    assert recorder.scheduled == [job_id]
+
+    # Scheduled twice (e.g. by two processes), it still runs once.
+    recorder._start(job_id)
+    assert get_job(job_id).attempts == 2
+    recorder._run(job_id)
+    assert recorder.token_store.calls == 0
+
+
+def test_stalled_job_fails_after_max_attempts(queued_job, recorder, monkeypatch):
+    job_id, user_id = queued_job
+    monkeypatch.setattr(settings, "EXPORT_JOB_MAX_ATTEMPTS", 1)
+    recorder._start(job_id)
+
+    monkeypatch.setattr(settings, "EXPORT_JOB_TIMEOUT", -1)
+    with SessionLocal() as db:
+        assert get_active_job(user_id, db) is None
+    assert get_job(job_id).status == "failed"
+    assert recorder.scheduled == []
+
+
+@pytest.fixture
+def fake_docs(monkeypatch):
+    """Point the Docs client at a local fake API."""
+    api = FakeGoogleAPI().start()
+    monkeypatch.setattr(settings, "GOOGLE_DOCS_API_ENDPOINT", api.url)
+    google_docs.get_api_resource.cache_clear()
+    yield api
+    api.stop()
+    google_docs.get_api_resource.cache_clear()
+
+
+def test_job_left_queued_runs_after_restart(queued_job, fake_docs):
+    job_id, _ = queued_job
+    # A process started after the one that queued the job.
+    queue = ExportJobQueue(
+        max_workers=1, token_store=StaticTokenStore(Credentials(token="fake-token"))
+    )
+    try:
+        queue.resume()
+        deadline = time.monotonic() + 10
+        while get_job(job_id).status in export_jobs.ACTIVE_STATUSES and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        queue.shutdown()
+
+    job = get_job(job_id)
+    assert job.status == "succeeded", job.error
+    assert job.progress == 100
+    assert fake_docs.calls["documents.create"] == 1
+    document = fake_docs.documents[job.document_id]
+    assert "University 1" in document.text
+    assert job.document_url.endswith(f"/d/{job.document_id}/edit")
@@ -0,0 +1,83 @@
+"""Markdown and DOCX exports keep user text from changing document structure."""
+import io
+import zipfile
+from xml.etree import ElementTree
+
+from sample_cv import make_cv
+from app.services.cv_layout import compile_layout
+from app.services.exporters import EXPORTERS
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def render(name: str, cv: dict) -> bytes:
+    return b"".join(EXPORTERS[name].render(compile_layout(cv)))
+
+
+def linked_cv() -> dict:
+    cv = make_cv(1)
+    cv["profile"]["linkedin"] = "linkedin.com/in/plan"
+    cv["projects"][0]["url"] = "https://example.com/project?a=1&b=2"
+    cv["certifications"][0]["url"] = "https://example.com/cert"
+    return cv
+
+
+def test_markdown_escapes_block_markers_at_line_start():
+    cv = make_cv(1)
+    cv["profile"]["summary"] = "- not a list\n+ nor this\n1. nor this\n# nor a heading\n    nor code"
+    cv["experience"][0]["bullets"] = ["- nested?", "2) ordered?", "==="]
+    cv["projects"][0]["impact"] = "3. Saved time"
+
+    # Entry lines end in a two-space hard break.
+    lines = [line.rstrip() for line in render("markdown", cv).decode().splitlines()]
+
+    assert "\\- not a list" in lines
+    assert "\\+ nor this" in lines
+    assert "1\\. nor this" in lines
+    assert "\\# nor a heading" in lines
+    assert "nor code" in lines
+    assert "- \\- nested?" in lines
+    assert "- 2\\) ordered?" in lines
+    assert "- \\===" in lines
+    assert "3\\. Saved time" in lines
+    # Generated structure is untouched.
+    assert "# Plan User" in lines
+    assert "## Experience" in lines
+
+
+def test_markdown_links_urls():
+    markdown = render("markdown", linked_cv()).decode()
+
+    assert "[linkedin.com/in/plan](<https://linkedin.com/in/plan>)" in markdown
+    assert "(<https://example.com/cert>)" in markdown
+
+
+def test_docx_links_urls():
+    archive = zipfile.ZipFile(io.BytesIO(render("docx", linked_cv())))
+    document = ElementTree.fromstring(archive.read("word/document.xml"))
+    rels = ElementTree.fromstring(archive.read("word/_rels/document.xml.rels"))
+
+    targets = {
+        rel.get("Id"): rel.get("Target")
+        for rel in rels.iter(f"{REL}Relationship")
+        if rel.get("TargetMode") == "External"
+    }
+    links = {
+        "".join(t.text for t in link.iter(f"{W}t")): targets[link.get(f"{R}id")]
+        for link in document.iter(f"{W}hyperlink")
+    }
+    assert links == {
+        "linkedin.com/in/plan": "https://linkedin.com/in/plan",
+        "https://example.com/project?a=1&b=2": "https://example.com/project?a=1&b=2",
+        "https://example.com/cert": "https://example.com/cert",
+    }
+    # The contact line reads as before around the link.
+    contact = next(
+        paragraph for paragraph in document.iter(f"{W}p")
+        if "plan@example.com" in "".join(t.text for t in paragraph.iter(f"{W}t"))
+    )
+    assert "".join(t.text for t in contact.iter(f"{W}t")) == (
+        "plan@example.com • 555-0100 • Boston, MA • linkedin.com/in/plan"
+    )
@@ -0,0 +1,83 @@
+"""Google OAuth callback under slow token exchanges."""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from conftest import API, new_user_credentials
+from fake_google_api import FakeGoogleAPI
+from app.api import google_oauth
+from app.core.config import settings
+from main import app
+
+CALLBACKS = 16
+TOKEN_LATENCY_MS = 500.0
+
+
+@pytest.fixture
+def fake_google(monkeypatch):
+    """Point the OAuth flow at a local token endpoint answering after TOKEN_LATENCY_MS."""
+    api = FakeGoogleAPI(latency=TOKEN_LATENCY_MS).start()
+    monkeypatch.setattr(settings, "GOOGLE_CLIENT_ID", "test-client")
+    monkeypatch.setattr(settings, "GOOGLE_CLIENT_SECRET", "test-secret")
+    monkeypatch.setattr(settings, "GOOGLE_TOKEN_URI", f"{api.url}token")
+    # oauthlib refuses plain-HTTP token URLs.
+    monkeypatch.setenv("OAUTHLIB_INSECURE_TRANSPORT", "1")
+    google_oauth.get_client_config.cache_clear()
+    yield api
+    api.stop()
+    google_oauth.get_client_config.cache_clear()
+
+
+async def health_gaps(client: httpx.AsyncClient, until: asyncio.Future) -> list:
+    """Time between consecutive health checks, each sent 5 ms after the last.
+
+    A stalled event loop shows up as a gap, not as a slow check.
+    """
+    gaps = []
+    last = time.perf_counter()
+    while not until.done():
+        response = await client.get("/health")
+        response.raise_for_status()
+        await asyncio.sleep(0.005)
+        now = time.perf_counter()
+        gaps.append((now - last) * 1000)
+        last = now
+    return gaps
+
+
+@pytest.mark.asyncio
+async def test_token_exchanges_do_not_stall_event_loop(fake_google):
+    """Concurrent callbacks complete while the loop keeps serving other requests.
+
+    Before the exchange was offloaded, the loop froze for the whole of
+    every exchange.
+    """
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test", timeout=60
+    ) as client:
+        signup = await client.post(f"{API}/auth/signup", json=new_user_credentials())
+        headers = {"Authorization": f"Bearer {signup.json()['access_token']}"}
+        auth_url = await client.get(f"{API}/auth/google/url", headers=headers)
+        assert auth_url.status_code == 200, auth_url.text
+        state = auth_url.json()["state"]
+
+        storm = asyncio.ensure_future(asyncio.gather(*(
+            client.get(
+                f"{API}/auth/google/callback",
+                params={"code": f"code-{i}", "state": state},
+                headers=headers,
+            )
+            for i in range(CALLBACKS)
+        )))
+        gaps = await health_gaps(client, storm)
+        responses = await storm
+
+    # Callbacks past the pool's queue limit are shed with 503; any other
+    # status means no exchange ran and the gaps below prove nothing.
+    codes = [response.status_code for response in responses]
+    assert set(codes) <= {200, 503}, [r.text for r in responses if r.status_code not in (200, 503)]
+    assert 200 in codes
+    assert fake_google.calls.get("oauth.token", 0) == codes.count(200)
+    assert max(gaps) < TOKEN_LATENCY_MS / 2, "event loop stalled behind a token exchange"
@@ -0,0 +1,21 @@
+"""Health endpoints."""
+from conftest import API, new_user_credentials
+from app.core.config import settings
+
+
+def test_db_health_is_admin_only(client, monkeypatch):
+    assert client.get("/health").json() == {"status": "healthy"}
+    # No bearer token at all
+    assert client.get("/health/db").status_code == 403
+
+    credentials = new_user_credentials()
+    token = client.post(f"{API}/auth/signup", json=credentials).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/health/db", headers=headers).status_code == 403
+
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [credentials["email"]])
+    response = client.get("/health/db", headers=headers)
+    assert response.status_code == 200
+    pool = response.json()["sync"]
+    assert pool["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert pool["size"] == settings.DB_POOL_SIZE
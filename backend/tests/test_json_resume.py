@@ -0,0 +1,89 @@
+"""GET and PUT /cv/json-resume: an exported resume imports back to the same CV."""
+import copy
+
+import pytest
+
+from conftest import API
+from sample_cv import make_cv
+from app.api.cv_export import CV_LOAD_OPTIONS, serialize_cv
+from app.core.database import SessionLocal
+from app.models import Profile
+
+
+def stored_cv(profile_id: int) -> dict:
+    """The CV as serialize_cv reads it from the database, bypassing the snapshot cache."""
+    with SessionLocal() as db:
+        profile = db.query(Profile).options(*CV_LOAD_OPTIONS).filter(Profile.id == profile_id).one()
+        return serialize_cv(profile)
+
+
+@pytest.fixture
+def saved_cv(client, auth_headers):
+    """A saved CV with a two-word first name and ongoing entries, as PUT /cv/data returns it."""
+    cv = make_cv(2)
+    cv["profile"].update(first_name="Mary Ann", last_name="Smith", linkedin="https://www.linkedin.com/in/mas")
+    cv["experience"][0]["end_date"] = "Present"
+    cv["education"][1]["end_date"] = "Present"
+    cv["projects"][0]["url"] = "https://example.com/p"
+    cv["certifications"][0].update(credential_id="ABC-1", url="https://example.com/c")
+    response = client.post(f"{API}/profile", json=cv["profile"], headers=auth_headers)
+    assert response.status_code == 201, response.text
+    profile_id = response.json()["id"]
+    response = client.put(f"{API}/cv/data", json=cv, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    return profile_id, response.json()
+
+
+def put_resume(client, headers, resume: dict) -> dict:
+    response = client.put(f"{API}/cv/json-resume", json=resume, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_resume_round_trip(client, auth_headers, saved_cv):
+    profile_id, cv = saved_cv
+    response = client.get(f"{API}/cv/json-resume", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    resume = response.json()
+    assert resume["basics"]["name"] == "Mary Ann Smith"
+    # JSON Resume marks ongoing entries by leaving out the end date.
+    assert "endDate" not in resume["work"][0]
+    assert "endDate" not in resume["education"][1]
+
+    returned = put_resume(client, {**auth_headers, "If-Match": response.headers["etag"]}, resume)
+
+    expected = copy.deepcopy(cv)
+    expected["experience"][0]["end_date"] = None
+    expected["education"][1]["end_date"] = None
+    assert stored_cv(profile_id) == expected
+    assert client.get(f"{API}/cv/data", headers=auth_headers).json() == expected
+    assert returned == resume
+
+
+def test_new_name_is_split_at_first_space(client, auth_headers, saved_cv):
+    profile_id, _ = saved_cv
+    resume = client.get(f"{API}/cv/json-resume", headers=auth_headers).json()
+    resume["basics"]["name"] = "Mary Ann  Jones"
+
+    put_resume(client, auth_headers, resume)
+
+    profile = stored_cv(profile_id)["profile"]
+    assert (profile["first_name"], profile["last_name"]) == ("Mary", "Ann Jones")
+
+
+def test_unknown_skill_groups_go_to_tools(client, auth_headers, saved_cv):
+    profile_id, cv = saved_cv
+    resume = client.get(f"{API}/cv/json-resume", headers=auth_headers).json()
+    resume["skills"] += [
+        {"name": "Frameworks", "keywords": ["FastAPI", "React"]},
+        {"name": "Kubernetes"},
+        {"name": "methods", "keywords": ["Pairing"]},
+    ]
+
+    put_resume(client, auth_headers, resume)
+
+    assert stored_cv(profile_id)["skills"] == {
+        **cv["skills"],
+        "tools": ["Docker", "FastAPI", "React", "Kubernetes"],
+        "methods": ["TDD", "Pairing"],
+    }
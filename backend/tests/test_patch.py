@@ -0,0 +1,70 @@
+"""PATCH endpoints write only the columns that were sent."""
+import pytest
+
+from conftest import API, count_queries
+
+PROFILE = {"first_name": "Ana", "last_name": "Lopez", "email": "ana@example.com"}
+EXPERIENCE = {
+    "company": "Acme", "role": "Engineer", "location": "Remote",
+    "start_date": "2020-01", "bullets": ["Shipped things"],
+}
+
+
+@pytest.fixture
+def experience(client, auth_headers) -> dict:
+    client.post(f"{API}/profile", json=PROFILE, headers=auth_headers)
+    response = client.post(f"{API}/experience", json=EXPERIENCE, headers=auth_headers)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def updates(statements) -> list:
+    return [statement for statement in statements if statement.startswith("UPDATE")]
+
+
+def test_patch_updates_only_sent_columns(client, auth_headers, experience):
+    path = f"{API}/experience/{experience['id']}"
+    with count_queries() as statements:
+        response = client.patch(path, json={"bullets": ["Shipped more"]}, headers=auth_headers)
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {**experience, "bullets": ["Shipped more"]}
+    experience_update, version_bump = sorted(updates(statements))
+    assert experience_update.startswith("UPDATE experience SET bullets=? WHERE")
+    assert version_bump.startswith("UPDATE profiles SET version=")
+
+
+def test_patch_without_changes_writes_nothing(client, auth_headers, experience):
+    etag = client.get(f"{API}/cv/data", headers=auth_headers).headers["ETag"]
+    with count_queries() as statements:
+        response = client.patch(
+            f"{API}/experience/{experience['id']}", json={"role": "Engineer"}, headers=auth_headers
+        )
+
+    assert response.status_code == 200
+    assert updates(statements) == []
+    assert client.get(f"{API}/cv/data", headers=auth_headers).headers["ETag"] == etag
+
+
+def test_patch_rejects_null_for_required_field(client, auth_headers, experience):
+    path = f"{API}/experience/{experience['id']}"
+    response = client.patch(path, json={"company": None}, headers=auth_headers)
+    assert response.status_code == 422
+    assert "company cannot be null" in response.text
+
+    # Optional columns can be cleared.
+    response = client.patch(path, json={"location": None}, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["location"] is None
+    assert response.json()["company"] == "Acme"
+
+
+def test_patch_profile_keeps_other_fields(client, auth_headers):
+    client.post(f"{API}/profile", json={**PROFILE, "summary": "Builds things."}, headers=auth_headers)
+
+    response = client.patch(f"{API}/profile", json={"phone": "555-0100"}, headers=auth_headers)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["phone"] == "555-0100"
+    assert response.json()["summary"] == "Builds things."
+    assert client.patch(f"{API}/profile", json={"first_name": None}, headers=auth_headers).status_code == 422
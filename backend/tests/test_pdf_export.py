@@ -0,0 +1,53 @@
+"""PDF exports wait on a bounded render pool and are refused when it is full."""
+import threading
+import uuid
+
+import pytest
+
+from conftest import API
+from app.core.workers import ThreadPool
+from app.services import pdf_renderer as pdf_renderer_module
+from app.services.pdf_renderer import pdf_renderer
+
+
+@pytest.fixture
+def render_pool(monkeypatch):
+    """One render slot and no queue, rendering a stub PDF on a thread."""
+    pool = ThreadPool(max_workers=1, max_pending=0, name="test-pdf")
+    monkeypatch.setattr(pdf_renderer, "pool", pool)
+    monkeypatch.setattr(pdf_renderer_module, "_render_pdf", lambda layout: b"%PDF-stub")
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def cv_headers(client, auth_headers):
+    """A new user with a CV no earlier render has cached."""
+    profile = {
+        "first_name": "Ana", "last_name": "Lopez", "email": "ana@example.com",
+        "summary": uuid.uuid4().hex,
+    }
+    response = client.post(f"{API}/profile", json=profile, headers=auth_headers)
+    assert response.status_code == 201, response.text
+    return auth_headers
+
+
+def test_pdf_export_renders(client, cv_headers, render_pool):
+    response = client.get(f"{API}/cv/export/pdf", headers=cv_headers)
+
+    assert response.status_code == 200, response.text
+    assert response.content == b"%PDF-stub"
+    assert "CV_Ana_Lopez.pdf" in response.headers["content-disposition"]
+
+
+def test_pdf_export_is_refused_when_pool_is_full(client, cv_headers, render_pool):
+    release = threading.Event()
+    busy = render_pool.submit(release.wait)
+    try:
+        response = client.get(f"{API}/cv/export/pdf", headers=cv_headers)
+    finally:
+        release.set()
+        busy.result()
+
+    assert response.status_code == 503, response.text
+    assert response.headers["retry-after"] == "1"
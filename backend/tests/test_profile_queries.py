@@ -0,0 +1,66 @@
+"""Profile endpoints load the ProfileResponse graph in a fixed number of queries."""
+from conftest import API, count_queries, signup
+
+# Entries per section in the large CV; the small one has one of each.
+LARGE_SECTION_SIZE = 8
+
+PROFILE = {"first_name": "Ana", "last_name": "Lopez", "email": "ana@example.com"}
+
+
+def create_cv(client, headers: dict, size: int) -> None:
+    """Create a profile with ``size`` entries in every section, plus skills."""
+    assert client.post(f"{API}/profile", json=PROFILE, headers=headers).status_code == 201
+    for i in range(size):
+        for path, item in (
+            ("education", {"degree": "BSc", "institution": f"U{i}", "details": ["d"]}),
+            ("experience", {"company": f"C{i}", "role": "R", "start_date": "2020-01", "bullets": ["b"]}),
+            ("certifications", {"name": f"N{i}", "issuer": "I"}),
+            ("projects", {"name": f"P{i}", "technologies": ["t"]}),
+        ):
+            response = client.post(f"{API}/{path}", json=item, headers=headers)
+            assert response.status_code == 201, response.text
+    assert client.put(f"{API}/skills", json={"tools": ["git"]}, headers=headers).status_code == 200
+
+
+def profile_queries(client, headers: dict, size: int) -> dict:
+    """Statements per endpoint for a CV with ``size`` entries per section."""
+    create_cv(client, headers, size)
+    counts = {}
+
+    with count_queries() as statements:
+        response = client.get(f"{API}/profile", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()["experience"]) == size
+    counts["GET"] = len(statements)
+
+    with count_queries() as statements:
+        response = client.put(f"{API}/profile", json=dict(PROFILE, summary=f"S{size}"), headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()["projects"]) == size
+    counts["PUT"] = len(statements)
+    return counts
+
+
+def test_get_and_put_query_count_does_not_grow_with_sections(client):
+    small = profile_queries(client, signup(client), 1)
+    large = profile_queries(client, signup(client), LARGE_SECTION_SIZE)
+
+    assert small == large
+    # The user is cached by the requests that built the CV. GET: version,
+    # profile joined with skills and one IN query per section; a lazy
+    # load per relationship would add to these.
+    assert small == {"GET": 6, "PUT": 6}
+
+
+def test_create_query_count_is_fixed(client):
+    counts = []
+    for headers in (signup(client), signup(client)):
+        with count_queries() as statements:
+            response = client.post(f"{API}/profile", json=PROFILE, headers=headers)
+        assert response.status_code == 201
+        assert response.json()["education"] == []
+        counts.append(len(statements))
+
+    # Auth, the existing-profile check and the INSERT; the empty sections
+    # of the response are not loaded back.
+    assert counts == [3, 3]
@@ -0,0 +1,50 @@
+"""Size and age caps of the render cache."""
+import os
+import time
+
+from app.services.render_cache import RenderCache
+
+
+def age(path: str, seconds: float) -> None:
+    """Make a cache entry look last used ``seconds`` ago."""
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def test_put_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=2500)
+    for i, name in enumerate(["aa", "bb"]):
+        age(cache.put(name * 32, "pdf", b"x" * 1000), 100 - i)
+    # A hit makes "aa" the most recently used.
+    assert cache.get("aa" * 32, "pdf")
+
+    cache.put("cc" * 32, "pdf", b"x" * 1000)
+
+    assert cache.get("bb" * 32, "pdf") is None
+    assert cache.get("aa" * 32, "pdf") and cache.get("cc" * 32, "pdf")
+
+
+def test_stream_into_counts_towards_cap(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=1500)
+    age(cache.put("aa" * 32, "docx", b"x" * 1000), 100)
+
+    assert b"".join(cache.stream_into("bb" * 32, "docx", [b"y" * 500] * 2)) == b"y" * 1000
+
+    assert cache.get("aa" * 32, "docx") is None
+    assert cache.get("bb" * 32, "docx")
+
+
+def test_prune_drops_expired_entries(tmp_path):
+    cache = RenderCache(str(tmp_path), max_age=3600)
+    age(cache.put("aa" * 32, "pdf", b"old"), 7200)
+    cache.put("bb" * 32, "pdf", b"new")
+    # A render abandoned by a crash long ago.
+    stale_tmp = tmp_path / "cc" / "abandoned.tmp"
+    stale_tmp.parent.mkdir()
+    stale_tmp.write_bytes(b"partial")
+    age(str(stale_tmp), 7200)
+
+    assert cache.prune() == len(b"old") + len(b"partial")
+    assert cache.get("aa" * 32, "pdf") is None
+    assert cache.get("bb" * 32, "pdf")
+    assert not stale_tmp.exists()
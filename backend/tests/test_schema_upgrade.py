@@ -0,0 +1,36 @@
+"""Databases created by an earlier release are upgraded at startup."""
+from sqlalchemy import create_engine, inspect, text
+
+from app.core.database import upgrade_schema
+
+
+def test_upgrade_adds_profile_version(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/old.db")
+    with engine.begin() as connection:
+        # profiles as the first release created it
+        connection.execute(text(
+            "CREATE TABLE profiles (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, first_name VARCHAR)"
+        ))
+        connection.execute(text("INSERT INTO profiles (user_id, first_name) VALUES (1, 'Ana')"))
+
+    upgrade_schema(engine)
+    upgrade_schema(engine)  # a second start finds nothing to do
+
+    assert "version" in {column["name"] for column in inspect(engine).get_columns("profiles")}
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT version FROM profiles")).scalar_one() == 1
+
+
+def test_upgrade_adds_section_indexes(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/old.db")
+    with engine.begin() as connection:
+        for table in ("education", "experience", "certifications", "projects"):
+            connection.execute(text(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, profile_id INTEGER NOT NULL)"))
+
+    upgrade_schema(engine)
+    upgrade_schema(engine)
+
+    inspector = inspect(engine)
+    for table in ("education", "experience", "certifications", "projects"):
+        indexes = {index["name"]: index["column_names"] for index in inspector.get_indexes(table)}
+        assert indexes == {f"ix_{table}_profile_id": ["profile_id"]}
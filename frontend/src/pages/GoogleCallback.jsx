@@ -30,15 +30,14 @@ export default function GoogleCallback() {
         setStatus('authenticating');
 
         // Handle the callback
-        const credentials = await handleGoogleCallback(code, state);
+        await handleGoogleCallback(code, state);
 
         setStatus('success');
 
         // If opened in popup, send message to parent
         if (window.opener) {
           window.opener.postMessage({
-            type: 'GOOGLE_AUTH_SUCCESS',
-            credentials: credentials
+            type: 'GOOGLE_AUTH_SUCCESS'
           }, window.location.origin);
 
           // Close popup after a short delay
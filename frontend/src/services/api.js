@@ -61,6 +61,7 @@ export const profileAPI = {
   get: () => api.get('/profile'),
   create: (data) => api.post('/profile', data),
   update: (data) => api.put('/profile', data),
+  patch: (data) => api.patch('/profile', data),
   delete: () => api.delete('/profile'),
 };
 
@@ -69,6 +70,7 @@ export const educationAPI = {
   getAll: () => api.get('/education'),
   create: (data) => api.post('/education', data),
   update: (id, data) => api.put(`/education/${id}`, data),
+  patch: (id, data) => api.patch(`/education/${id}`, data),
   delete: (id) => api.delete(`/education/${id}`),
 };
 
@@ -77,6 +79,7 @@ export const experienceAPI = {
   getAll: () => api.get('/experience'),
   create: (data) => api.post('/experience', data),
   update: (id, data) => api.put(`/experience/${id}`, data),
+  patch: (id, data) => api.patch(`/experience/${id}`, data),
   delete: (id) => api.delete(`/experience/${id}`),
 };
 
@@ -85,6 +88,7 @@ export const certificationsAPI = {
   getAll: () => api.get('/certifications'),
   create: (data) => api.post('/certifications', data),
   update: (id, data) => api.put(`/certifications/${id}`, data),
+  patch: (id, data) => api.patch(`/certifications/${id}`, data),
   delete: (id) => api.delete(`/certifications/${id}`),
 };
 
@@ -93,6 +97,7 @@ export const projectsAPI = {
   getAll: () => api.get('/projects'),
   create: (data) => api.post('/projects', data),
   update: (id, data) => api.put(`/projects/${id}`, data),
+  patch: (id, data) => api.patch(`/projects/${id}`, data),
   delete: (id) => api.delete(`/projects/${id}`),
 };
 
@@ -101,12 +106,18 @@ export const skillsAPI = {
   get: () => api.get('/skills'),
   create: (data) => api.post('/skills', data),
   update: (data) => api.put('/skills', data),
+  patch: (data) => api.patch('/skills', data),
   delete: () => api.delete('/skills'),
 };
 
 // CV Data API
 export const cvAPI = {
   getData: () => api.get('/cv/data'),
+  replaceData: (data, etag) =>
+    api.put('/cv/data', data, { headers: etag ? { 'If-Match': etag } : {} }),
+  exportPdf: () => api.get('/cv/export/pdf', { responseType: 'blob' }),
+  // format: 'docx' | 'markdown' | 'txt' | 'html'
+  exportFile: (format) => api.get(`/cv/export/${format}`, { responseType: 'blob' }),
 };
 
 export default api;
@@ -4,33 +4,18 @@
 import api from './api';
 
 /**
- * Store Google credentials in session storage
+ * Check whether the user has connected a Google account
  */
-export const storeGoogleCredentials = (credentials) => {
-  sessionStorage.setItem('google_credentials', JSON.stringify(credentials));
+export const getGoogleAuthStatus = async () => {
+  const response = await api.get('/auth/google/status');
+  return response.data.connected;
 };
 
 /**
- * Get stored Google credentials
+ * Forget the user's Google account
  */
-export const getGoogleCredentials = () => {
-  const credentials = sessionStorage.getItem('google_credentials');
-  return credentials ? JSON.parse(credentials) : null;
-};
-
-/**
- * Clear stored Google credentials
- */
-export const clearGoogleCredentials = () => {
-  sessionStorage.removeItem('google_credentials');
-};
-
-/**
- * Check if user has authorized Google Docs access
- */
-export const hasGoogleAuth = () => {
-  const credentials = getGoogleCredentials();
-  return credentials && credentials.token;
+export const disconnectGoogle = async () => {
+  await api.delete('/auth/google');
 };
 
 /**
@@ -51,12 +36,12 @@ export const getGoogleAuthUrl = async () => {
  */
 export const handleGoogleCallback = async (code, state) => {
   try {
+    // The backend stores the tokens; they never reach the browser
     const response = await api.get(`/auth/google/callback?code=${code}&state=${state}`);
-    if (response.data.success && response.data.credentials) {
-      storeGoogleCredentials(response.data.credentials);
-      return response.data.credentials;
+    if (response.data.success) {
+      return true;
     }
-    throw new Error('Failed to get credentials from callback');
+    throw new Error('Failed to connect Google account');
   } catch (error) {
     console.error('Error handling Google callback:', error);
     throw error;
@@ -86,13 +71,12 @@ export const initiateGoogleAuth = () => {
       );
 
       // Poll for popup closure or message
-      const checkPopup = setInterval(() => {
+      const checkPopup = setInterval(async () => {
         if (!popup || popup.closed) {
           clearInterval(checkPopup);
-          // Check if credentials were stored
-          const credentials = getGoogleCredentials();
-          if (credentials) {
-            resolve(credentials);
+          // Check if the account was connected
+          if (await getGoogleAuthStatus().catch(() => false)) {
+            resolve(true);
           } else {
             reject(new Error('Authentication cancelled or failed'));
           }
@@ -109,8 +93,7 @@ export const initiateGoogleAuth = () => {
           window.removeEventListener('message', messageHandler);
           if (popup) popup.close();
 
-          storeGoogleCredentials(event.data.credentials);
-          resolve(event.data.credentials);
+          resolve(true);
         } else if (event.data.type === 'GOOGLE_AUTH_ERROR') {
           clearInterval(checkPopup);
           window.removeEventListener('message', messageHandler);
@@ -139,27 +122,45 @@ export const initiateGoogleAuth = () => {
 };
 
 /**
- * Export CV to Google Docs
+ * Wait for a background export job to finish
  */
-export const exportToGoogleDocs = async () => {
-  try {
-    // Check if we have credentials
-    let credentials = getGoogleCredentials();
-
-    // If no credentials, initiate auth flow
-    if (!credentials) {
-      credentials = await initiateGoogleAuth();
+const waitForExportJob = async (job, { interval = 1000, timeout = 2 * 60 * 1000 } = {}) => {
+  const deadline = Date.now() + timeout;
+  while (job.status === 'queued' || job.status === 'running') {
+    if (Date.now() > deadline) {
+      throw new Error('Google Docs export is taking too long. Please try again.');
     }
+    await new Promise((resolve) => setTimeout(resolve, interval));
+    const response = await api.get(`/export/jobs/${job.id}`);
+    job = response.data;
+  }
+  if (job.status === 'failed') {
+    throw new Error(job.error || 'Failed to export to Google Docs');
+  }
+  return job;
+};
 
-    // Export to Google Docs
-    const response = await api.post('/export/google-docs', credentials);
-    return response.data;
-  } catch (error) {
-    // If auth error, clear credentials and try again
-    if (error.response?.status === 401 || error.response?.status === 403) {
-      clearGoogleCredentials();
-      throw new Error('Google authentication expired. Please try again.');
+/**
+ * Export CV to Google Docs
+ */
+export const exportToGoogleDocs = async () => {
+  const queueExport = async () => {
+    try {
+      return await api.post('/export/google-docs');
+    } catch (error) {
+      // 403: no Google account connected, or access was revoked
+      if (error.response?.status !== 403) throw error;
+      await initiateGoogleAuth();
+      return api.post('/export/google-docs');
     }
-    throw error;
-  }
+  };
+
+  // Queue the export and poll until the document is ready
+  const response = await queueExport();
+  const job = await waitForExportJob(response.data);
+  return {
+    success: true,
+    document_id: job.document_id,
+    document_url: job.document_url,
+  };
 };